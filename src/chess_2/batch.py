@@ -0,0 +1,178 @@
+"""
+Legal move generation over many independent positions.
+
+Positions are parsed and searched in worker processes, in chunks, so large
+sets (puzzle collections, positions from imported games) use every core.
+Results stream back in input order while later chunks are still running,
+and only a bounded number of chunks are in flight at once, so arbitrarily
+long inputs can be streamed. A malformed position does not stop the stream:
+it yields a PositionError in its place and the remaining positions continue.
+
+Usage:
+    python -m chess_2.batch positions.fen --workers 4
+    cat positions.fen | python -m chess_2.batch --workers 4 --print
+"""
+import argparse
+import itertools
+import os
+import sys
+import time
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+
+from chess_2.utils.types import Move, encode_move, decode_move
+from chess_2.piece_movement.move_generator import get_legal_move_list
+from chess_2.bitboard import move_generator as bitboard
+from chess_2.board.backends import BACKENDS, load_position
+from chess_2.utils.fen import move_to_str
+
+DEFAULT_CHUNKSIZE = 64
+
+# Chunks kept in flight per worker, so workers never wait for the consumer to ask for more
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+
+@dataclass(slots=True)
+class PositionError:
+    """
+    A position whose legal moves could not be generated.
+
+    Attributes:
+        fen (str): The FEN string as given.
+        message (str): Why the position was rejected.
+    """
+    fen: str
+    message: str
+
+
+def legal_moves_for_fen(fen: str, backend: str = "dict") -> list[Move]:
+    """
+    Parse a FEN string and generate the legal moves for the side to move.
+
+    Args:
+        fen (str): The FEN string of the position.
+        backend (str): The board representation to use, one of BACKENDS.
+
+    Returns:
+        list[Move]: Every legal move.
+    """
+    board_state = load_position(fen, backend)
+    if backend == "bitboard":
+        return bitboard.get_legal_move_list(board_state.player_turn, board_state.piece_pos, board_state.pieces)
+    return get_legal_move_list(board_state.player_turn, board_state.piece_pos, board_state.pieces)
+
+
+def _legal_moves_or_error(fen: str, backend: str) -> list[Move] | PositionError:
+    try:
+        return legal_moves_for_fen(fen, backend)
+    except ValueError as e:
+        return PositionError(fen, str(e))
+
+
+def _legal_moves_for_chunk(fens: list[str], backend: str) -> list[array | PositionError]:
+    # Moves travel back to the parent packed as ints, which pickle far smaller than Move tuples
+    results = []
+    for fen in fens:
+        legal_moves = _legal_moves_or_error(fen, backend)
+        if not isinstance(legal_moves, PositionError):
+            legal_moves = array("H", map(encode_move, legal_moves))
+        results.append(legal_moves)
+    return results
+
+
+def _chunks(fens: Iterable[str], chunksize: int) -> Iterator[list[str]]:
+    fens = iter(fens)
+    while chunk := list(itertools.islice(fens, chunksize)):
+        yield chunk
+
+
+def generate_legal_moves_batch(
+    fens: Iterable[str],
+    workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    backend: str = "dict",
+) -> Iterator[list[Move] | PositionError]:
+    """
+    Generate the legal moves of many positions in parallel, yielding results in input order.
+
+    Args:
+        fens (Iterable[str]): FEN strings; may be a lazy iterator.
+        workers (int | None): Number of worker processes (default: one per CPU). With 1, positions
+            are handled in this process without a pool.
+        chunksize (int): Number of positions sent to a worker at once.
+        backend (str): The board representation to use, one of BACKENDS.
+
+    Yields:
+        list[Move] | PositionError: The legal moves of each position, in the same order as fens,
+            or a PositionError for a position that could not be parsed.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}.")
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for fen in fens:
+            yield _legal_moves_or_error(fen, backend)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future] = deque()
+        chunks = _chunks(fens, chunksize)
+
+        for chunk in itertools.islice(chunks, workers * CHUNKS_IN_FLIGHT_PER_WORKER):
+            pending.append(executor.submit(_legal_moves_for_chunk, chunk, backend))
+
+        while pending:
+            results = pending.popleft().result()
+
+            # Top the queue back up before handing results to the consumer
+            chunk = next(chunks, None)
+            if chunk is not None:
+                pending.append(executor.submit(_legal_moves_for_chunk, chunk, backend))
+
+            for packed in results:
+                yield packed if isinstance(packed, PositionError) else [decode_move(code) for code in packed]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chess_2.batch", description="Generate legal moves for many positions.")
+    parser.add_argument("file", nargs="?", help="file with one FEN per line (default: standard input)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="positions sent to a worker at once")
+    parser.add_argument("--backend", choices=BACKENDS, default="dict", help="board representation to use")
+    parser.add_argument("--print", action="store_true", help="print the legal moves of each position")
+    args = parser.parse_args(argv)
+
+    source = open(args.file) if args.file else sys.stdin
+    with source:
+        fens = (line.strip() for line in source if line.strip())
+
+        start = time.perf_counter()
+        positions = moves = errors = 0
+        for legal_moves in generate_legal_moves_batch(fens, args.workers, args.chunksize, args.backend):
+            positions += 1
+            if isinstance(legal_moves, PositionError):
+                errors += 1
+                print(f"error position {positions}: {legal_moves.message}", file=sys.stderr)
+                if args.print:
+                    print()
+                continue
+            moves += len(legal_moves)
+            if args.print:
+                print(" ".join(move_to_str(move) for move in legal_moves))
+        seconds = time.perf_counter() - start
+
+    rate = positions / seconds if seconds > 0 else float("inf")
+    print(f"positions {positions}  moves {moves}  errors {errors}  time {seconds:.3f}s  positions/s {rate:,.0f}",
+          file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+Precomputed attack tables and sliding piece attacks for 64-bit bitboards.
+
+Squares are numbered 0 (a1) to 63 (h8), rank by rank, so bit `sq` of a
+bitboard is set when the square holds a piece. Knight, king and pawn attacks
+are looked up in tables built at import time. Sliding attacks along files and
+diagonals use hyperbola quintessence (with a byte swap to mirror the board
+vertically); rank attacks use a first-rank lookup table. BETWEEN and LINE
+give the squares between two aligned squares and the line through them, for
+check and pin masks.
+"""
+from chess_2.utils.types import Position
+
+FULL = 0xFFFF_FFFF_FFFF_FFFF
+FILE_A = 0x0101_0101_0101_0101
+FILE_H = FILE_A << 7
+RANK_1 = 0xFF
+RANK_2 = RANK_1 << 8
+RANK_4 = RANK_1 << 24
+RANK_5 = RANK_1 << 32
+RANK_7 = RANK_1 << 48
+RANK_8 = RANK_1 << 56
+
+WHITE, BLACK = 0, 1
+
+
+def square_of(pos: Position) -> int:
+    """
+    Convert a (row, col) board position to a bitboard square index.
+    """
+    return (7 - pos.row) * 8 + pos.col
+
+
+SQUARE_TO_POSITION: list[Position] = [Position(7 - sq // 8, sq % 8) for sq in range(64)]
+
+
+def bswap(bb: int) -> int:
+    """
+    Mirror a bitboard vertically (rank 1 <-> rank 8).
+    """
+    return int.from_bytes(bb.to_bytes(8, "little"), "big")
+
+
+def iter_squares(bb: int):
+    """
+    Yield the index of every set bit, lowest first.
+    """
+    while bb:
+        lsb = bb & -bb
+        yield lsb.bit_length() - 1
+        bb ^= lsb
+
+
+def _step_table(steps: list[tuple[int, int]]) -> list[int]:
+    table = []
+    for sq in range(64):
+        rank, file = divmod(sq, 8)
+        bb = 0
+        for d_rank, d_file in steps:
+            r, f = rank + d_rank, file + d_file
+            if 0 <= r < 8 and 0 <= f < 8:
+                bb |= 1 << (r * 8 + f)
+        table.append(bb)
+    return table
+
+
+KNIGHT_ATTACKS: list[int] = _step_table([(2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1)])
+KING_ATTACKS: list[int] = _step_table([(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)])
+
+# PAWN_ATTACKS[color][sq]: squares attacked by a pawn of that color standing on sq
+PAWN_ATTACKS: tuple[list[int], list[int]] = (
+    _step_table([(1, -1), (1, 1)]),
+    _step_table([(-1, -1), (-1, 1)]),
+)
+
+
+def _line_mask(sq: int, d_rank: int, d_file: int) -> int:
+    """
+    Squares on the line through sq in both directions, excluding sq itself.
+    """
+    rank, file = divmod(sq, 8)
+    bb = 0
+    for sign in (1, -1):
+        r, f = rank + sign * d_rank, file + sign * d_file
+        while 0 <= r < 8 and 0 <= f < 8:
+            bb |= 1 << (r * 8 + f)
+            r, f = r + sign * d_rank, f + sign * d_file
+    return bb
+
+
+FILE_MASKS: list[int] = [_line_mask(sq, 1, 0) for sq in range(64)]
+DIAGONAL_MASKS: list[int] = [_line_mask(sq, 1, 1) for sq in range(64)]
+ANTI_DIAGONAL_MASKS: list[int] = [_line_mask(sq, 1, -1) for sq in range(64)]
+
+
+def _first_rank_attacks() -> list[list[int]]:
+    """
+    FIRST_RANK_ATTACKS[file][occupancy]: attacked files on a single rank, as an 8-bit mask.
+    """
+    table = []
+    for file in range(8):
+        row = []
+        for occupancy in range(256):
+            attacks = 0
+            for step in (1, -1):
+                f = file + step
+                while 0 <= f < 8:
+                    attacks |= 1 << f
+                    if occupancy & (1 << f):
+                        break
+                    f += step
+            row.append(attacks)
+        table.append(row)
+    return table
+
+
+FIRST_RANK_ATTACKS: list[list[int]] = _first_rank_attacks()
+
+SQUARE_BITS: list[int] = [1 << sq for sq in range(64)]
+SWAPPED_SQUARE_BITS: list[int] = [bswap(1 << sq) for sq in range(64)]
+
+
+def _line_attacks(occupied: int, sq: int, mask: int) -> int:
+    # Hyperbola quintessence: o ^ (o - 2s) finds blockers above the slider, and the
+    # byte-swapped version does the same below it.
+    forward = occupied & mask
+    reverse = bswap(forward)
+    forward = (forward - SQUARE_BITS[sq]) & FULL
+    reverse = (reverse - SWAPPED_SQUARE_BITS[sq]) & FULL
+    return (forward ^ bswap(reverse)) & mask
+
+
+def rank_attacks(occupied: int, sq: int) -> int:
+    rank_shift = sq & 56
+    occupancy = (occupied >> rank_shift) & 0xFF
+    return FIRST_RANK_ATTACKS[sq & 7][occupancy] << rank_shift
+
+
+def rook_attacks(occupied: int, sq: int) -> int:
+    """
+    Squares attacked by a rook on sq, given the occupied squares.
+    """
+    return _line_attacks(occupied, sq, FILE_MASKS[sq]) | rank_attacks(occupied, sq)
+
+
+def bishop_attacks(occupied: int, sq: int) -> int:
+    """
+    Squares attacked by a bishop on sq, given the occupied squares.
+    """
+    return _line_attacks(occupied, sq, DIAGONAL_MASKS[sq]) | _line_attacks(occupied, sq, ANTI_DIAGONAL_MASKS[sq])
+
+
+def queen_attacks(occupied: int, sq: int) -> int:
+    """
+    Squares attacked by a queen on sq, given the occupied squares.
+    """
+    return rook_attacks(occupied, sq) | bishop_attacks(occupied, sq)
+
+
+def _between_and_line_tables() -> tuple[list[list[int]], list[list[int]]]:
+    """
+    BETWEEN[a][b]: squares strictly between a and b when they share a rank, file or diagonal.
+    LINE[a][b]: the whole line through a and b, including both. Both are 0 for unaligned squares.
+    """
+    between = [[0] * 64 for _ in range(64)]
+    line = [[0] * 64 for _ in range(64)]
+    for a in range(64):
+        for masks in (FILE_MASKS, DIAGONAL_MASKS, ANTI_DIAGONAL_MASKS):
+            for b in iter_squares(masks[a]):
+                line[a][b] = masks[a] | SQUARE_BITS[a]
+                # Squares a slider on a sees towards b, met by those a slider on b sees towards a
+                between[a][b] = (_line_attacks(SQUARE_BITS[b], a, masks[a])
+                                 & _line_attacks(SQUARE_BITS[a], b, masks[b]))
+        for b in iter_squares((RANK_1 << (a & 56)) ^ SQUARE_BITS[a]):
+            line[a][b] = RANK_1 << (a & 56)
+            between[a][b] = rank_attacks(SQUARE_BITS[b], a) & rank_attacks(SQUARE_BITS[a], b)
+    return between, line
+
+
+BETWEEN, LINE = _between_and_line_tables()
@@ -0,0 +1,324 @@
+from chess_2.utils.enums import Color, PieceType
+from chess_2.utils.types import Position, Move
+from chess_2.utils.fen import index_to_algebraic
+from chess_2.piece.piece import Piece
+from chess_2.board.piece_lists import PieceLists
+from chess_2.board.attack_maps import AttackMaps
+from chess_2.bitboard.attacks import (
+    FULL,
+    FILE_A,
+    FILE_H,
+    RANK_1,
+    RANK_8,
+    WHITE,
+    SQUARE_BITS,
+    KNIGHT_ATTACKS,
+    KING_ATTACKS,
+    PAWN_ATTACKS,
+    BETWEEN,
+    LINE,
+    SQUARE_TO_POSITION,
+    iter_squares,
+    square_of,
+    rook_attacks,
+    bishop_attacks,
+    queen_attacks,
+)
+from chess_2.bitboard.position import (
+    BitboardPosition,
+    PAWN,
+    KNIGHT,
+    BISHOP,
+    ROOK,
+    QUEEN,
+    KING,
+    NORMAL,
+    EN_PASSANT,
+    CASTLE,
+    DOUBLE_PUSH,
+    WHITE_KINGSIDE,
+    WHITE_QUEENSIDE,
+    BLACK_KINGSIDE,
+    BLACK_QUEENSIDE,
+    encode_move,
+)
+
+PROMOTION_LETTERS = {QUEEN: "q", ROOK: "r", BISHOP: "b", KNIGHT: "n"}
+
+RANK_3 = RANK_1 << 16
+RANK_6 = RANK_1 << 40
+PROMOTION_RANKS = RANK_1 | RANK_8
+PROMOTION_PIECES = (QUEEN, ROOK, BISHOP, KNIGHT)
+PROMOTION_PIECE_TYPES = {
+    QUEEN: PieceType.QUEEN, ROOK: PieceType.ROOK, BISHOP: PieceType.BISHOP, KNIGHT: PieceType.KNIGHT
+}
+
+# (right, squares that must be empty, squares the king must not be attacked on, king from, king to)
+CASTLING_MOVES: tuple[list[tuple[int, int, tuple[int, ...], int, int]], ...] = (
+    [
+        (WHITE_KINGSIDE, SQUARE_BITS[5] | SQUARE_BITS[6], (4, 5, 6), 4, 6),
+        (WHITE_QUEENSIDE, SQUARE_BITS[1] | SQUARE_BITS[2] | SQUARE_BITS[3], (4, 3, 2), 4, 2),
+    ],
+    [
+        (BLACK_KINGSIDE, SQUARE_BITS[61] | SQUARE_BITS[62], (60, 61, 62), 60, 62),
+        (BLACK_QUEENSIDE, SQUARE_BITS[57] | SQUARE_BITS[58] | SQUARE_BITS[59], (60, 59, 58), 60, 58),
+    ],
+)
+
+
+def _add_pawn_moves(moves: list[int], targets: int, offset: int, flag: int = NORMAL) -> None:
+    for to_sq in iter_squares(targets):
+        from_sq = to_sq - offset
+        if SQUARE_BITS[to_sq] & PROMOTION_RANKS:
+            for promotion in PROMOTION_PIECES:
+                moves.append(encode_move(from_sq, to_sq, promotion))
+        else:
+            moves.append(encode_move(from_sq, to_sq, 0, flag))
+
+
+def generate_pseudo_legal_moves(position: BitboardPosition) -> list[int]:
+    """
+    Generate every move for the side to move without checking king safety.
+
+    Args:
+        position (BitboardPosition): The position to generate moves for.
+
+    Returns:
+        list[int]: Encoded moves (see encode_move).
+    """
+    us = position.side
+    them = us ^ 1
+    pieces = position.pieces
+    own = position.occupancy[us]
+    enemy = position.occupancy[them]
+    occupied = own | enemy
+    empty = ~occupied & FULL
+    not_own = ~own & FULL
+    base = us * 6
+    moves: list[int] = []
+
+    pawns = pieces[base + PAWN]
+    if us == WHITE:
+        single = (pawns << 8) & empty
+        _add_pawn_moves(moves, single, 8)
+        _add_pawn_moves(moves, ((single & RANK_3) << 8) & empty, 16, DOUBLE_PUSH)
+        _add_pawn_moves(moves, ((pawns & ~FILE_A) << 7) & enemy, 7)
+        _add_pawn_moves(moves, ((pawns & ~FILE_H) << 9) & enemy, 9)
+    else:
+        single = (pawns >> 8) & empty
+        _add_pawn_moves(moves, single, -8)
+        _add_pawn_moves(moves, ((single & RANK_6) >> 8) & empty, -16, DOUBLE_PUSH)
+        _add_pawn_moves(moves, ((pawns & ~FILE_A) >> 9) & enemy, -9)
+        _add_pawn_moves(moves, ((pawns & ~FILE_H) >> 7) & enemy, -7)
+
+    if position.ep_square != -1:
+        for from_sq in iter_squares(PAWN_ATTACKS[them][position.ep_square] & pawns):
+            moves.append(encode_move(from_sq, position.ep_square, 0, EN_PASSANT))
+
+    for from_sq in iter_squares(pieces[base + KNIGHT]):
+        for to_sq in iter_squares(KNIGHT_ATTACKS[from_sq] & not_own):
+            moves.append(from_sq | (to_sq << 6))
+
+    for from_sq in iter_squares(pieces[base + BISHOP]):
+        for to_sq in iter_squares(bishop_attacks(occupied, from_sq) & not_own):
+            moves.append(from_sq | (to_sq << 6))
+
+    for from_sq in iter_squares(pieces[base + ROOK]):
+        for to_sq in iter_squares(rook_attacks(occupied, from_sq) & not_own):
+            moves.append(from_sq | (to_sq << 6))
+
+    for from_sq in iter_squares(pieces[base + QUEEN]):
+        for to_sq in iter_squares(queen_attacks(occupied, from_sq) & not_own):
+            moves.append(from_sq | (to_sq << 6))
+
+    for from_sq in iter_squares(pieces[base + KING]):
+        for to_sq in iter_squares(KING_ATTACKS[from_sq] & not_own):
+            moves.append(from_sq | (to_sq << 6))
+
+    for right, must_be_empty, king_path, king_from, king_to in CASTLING_MOVES[us]:
+        if (position.castling & right and not occupied & must_be_empty
+                and not any(position.is_attacked(sq, them) for sq in king_path)):
+            moves.append(encode_move(king_from, king_to, 0, CASTLE))
+
+    return moves
+
+
+def generate_legal_moves(position: BitboardPosition) -> list[int]:
+    """
+    Generate every legal move for the side to move.
+
+    Pseudo-legal moves are filtered with check and pin masks instead of being made on the
+    board: in check, a move must capture the checker or block its line (only the king moves
+    out of a double check); a pinned piece must stay on the line through its king. King steps
+    are tested with the king lifted off the board, so it cannot retreat along a checking ray.
+    En passant, which can uncover a check along the rank of both pawns, is still made and
+    taken back.
+
+    Args:
+        position (BitboardPosition): The position to generate moves for. It is restored before returning.
+
+    Returns:
+        list[int]: Encoded legal moves (see encode_move).
+    """
+    us = position.side
+    them = us ^ 1
+    pieces = position.pieces
+    base = them * 6
+    king_sq = position.king_square(us)
+    own = position.occupancy[us]
+    enemy = position.occupancy[them]
+    occupied = own | enemy
+    diagonal_sliders = pieces[base + BISHOP] | pieces[base + QUEEN]
+    straight_sliders = pieces[base + ROOK] | pieces[base + QUEEN]
+
+    checkers = ((PAWN_ATTACKS[us][king_sq] & pieces[base + PAWN])
+                | (KNIGHT_ATTACKS[king_sq] & pieces[base + KNIGHT])
+                | (bishop_attacks(occupied, king_sq) & diagonal_sliders)
+                | (rook_attacks(occupied, king_sq) & straight_sliders))
+    if not checkers:
+        check_mask = FULL
+    elif checkers & (checkers - 1):
+        check_mask = 0
+    else:
+        checker_sq = checkers.bit_length() - 1
+        check_mask = checkers | BETWEEN[king_sq][checker_sq]
+
+    # Sliders that would attack the king through exactly one of our pieces pin it
+    pinned = 0
+    snipers = (bishop_attacks(enemy, king_sq) & diagonal_sliders) | (rook_attacks(enemy, king_sq) & straight_sliders)
+    for sniper_sq in iter_squares(snipers):
+        blockers = BETWEEN[king_sq][sniper_sq] & occupied
+        if blockers and not blockers & (blockers - 1):
+            pinned |= blockers & own
+
+    without_king = occupied ^ SQUARE_BITS[king_sq]
+    legal = []
+    for move in generate_pseudo_legal_moves(position):
+        from_sq = move & 63
+        to_bit = SQUARE_BITS[(move >> 6) & 63]
+        if from_sq == king_sq:
+            # Castling already checked every square the king crosses
+            if move >> 15 == CASTLE or not position.is_attacked((move >> 6) & 63, them, without_king):
+                legal.append(move)
+        elif move >> 15 == EN_PASSANT:
+            undo = position.make_move(move)
+            if not position.is_attacked(king_sq, them):
+                legal.append(move)
+            position.unmake_move(move, undo)
+        elif to_bit & check_mask and (not SQUARE_BITS[from_sq] & pinned or to_bit & LINE[king_sq][from_sq]):
+            legal.append(move)
+
+    return legal
+
+
+def perft(position: BitboardPosition, depth: int) -> int:
+    """
+    Count the leaf nodes of the legal move tree, with each promotion piece counted separately.
+
+    Args:
+        position (BitboardPosition): The position to search from. It is restored before returning.
+        depth (int): The number of plies to search.
+
+    Returns:
+        int: The number of leaf nodes at the given depth.
+    """
+    if depth == 0:
+        return 1
+
+    moves = generate_legal_moves(position)
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        undo = position.make_move(move)
+        nodes += perft(position, depth - 1)
+        position.unmake_move(move, undo)
+
+    return nodes
+
+
+def divide(position: BitboardPosition, depth: int) -> dict[str, int]:
+    """
+    Count the leaf nodes below each root move.
+
+    Args:
+        position (BitboardPosition): The position to search from. It is restored before returning.
+        depth (int): The number of plies to search, including the root move.
+
+    Returns:
+        dict[str, int]: Leaf node counts keyed by root move in long algebraic notation (e.g., 'e7e8q').
+    """
+    counts = {}
+    for move in generate_legal_moves(position):
+        undo = position.make_move(move)
+        counts[move_to_str(move)] = perft(position, depth - 1)
+        position.unmake_move(move, undo)
+
+    return counts
+
+
+def move_to_str(move: int) -> str:
+    """
+    Convert an encoded move to long algebraic notation (e.g., 'e2e4', 'e7e8q').
+    """
+    text = index_to_algebraic(SQUARE_TO_POSITION[move & 63]) + index_to_algebraic(SQUARE_TO_POSITION[(move >> 6) & 63])
+    return text + PROMOTION_LETTERS.get((move >> 12) & 7, "")
+
+
+def get_all_valid_moves(color: Color, piece_loc: dict[Position, Piece]) -> list[tuple[Piece, list[Position]]]:
+    """
+    Gets all valid moves for the given color on the current board, using bitboards.
+
+    Same contract as chess_2.piece_movement.move_generator.get_all_valid_moves; a
+    promoting pawn lists its destination square once.
+
+    Args:
+        color (Color): The color of the player to generate moves for.
+        piece_loc (dict[Position, Piece]): The current board state.
+
+    Returns:
+        list of tuples: Each tuple is (piece, [list of valid target Positions])
+    """
+    destinations: dict[int, list[Position]] = {}
+    for move in generate_legal_moves(BitboardPosition.from_piece_loc(piece_loc, color)):
+        if (move >> 12) & 7 in (0, QUEEN):
+            destinations.setdefault(move & 63, []).append(SQUARE_TO_POSITION[(move >> 6) & 63])
+
+    valid_moves = []
+    for pos, piece in piece_loc.items():
+        if piece.color != color or piece.piece_type == PieceType.EMPTY:
+            continue
+
+        moves = destinations.get(square_of(pos))
+        if moves:
+            valid_moves.append((piece, moves))
+
+    return valid_moves
+
+
+def get_legal_move_list(
+    color: Color,
+    piece_loc: dict[Position, Piece],
+    pieces: PieceLists | None = None,
+    attacks: AttackMaps | None = None
+) -> list[Move]:
+    """
+    Gets all valid moves for the given color as a flat list of moves, using bitboards.
+
+    Same contract as chess_2.piece_movement.move_generator.get_legal_move_list.
+
+    Args:
+        color (Color): The color of the player to generate moves for.
+        piece_loc (dict[Position, Piece]): The current board state.
+        pieces (PieceLists | None): The board's piece lists, to read only the occupied squares.
+        attacks (AttackMaps | None): Unused; bitboards compute attacks directly.
+
+    Returns:
+        list[Move]: Every valid (from_pos, to_pos, promotion) move, with one move per promotion piece for a promoting pawn.
+    """
+    return [
+        Move(SQUARE_TO_POSITION[move & 63], SQUARE_TO_POSITION[(move >> 6) & 63],
+             PROMOTION_PIECE_TYPES.get((move >> 12) & 7))
+        for move in generate_legal_moves(BitboardPosition.from_piece_loc(piece_loc, color, pieces))
+    ]
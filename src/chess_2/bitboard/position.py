@@ -0,0 +1,299 @@
+from chess_2.utils.enums import Color, PieceType
+from chess_2.utils.types import Position
+from chess_2.piece.piece import Piece
+from chess_2.board.piece_lists import PieceLists
+from chess_2.bitboard.attacks import (
+    WHITE,
+    BLACK,
+    SQUARE_BITS,
+    KNIGHT_ATTACKS,
+    KING_ATTACKS,
+    PAWN_ATTACKS,
+    square_of,
+    rook_attacks,
+    bishop_attacks,
+)
+
+# Piece indices; a piece's bitboard lives at pieces[color * 6 + index]
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+NO_PIECE = -1
+
+PIECE_TYPE_INDEX: dict[PieceType, int] = {
+    PieceType.PAWN: PAWN,
+    PieceType.KNIGHT: KNIGHT,
+    PieceType.BISHOP: BISHOP,
+    PieceType.ROOK: ROOK,
+    PieceType.QUEEN: QUEEN,
+    PieceType.KING: KING,
+}
+
+COLOR_INDEX: dict[Color, int] = {
+    Color.WHITE: WHITE,
+    Color.BLACK: BLACK,
+}
+
+# Castling right bits
+WHITE_KINGSIDE, WHITE_QUEENSIDE, BLACK_KINGSIDE, BLACK_QUEENSIDE = 1, 2, 4, 8
+
+# Move encoding: from | to << 6 | promotion piece index << 12 | flag << 15
+NORMAL, EN_PASSANT, CASTLE, DOUBLE_PUSH = range(4)
+
+
+def encode_move(from_sq: int, to_sq: int, promotion: int = 0, flag: int = NORMAL) -> int:
+    return from_sq | (to_sq << 6) | (promotion << 12) | (flag << 15)
+
+
+def move_from(move: int) -> int:
+    return move & 63
+
+
+def move_to(move: int) -> int:
+    return (move >> 6) & 63
+
+
+def move_promotion(move: int) -> int:
+    return (move >> 12) & 7
+
+
+def move_flag(move: int) -> int:
+    return move >> 15
+
+
+# Castling rights lost when a piece moves from or to a square (rook and king home squares)
+CASTLING_MASK: list[int] = [15] * 64
+CASTLING_MASK[0] = 15 ^ WHITE_QUEENSIDE      # a1
+CASTLING_MASK[7] = 15 ^ WHITE_KINGSIDE       # h1
+CASTLING_MASK[4] = 15 ^ (WHITE_KINGSIDE | WHITE_QUEENSIDE)  # e1
+CASTLING_MASK[56] = 15 ^ BLACK_QUEENSIDE     # a8
+CASTLING_MASK[63] = 15 ^ BLACK_KINGSIDE      # h8
+CASTLING_MASK[60] = 15 ^ (BLACK_KINGSIDE | BLACK_QUEENSIDE)  # e8
+
+# King destination square -> (rook from, rook to)
+CASTLING_ROOK_SQUARES: dict[int, tuple[int, int]] = {
+    6: (7, 5),     # g1
+    2: (0, 3),     # c1
+    62: (63, 61),  # g8
+    58: (56, 59),  # c8
+}
+
+# (right, king square, rook square) for each castling right, used to read rights from has_moved flags
+CASTLING_HOME_SQUARES: list[tuple[int, int, int]] = [
+    (WHITE_KINGSIDE, 4, 7),
+    (WHITE_QUEENSIDE, 4, 0),
+    (BLACK_KINGSIDE, 60, 63),
+    (BLACK_QUEENSIDE, 60, 56),
+]
+
+
+class BitboardPosition:
+    """
+    A position stored as one 64-bit board per piece type and color.
+
+    Attributes:
+        pieces (list[int]): 12 bitboards indexed by color * 6 + piece index.
+        occupancy (list[int]): Squares occupied by each color.
+        board (list[int]): Piece index (color * 6 + piece) on each square, NO_PIECE if empty.
+        side (int): The color to move (WHITE or BLACK).
+        castling (int): Castling right bits still available.
+        ep_square (int): The square a pawn may capture onto en passant, -1 if none.
+    """
+
+    __slots__ = ("pieces", "occupancy", "board", "side", "castling", "ep_square")
+
+    def __init__(self):
+        self.pieces: list[int] = [0] * 12
+        self.occupancy: list[int] = [0, 0]
+        self.board: list[int] = [NO_PIECE] * 64
+        self.side: int = WHITE
+        self.castling: int = 0
+        self.ep_square: int = -1
+
+    @classmethod
+    def from_piece_loc(
+        cls, piece_loc: dict[Position, Piece], color: Color, pieces: PieceLists | None = None
+    ) -> "BitboardPosition":
+        """
+        Build a bitboard position from a board mapping.
+
+        Castling rights are read from the has_moved flags of kings and rooks on their
+        home squares, and the en passant square from the opponent's en_passantable pawn.
+
+        Args:
+            piece_loc (dict[Position, Piece]): The board state.
+            color (Color): The color to move.
+            pieces (PieceLists | None): The board's piece lists, to read only the occupied squares.
+
+        Returns:
+            BitboardPosition: The equivalent bitboard position.
+        """
+        position = cls()
+        position.side = COLOR_INDEX[color]
+        unmoved = 0
+
+        if pieces is not None:
+            occupied = [(piece.position, piece) for piece in pieces.pieces(Color.WHITE) + pieces.pieces(Color.BLACK)]
+        else:
+            occupied = [
+                (pos, piece) for pos, piece in piece_loc.items()
+                if piece.piece_type != PieceType.EMPTY and piece.color != Color.NONE
+            ]
+
+        for pos, piece in occupied:
+            sq = square_of(pos)
+            color_index = COLOR_INDEX[piece.color]
+            index = color_index * 6 + PIECE_TYPE_INDEX[piece.piece_type]
+            position.pieces[index] |= SQUARE_BITS[sq]
+            position.occupancy[color_index] |= SQUARE_BITS[sq]
+            position.board[sq] = index
+
+            if not piece.has_moved:
+                unmoved |= SQUARE_BITS[sq]
+
+            if piece.en_passantable and piece.piece_type == PieceType.PAWN and color_index != position.side:
+                position.ep_square = sq - 8 if color_index == WHITE else sq + 8
+
+        for right, king_sq, rook_sq in CASTLING_HOME_SQUARES:
+            color_index = WHITE if king_sq < 8 else BLACK
+            if (position.board[king_sq] == color_index * 6 + KING
+                    and position.board[rook_sq] == color_index * 6 + ROOK
+                    and unmoved & SQUARE_BITS[king_sq] and unmoved & SQUARE_BITS[rook_sq]):
+                position.castling |= right
+
+        return position
+
+    def king_square(self, side: int) -> int:
+        return self.pieces[side * 6 + KING].bit_length() - 1
+
+    def is_attacked(self, sq: int, by_side: int, occupied: int | None = None) -> bool:
+        """
+        Check whether any piece of by_side attacks the square.
+
+        Args:
+            sq (int): The square to test.
+            by_side (int): The attacking side.
+            occupied (int | None): Occupancy that blocks sliding attacks (default: every piece on the board).
+                Passing the occupancy without the defending king finds squares the king cannot step back to.
+        """
+        pieces = self.pieces
+        base = by_side * 6
+
+        # A pawn of by_side attacks sq if a pawn of the other color on sq would attack it back
+        if PAWN_ATTACKS[by_side ^ 1][sq] & pieces[base + PAWN]:
+            return True
+        if KNIGHT_ATTACKS[sq] & pieces[base + KNIGHT]:
+            return True
+        if KING_ATTACKS[sq] & pieces[base + KING]:
+            return True
+
+        if occupied is None:
+            occupied = self.occupancy[WHITE] | self.occupancy[BLACK]
+        queens = pieces[base + QUEEN]
+        if bishop_attacks(occupied, sq) & (pieces[base + BISHOP] | queens):
+            return True
+        return bool(rook_attacks(occupied, sq) & (pieces[base + ROOK] | queens))
+
+    def in_check(self, side: int) -> bool:
+        return self.is_attacked(self.king_square(side), side ^ 1)
+
+    def make_move(self, move: int) -> tuple[int, int, int]:
+        """
+        Make a move in place.
+
+        Returns:
+            tuple[int, int, int]: The captured piece index, castling rights and en passant square before the move.
+        """
+        from_sq = move & 63
+        to_sq = (move >> 6) & 63
+        promotion = (move >> 12) & 7
+        flag = move >> 15
+
+        pieces, occupancy, board = self.pieces, self.occupancy, self.board
+        us = self.side
+        them = us ^ 1
+        piece = board[from_sq]
+        captured = board[to_sq]
+        undo = (captured, self.castling, self.ep_square)
+
+        if flag == EN_PASSANT:
+            cap_sq = to_sq - 8 if us == WHITE else to_sq + 8
+            captured = board[cap_sq]
+            undo = (captured, self.castling, self.ep_square)
+            pieces[captured] ^= SQUARE_BITS[cap_sq]
+            occupancy[them] ^= SQUARE_BITS[cap_sq]
+            board[cap_sq] = NO_PIECE
+        elif captured != NO_PIECE:
+            pieces[captured] ^= SQUARE_BITS[to_sq]
+            occupancy[them] ^= SQUARE_BITS[to_sq]
+
+        from_to = SQUARE_BITS[from_sq] | SQUARE_BITS[to_sq]
+        pieces[piece] ^= from_to
+        occupancy[us] ^= from_to
+        board[from_sq] = NO_PIECE
+        board[to_sq] = piece
+
+        if promotion:
+            promoted = us * 6 + promotion
+            pieces[piece] ^= SQUARE_BITS[to_sq]
+            pieces[promoted] |= SQUARE_BITS[to_sq]
+            board[to_sq] = promoted
+
+        elif flag == CASTLE:
+            rook_from, rook_to = CASTLING_ROOK_SQUARES[to_sq]
+            rook = board[rook_from]
+            rook_bits = SQUARE_BITS[rook_from] | SQUARE_BITS[rook_to]
+            pieces[rook] ^= rook_bits
+            occupancy[us] ^= rook_bits
+            board[rook_from] = NO_PIECE
+            board[rook_to] = rook
+
+        self.castling &= CASTLING_MASK[from_sq] & CASTLING_MASK[to_sq]
+        self.ep_square = (from_sq + to_sq) >> 1 if flag == DOUBLE_PUSH else -1
+        self.side = them
+
+        return undo
+
+    def unmake_move(self, move: int, undo: tuple[int, int, int]) -> None:
+        """
+        Take back a move made with make_move.
+        """
+        from_sq = move & 63
+        to_sq = (move >> 6) & 63
+        promotion = (move >> 12) & 7
+        flag = move >> 15
+
+        pieces, occupancy, board = self.pieces, self.occupancy, self.board
+        captured, self.castling, self.ep_square = undo
+        them = self.side
+        us = them ^ 1
+        self.side = us
+
+        piece = board[to_sq]
+        if promotion:
+            pieces[piece] ^= SQUARE_BITS[to_sq]
+            piece = us * 6 + PAWN
+            pieces[piece] |= SQUARE_BITS[to_sq]
+
+        elif flag == CASTLE:
+            rook_from, rook_to = CASTLING_ROOK_SQUARES[to_sq]
+            rook = board[rook_to]
+            rook_bits = SQUARE_BITS[rook_from] | SQUARE_BITS[rook_to]
+            pieces[rook] ^= rook_bits
+            occupancy[us] ^= rook_bits
+            board[rook_to] = NO_PIECE
+            board[rook_from] = rook
+
+        from_to = SQUARE_BITS[from_sq] | SQUARE_BITS[to_sq]
+        pieces[piece] ^= from_to
+        occupancy[us] ^= from_to
+        board[from_sq] = piece
+        board[to_sq] = NO_PIECE
+
+        if flag == EN_PASSANT:
+            cap_sq = to_sq - 8 if us == WHITE else to_sq + 8
+            pieces[captured] |= SQUARE_BITS[cap_sq]
+            occupancy[them] |= SQUARE_BITS[cap_sq]
+            board[cap_sq] = captured
+        elif captured != NO_PIECE:
+            pieces[captured] |= SQUARE_BITS[to_sq]
+            occupancy[them] |= SQUARE_BITS[to_sq]
+            board[to_sq] = captured
@@ -0,0 +1,146 @@
+"""
+Incremental attack maps: how many pieces of each color attack every square.
+
+A square counts as attacked by a piece when the piece could capture there if an
+opposing piece stood on it, so squares holding allied pieces (defended squares)
+are included and a slider's ray stops at, and includes, the first occupied square.
+
+After a move only a few attack sets can change: those of the pieces on the
+squares the move touched, and those of the sliders whose rays reach one of these
+squares (a vacated square lets a ray through, an occupied one cuts it short).
+update recomputes just those, so is_attacked stays a constant-time lookup.
+"""
+from chess_2.utils.enums import Color, PieceType
+from chess_2.utils.types import Position
+from chess_2.piece.piece import Piece
+from chess_2.piece_movement.lookup_tables import (
+    KNIGHT_TARGETS,
+    KING_TARGETS,
+    PAWN_CAPTURES,
+    ROOK_RAYS,
+    BISHOP_RAYS,
+    QUEEN_RAYS,
+)
+
+SLIDER_RAYS: dict[PieceType, dict[Position, tuple[tuple[Position, ...], ...]]] = {
+    PieceType.ROOK: ROOK_RAYS,
+    PieceType.BISHOP: BISHOP_RAYS,
+    PieceType.QUEEN: QUEEN_RAYS,
+}
+
+
+def _square_index(pos: Position) -> int:
+    return pos.row * 8 + pos.col
+
+
+def get_attacked_squares(piece: Piece, piece_loc: dict[Position, Piece]) -> tuple[Position, ...]:
+    """
+    Get the squares a piece attacks from its current position.
+
+    Args:
+        piece (Piece): The attacking piece.
+        piece_loc (dict[Position, Piece]): The current board state.
+
+    Returns:
+        tuple[Position, ...]: The attacked squares, including those holding allied pieces.
+    """
+    pos = piece.position
+    match piece.piece_type:
+        case PieceType.PAWN:
+            return PAWN_CAPTURES[piece.color][pos]
+        case PieceType.KNIGHT:
+            return KNIGHT_TARGETS[pos]
+        case PieceType.KING:
+            return KING_TARGETS[pos]
+        case PieceType.ROOK | PieceType.BISHOP | PieceType.QUEEN:
+            targets = []
+            for ray in SLIDER_RAYS[piece.piece_type][pos]:
+                for target in ray:
+                    targets.append(target)
+                    occupant = piece_loc.get(target)
+                    if occupant is not None and occupant.piece_type != PieceType.EMPTY:
+                        break
+            return tuple(targets)
+        case _:
+            return ()
+
+
+class AttackMaps:
+    """
+    Per-color attack counts for every square, kept up to date move by move.
+
+    Attributes:
+        counts (dict[Color, list[int]]): The number of attackers of each color on each square,
+            indexed by row * 8 + col.
+
+    Args:
+        piece_loc (dict[Position, Piece]): The board to compute the initial maps from.
+    """
+
+    __slots__ = ("counts", "_attacks", "_sliders")
+
+    def __init__(self, piece_loc: dict[Position, Piece]):
+        self.counts: dict[Color, list[int]] = {Color.WHITE: [0] * 64, Color.BLACK: [0] * 64}
+        # Square of each tracked piece -> (piece, attacked square indices, bitmask of them)
+        self._attacks: dict[Position, tuple[Piece, tuple[int, ...], int]] = {}
+        self._sliders: set[Position] = set()
+
+        for pos, piece in piece_loc.items():
+            self._add(pos, piece, piece_loc)
+
+    def is_attacked(self, pos: Position, by_color: Color) -> bool:
+        """
+        Check whether any piece of by_color attacks the square.
+        """
+        return self.counts[by_color][pos.row * 8 + pos.col] > 0
+
+    def attack_count(self, pos: Position, by_color: Color) -> int:
+        """
+        Get the number of pieces of by_color attacking the square.
+        """
+        return self.counts[by_color][pos.row * 8 + pos.col]
+
+    def update(self, piece_loc: dict[Position, Piece], squares: tuple[Position, ...]) -> None:
+        """
+        Bring the maps up to date after the contents of some squares changed.
+
+        Args:
+            piece_loc (dict[Position, Piece]): The board, after the change.
+            squares (tuple[Position, ...]): Every square whose occupant changed.
+        """
+        changed = 0
+        for pos in squares:
+            changed |= 1 << _square_index(pos)
+
+        stale = {pos for pos in squares if pos in self._attacks}
+        stale.update(pos for pos in self._sliders if self._attacks[pos][2] & changed)
+
+        for pos in stale:
+            self._remove(pos)
+
+        for pos in stale.union(squares):
+            piece = piece_loc.get(pos)
+            if piece is not None:
+                self._add(pos, piece, piece_loc)
+
+    def _add(self, pos: Position, piece: Piece, piece_loc: dict[Position, Piece]) -> None:
+        if piece.piece_type == PieceType.EMPTY or piece.color == Color.NONE:
+            return
+
+        indices = tuple(_square_index(target) for target in get_attacked_squares(piece, piece_loc))
+        mask = 0
+        counts = self.counts[piece.color]
+        for index in indices:
+            counts[index] += 1
+            mask |= 1 << index
+
+        self._attacks[pos] = (piece, indices, mask)
+        if piece.piece_type in SLIDER_RAYS:
+            self._sliders.add(pos)
+
+    def _remove(self, pos: Position) -> None:
+        piece, indices, _ = self._attacks.pop(pos)
+        counts = self.counts[piece.color]
+        for index in indices:
+            counts[index] -= 1
+        self._sliders.discard(pos)
@@ -0,0 +1,33 @@
+"""
+Board representations that the command line tools can run on, and loading a position into one.
+"""
+from chess_2.board.board_state import BoardState
+
+# "dict" and "mailbox" walk the tree with BoardState over the chosen board representation,
+# "bitboard" converts the position once and walks it entirely in bitboards.
+BACKENDS = ("dict", "mailbox", "bitboard")
+
+
+def load_position(fen: str, backend: str = "dict", attack_maps: bool = False) -> BoardState:
+    """
+    Build a board state from a FEN string.
+
+    Castling rights and the en passant square are read from the FEN when present;
+    a FEN with only the placement field implies castling rights from kings and rooks
+    standing on their starting squares.
+
+    Args:
+        fen (str): The FEN string of the position.
+        backend (str): The board representation to use, one of BACKENDS.
+        attack_maps (bool): Keep incremental attack maps on the board state (dict and mailbox backends).
+
+    Returns:
+        BoardState: The board state for the position.
+
+    Raises:
+        ValueError: If the backend is unknown or the FEN is malformed.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}.")
+
+    return BoardState.from_fen(fen, mailbox=backend == "mailbox", attack_maps=attack_maps)
@@ -1,19 +1,184 @@
 
-from chess_2.utils.enums import Color, PieceType
-from chess_2.utils.types import Position
-from chess_2.utils.fen import algebraic_to_index
+from array import array
+from collections.abc import Callable
 
-from chess_2.piece.piece import Piece
-from chess_2.piece_movement.move_generator import is_king_in_checkmate
+from chess_2.utils.enums import Color, PieceType, GameStatus
+from chess_2.utils.types import Position, Move
+from chess_2.utils.fen import algebraic_to_index, parse_full_fen, to_fen
+
+from chess_2.piece.piece import Piece, empty_square
+from chess_2.piece_movement.move_generator import (
+    get_legal_captures,
+    get_legal_move_list,
+    has_valid_moves,
+    is_king_in_check,
+    is_square_under_attack,
+)
+from chess_2.board.move_execution import (
+    EN_PASSANT_SQUARES,
+    UndoInfo,
+    get_castling_rook_move,
+    get_en_passant_capture_square,
+    is_promotion,
+    make_move,
+    unmake_move,
+)
+from chess_2.board.piece_lists import PieceLists
+from chess_2.board.attack_maps import AttackMaps
+from chess_2.board.transposition_table import TTEntry, TranspositionTable
+from chess_2.board.game_status import FIFTY_MOVE_HALFMOVES, PositionStatus, has_insufficient_material
+from chess_2.engine.evaluation import PieceSquareScore
+from chess_2.utils.zobrist import SIDE_TO_MOVE_KEY, compute_zobrist_key, piece_square_key, state_key
 
 class BoardState:
+    """
+    The board, the player to move, the move clocks, the position's Zobrist key, its piece lists,
+    its material and piece-square scores and, optionally, its attack maps.
+
+    Change the board through set_piece_location, move_piece or make_move so the key,
+    piece lists, scores and attack maps stay in step with it; after writing to piece_pos directly, call rehash.
 
-    def __init__(self):
-        self.piece_pos: dict[Position, Piece] = {}
-        self.player_turn = Color.WHITE # default
+    Args:
+        piece_pos (dict[Position, Piece] | None): The initial board.
+        transposition_table (TranspositionTable | None): Cache of legal moves and status per position.
+            Several boards may share one table.
+        move_list_generator (Callable): Generates the legal move list for a color on a board,
+            given the board's piece lists and attack maps (None unless attack_maps is set).
+        attack_maps (bool): Keep per-color attack counts for every square, updated incrementally by each move.
+    """
+
+    def __init__(
+        self,
+        piece_pos: dict[Position, Piece] | None = None,
+        transposition_table: TranspositionTable | None = None,
+        move_list_generator: Callable[
+            [Color, dict[Position, Piece], PieceLists, AttackMaps | None], list[Move]
+        ] = get_legal_move_list,
+        attack_maps: bool = False,
+    ):
+        self._player_turn = Color.WHITE # default
+        self.track_attacks = attack_maps
+        self.piece_pos: dict[Position, Piece] = piece_pos if piece_pos is not None else {}
+        self.transposition_table = transposition_table if transposition_table is not None else TranspositionTable()
+        self.move_list_generator = move_list_generator
         self.is_in_checkmate = False
         self.move_history:list[str] = []
-        
+        self.halfmove_clock = 0  # Half moves since the last capture or pawn move
+        self.fullmove_number = 1  # Incremented after each black move
+
+    @classmethod
+    def from_fen(cls, fen: str, mailbox: bool = False, **kwargs) -> "BoardState":
+        """
+        Build a board state from all six fields of a FEN string.
+
+        Args:
+            fen (str): The FEN string of the position.
+            mailbox (bool): Store the board in a MailboxBoard array instead of a dict.
+            **kwargs: Passed on to the BoardState constructor.
+
+        Returns:
+            BoardState: The board state for the position.
+        """
+        piece_pos, player_turn, halfmove_clock, fullmove_number = parse_full_fen(fen, mailbox=mailbox)
+
+        board_state = cls(piece_pos, **kwargs)
+        board_state.player_turn = player_turn
+        board_state.halfmove_clock = halfmove_clock
+        board_state.fullmove_number = fullmove_number
+        return board_state
+
+    def to_fen(self) -> str:
+        """
+        Serialize the position as a six-field FEN string.
+        """
+        return to_fen(self.piece_pos, self.player_turn, self.halfmove_clock, self.fullmove_number)
+
+    @property
+    def piece_pos(self) -> dict[Position, Piece]:
+        return self._piece_pos
+
+    @piece_pos.setter
+    def piece_pos(self, piece_pos: dict[Position, Piece]) -> None:
+        """
+        Replace the whole board, recomputing the Zobrist key and piece lists from scratch.
+        """
+        self._piece_pos = piece_pos
+        self.zobrist_key: int = compute_zobrist_key(piece_pos, self._player_turn)
+        self._pieces: PieceLists | None = None
+        self._attacks: AttackMaps | None = None
+        self._scores: PieceSquareScore | None = None
+        self._status: PositionStatus | None = None
+        # Key of the position before each move, for repetition checks; packed 8 bytes per move
+        self.position_keys: array = array("Q")
+
+    @property
+    def pieces(self) -> PieceLists:
+        """
+        The live pieces by color and type, built from the board on first use and then kept up to date by every move.
+        """
+        if self._pieces is None:
+            self._pieces = PieceLists(self._piece_pos)
+        return self._pieces
+
+    @property
+    def attacks(self) -> AttackMaps | None:
+        """
+        The attack maps if track_attacks is set, built from the board on first use and then updated by every move.
+        """
+        if self._attacks is None and self.track_attacks:
+            self._attacks = AttackMaps(self._piece_pos)
+        return self._attacks
+
+    @property
+    def scores(self) -> PieceSquareScore:
+        """
+        The material and piece-square scores, built from the board on first use and then updated by every move.
+        """
+        if self._scores is None:
+            self._scores = PieceSquareScore(self._piece_pos)
+        return self._scores
+
+    def _update_attacks(self, squares: tuple[Position, ...]) -> None:
+        """
+        Update the attack maps, if they have been built, for a change to the given squares.
+        """
+        if self._attacks is not None:
+            self._attacks.update(self._piece_pos, squares)
+
+    @property
+    def player_turn(self) -> Color:
+        return self._player_turn
+
+    @player_turn.setter
+    def player_turn(self, color: Color) -> None:
+        if (color == Color.BLACK) != (self._player_turn == Color.BLACK):
+            self.zobrist_key ^= SIDE_TO_MOVE_KEY
+            self._status = None
+        self._player_turn = color
+
+    def rehash(self) -> int:
+        """
+        Recompute the Zobrist key and piece lists from scratch, after the board was changed directly.
+        """
+        self.zobrist_key = compute_zobrist_key(self.piece_pos, self._player_turn)
+        self._pieces = None
+        self._attacks = None
+        self._scores = None
+        self._status = None
+        return self.zobrist_key
+
+    def _advance_clocks(self, piece: Piece, captured: Piece | None) -> None:
+        """
+        Update the move clocks for a move by piece that took captured (empty or None for no capture).
+        """
+        if piece.piece_type == PieceType.PAWN or (captured is not None and captured.piece_type != PieceType.EMPTY):
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
+
+        if piece.color == Color.BLACK:
+            self.fullmove_number += 1
+
     def switch_player_turn(self)->None:
         """
         Switches player turn
@@ -33,22 +198,69 @@ class BoardState:
             dict[Position, Piece]: The updated board state.
 
         """
-        self.piece_pos[position] = piece
+        # Placing a piece can change castling rights, so the state component is recomputed around it
+        self.zobrist_key ^= state_key(self.piece_pos)
+        self._place_piece(position, piece)
+        self.zobrist_key ^= state_key(self.piece_pos)
+        self._update_attacks((position,))
         return self.piece_pos  # Returning the updated board state for testability
 
-    def move_piece(self, piece: Piece, to_pos: Position) -> None:
+    def _place_piece(self, position: Position, piece: Piece) -> None:
+        """
+        Place a piece, updating the piece-square part of the Zobrist key, the piece lists and the scores.
+
+        The piece that was on the square leaves the piece lists only if it still stands
+        there; a piece that has already been placed on its destination stays tracked.
+        """
+        scores = self._scores
+        old_piece = self.piece_pos.get(position)
+        if old_piece is not None:
+            self.zobrist_key ^= piece_square_key(old_piece, position)
+            if old_piece is not piece and old_piece.position == position:
+                self.pieces.remove(old_piece)
+            if scores is not None:
+                scores.remove(old_piece, position)
+        self.zobrist_key ^= piece_square_key(piece, position)
+        self.pieces.add(piece)
+        if scores is not None:
+            scores.add(piece, position)
+        self.piece_pos[position] = piece
+        self._status = None
+
+    def move_piece(self, piece: Piece, to_pos: Position, promotion: PieceType | None = None) -> None:
         """
-        Sets the piece at a given board position.
+        Sets the piece at a given board position, carrying out castling, en passant and promotion.
+
+        The piece is marked has_moved, a pawn advancing two squares is marked en_passantable
+        and the opponent's pawns lose their en passant rights, as they only last for one turn.
 
         Args:
             piece (Piece): The piece to move.
             to_pos (Position): The destination position of the piece.
+            promotion (PieceType | None): The piece a pawn reaching the last rank promotes to (default: a queen).
 
         Returns:
             dict[Position, Piece]: The updated board state.
+
+        Raises:
+            ValueError: If the piece is an empty square. The board is left unchanged.
         """
+        if piece.piece_type == PieceType.EMPTY:
+            raise ValueError(f"No piece to move on {piece.position}")
+
         # Get the original position from the piece's current position
         original_pos = piece.position
+        piece_loc = self.piece_pos
+        self.position_keys.append(self.zobrist_key)
+        self.zobrist_key ^= state_key(piece_loc)
+        self._advance_clocks(piece, piece_loc.get(to_pos))
+
+        en_passant_square = get_en_passant_capture_square(piece, to_pos, piece_loc)
+        opp_color = Color.BLACK if piece.color == Color.WHITE else Color.WHITE
+        for square in EN_PASSANT_SQUARES[opp_color]:
+            pawn = piece_loc.get(square)
+            if pawn is not None and pawn.en_passantable:
+                pawn.en_passantable = False
 
         # Detect castling
         if piece.piece_type == PieceType.KING and abs(to_pos.col - original_pos.col) == 2:
@@ -61,33 +273,294 @@ class BoardState:
             elif to_pos == algebraic_to_index("c8"):  # Black queenside
                 self._castle_rook(original_pos, Position(0, 0), Position(0, 3))
 
-        # Move the piece by setting the original position to empty and placing the piece at the new position
-        self.set_piece_location(position=original_pos, piece=Piece(position=original_pos, color=Color.NONE, piece_type=PieceType.EMPTY))
+        changed = [original_pos, to_pos]
+        if en_passant_square is not None:
+            self._place_piece(en_passant_square, empty_square(en_passant_square))
+            changed.append(en_passant_square)
 
-        # Update the piece's position to reflect the move
+        if is_promotion(piece, to_pos):
+            # The pawn keeps its square, so emptying that square below takes it off the piece lists
+            placed = Piece(to_pos, piece.color, promotion or PieceType.QUEEN, has_moved=True)
+        else:
+            placed = piece
+            piece.position = to_pos
+            piece.has_moved = True
+            piece.en_passantable = piece.piece_type == PieceType.PAWN and abs(to_pos.row - original_pos.row) == 2
 
-        piece.position = to_pos
-        self.set_piece_location(position=to_pos, piece=piece)
+        # Place the piece at the new position (capturing whatever stood there), then empty the original position
+        self._place_piece(to_pos, placed)
+        self._place_piece(original_pos, empty_square(original_pos))
 
+        self.zobrist_key ^= state_key(piece_loc)
+
+        rook_move = get_castling_rook_move(piece, Move(original_pos, to_pos))
+        if rook_move is not None:
+            changed += (rook_move.from_pos, rook_move.to_pos)
+        self._update_attacks(tuple(changed))
         return self.piece_pos
     
     def _castle_rook(self, king_pos: Position, rook_from: Position, rook_to: Position) -> None:
         rook = self.piece_pos[rook_from]
-        self.piece_pos[rook_from] = Piece(rook_from, Color.NONE, PieceType.EMPTY)
-
         rook.position = rook_to
         rook.has_moved = True
-        self.piece_pos[rook_to] = rook
+        self._place_piece(rook_to, rook)
+        self._place_piece(rook_from, empty_square(rook_from))
 
+    def make_move(self, move: Move) -> UndoInfo:
+        """
+        Make a move in place and hand the turn to the other player.
 
-    def check_if_current_player_is_in_checkmate(self) -> bool:
-        king = next(
-        p for p in self.piece_pos.values()
-        if p.color == self.player_turn and p.piece_type == PieceType.KING
-    )
+        Args:
+            move (Move): The move to make.
 
-        if is_king_in_checkmate(king, self.piece_pos):
-            self.is_in_checkmate=True
+        Returns:
+            UndoInfo: The information required by unmake_move to take the move back.
+        """
+        piece_loc = self.piece_pos
+        key = self.zobrist_key ^ state_key(piece_loc)
+
+        undo = make_move(piece_loc, move)
+        undo.zobrist_key = self.zobrist_key
+        self.position_keys.append(self.zobrist_key)
+        undo.halfmove_clock = self.halfmove_clock
+        self._advance_clocks(undo.piece, undo.captured)
+
+        piece = undo.piece
+        placed = undo.promoted or piece
+        key ^= piece_square_key(piece, move.from_pos) ^ piece_square_key(placed, move.to_pos)
+        if undo.captured is not None:
+            key ^= piece_square_key(undo.captured, move.to_pos)
+            self.pieces.remove(undo.captured)
+        if undo.en_passant_captured is not None:
+            key ^= piece_square_key(undo.en_passant_captured, undo.en_passant_captured.position)
+            self.pieces.remove(undo.en_passant_captured)
+        if undo.promoted is not None:
+            self.pieces.remove(piece)
+            self.pieces.add(undo.promoted)
+        if undo.rook_move is not None:
+            rook = piece_loc[undo.rook_move.to_pos]
+            key ^= piece_square_key(rook, undo.rook_move.from_pos) ^ piece_square_key(rook, undo.rook_move.to_pos)
 
+        self.zobrist_key = key ^ state_key(piece_loc)
+        self._update_scores(undo, undone=False)
+        self._update_attacks(self._changed_squares(undo))
+        self.switch_player_turn()
+        return undo
 
+    def unmake_move(self, undo: UndoInfo) -> None:
+        """
+        Take back a move made with make_move, restoring the board and player turn exactly.
+
+        Args:
+            undo (UndoInfo): The information returned by make_move.
+        """
+        unmake_move(self.piece_pos, undo)
+        if undo.captured is not None:
+            self.pieces.add(undo.captured)
+        if undo.en_passant_captured is not None:
+            self.pieces.add(undo.en_passant_captured)
+        if undo.promoted is not None:
+            self.pieces.remove(undo.promoted)
+            self.pieces.add(undo.piece)
+        self._update_scores(undo, undone=True)
+        self._update_attacks(self._changed_squares(undo))
+        self.switch_player_turn()
+        self.zobrist_key = undo.zobrist_key
+        self.position_keys.pop()
+        self.halfmove_clock = undo.halfmove_clock
+        if undo.piece.color == Color.BLACK:
+            self.fullmove_number -= 1
+
+    def _update_scores(self, undo: UndoInfo, undone: bool) -> None:
+        """
+        Update the scores, if they have been built, for a move made with make_move or taken back with unmake_move.
+        """
+        scores = self._scores
+        if scores is None:
+            return
+
+        # Taking a move back applies each of its changes in reverse
+        add, remove = (scores.remove, scores.add) if undone else (scores.add, scores.remove)
+        move = undo.move
+
+        if undo.promoted is not None:
+            remove(undo.piece, move.from_pos)
+            add(undo.promoted, move.to_pos)
+        elif undone:
+            scores.move(undo.piece, move.to_pos, move.from_pos)
+        else:
+            scores.move(undo.piece, move.from_pos, move.to_pos)
+
+        if undo.captured is not None:
+            remove(undo.captured, move.to_pos)
+        if undo.en_passant_captured is not None:
+            remove(undo.en_passant_captured, undo.en_passant_captured.position)
+
+        rook_move = undo.rook_move
+        if rook_move is not None:
+            rook = self._piece_pos[rook_move.from_pos if undone else rook_move.to_pos]
+            remove(rook, rook_move.from_pos)
+            add(rook, rook_move.to_pos)
+
+    @staticmethod
+    def _changed_squares(undo: UndoInfo) -> tuple[Position, ...]:
+        """
+        Get the squares whose occupant a move changed.
+        """
+        squares = (undo.move.from_pos, undo.move.to_pos)
+        if undo.rook_move is not None:
+            squares += (undo.rook_move.from_pos, undo.rook_move.to_pos)
+        if undo.en_passant_captured is not None:
+            squares += (undo.en_passant_captured.position,)
+        return squares
+
+    def _probe_position(self) -> TTEntry:
+        """
+        Get the cached results for the current position, computing and storing them on a miss.
+        """
+        entry = self.transposition_table.probe(self.zobrist_key)
+        if entry is not None:
+            return entry
+
+        legal_moves = self.move_list_generator(self.player_turn, self.piece_pos, self.pieces, self.attacks)
+        return self.transposition_table.store(self.zobrist_key, legal_moves, self._compute_in_check())
+
+    def _compute_in_check(self) -> bool:
+        """
+        Check whether the player to move is in check, from the attack maps when they are kept.
+        """
+        king = self.pieces.king(self.player_turn)
+        if king is None:
+            return False
+
+        attacks = self.attacks
+        if attacks is not None:
+            return attacks.is_attacked(king.position, Color.BLACK if king.color == Color.WHITE else Color.WHITE)
+        return is_king_in_check(king, self.piece_pos)
+
+    def get_legal_moves(self) -> list[Move]:
+        """
+        Get every legal move for the player to move.
+
+        Returns:
+            list[Move]: The legal moves, served from the transposition table when the position was seen before.
+        """
+        return self._probe_position().legal_moves
+
+    def get_legal_captures(self) -> list[Move]:
+        """
+        Get the legal captures and promotions of the player to move, without generating quiet moves.
+
+        Returns:
+            list[Move]: The captures (en passant included) and promotions. They are not cached.
+        """
+        return get_legal_captures(self.player_turn, self.piece_pos, self.pieces, self.attacks)
+
+    def is_square_attacked(self, pos: Position, by_color: Color) -> bool:
+        """
+        Check whether any piece of by_color attacks the square, from the attack maps when they are kept.
+        """
+        attacks = self.attacks
+        if attacks is not None:
+            return attacks.is_attacked(pos, by_color)
+        return is_square_under_attack(pos, Color.BLACK if by_color == Color.WHITE else Color.WHITE, self.piece_pos)
+
+    def is_in_check(self) -> bool:
+        """
+        Check whether the player to move is in check.
+
+        Answered from the transposition table when the position is stored, otherwise worked
+        out directly, without generating the legal moves.
+        """
+        entry = self.transposition_table.probe(self.zobrist_key)
+        if entry is not None:
+            return entry.in_check
+        return self._compute_in_check()
+
+    def repetition_count(self) -> int:
+        """
+        Count how many times the current position has occurred, this time included.
+
+        Only positions since the last capture or pawn move can repeat, so at most
+        halfmove_clock keys are scanned, and of those only every other one has the
+        same player to move.
+        """
+        keys = self.position_keys
+        stop = max(len(keys) - self.halfmove_clock, 0)
+        return 1 + sum(1 for index in range(len(keys) - 2, stop - 1, -2) if keys[index] == self.zobrist_key)
+
+    def is_repetition(self) -> bool:
+        """
+        Check whether the current position occurred before, since the last capture or pawn move.
+
+        Like repetition_count, but stops at the first earlier occurrence; the search uses it to
+        score a repeated position as a draw.
+        """
+        keys = self.position_keys
+        key = self.zobrist_key
+        stop = max(len(keys) - self.halfmove_clock, 0)
+        for index in range(len(keys) - 2, stop - 1, -2):
+            if keys[index] == key:
+                return True
+        return False
+
+    def evaluate_status(self, generate_moves: bool = True) -> PositionStatus:
+        """
+        Work out the legal moves, check, checkmate, stalemate and the draw rules in one pass.
+
+        The result is cached until the board or the player to move changes. Legal moves come
+        from the transposition table when the position was seen before.
+
+        Args:
+            generate_moves (bool): Generate every legal move. When False, move generation stops at
+                the first legal move found, and legal_moves in the result is None.
+
+        Returns:
+            PositionStatus: The evaluated status of the position for the player to move.
+        """
+        status = self._status
+        if status is not None and (status.legal_moves is not None or not generate_moves):
+            return status
+
+        legal_moves = None
+        entry = self.transposition_table.probe(self.zobrist_key)
+        if entry is None and (generate_moves or self.move_list_generator is not get_legal_move_list):
+            entry = self._probe_position()  # Only the board scanning generator can stop at the first move
+
+        if entry is not None:
+            in_check = entry.in_check
+            legal_moves = entry.legal_moves if generate_moves else None
+            has_moves = len(entry.packed_moves) > 0
+        else:
+            in_check = self._compute_in_check()
+            has_moves = has_valid_moves(self.player_turn, self.piece_pos, pieces=self.pieces, attacks=self.attacks)
+
+        if not has_moves:
+            game_status = GameStatus.CHECKMATE if in_check else GameStatus.STALEMATE
+        elif has_insufficient_material(self.pieces):
+            game_status = GameStatus.INSUFFICIENT_MATERIAL
+        elif self.halfmove_clock >= FIFTY_MOVE_HALFMOVES:
+            game_status = GameStatus.FIFTY_MOVE_RULE
+        elif self.repetition_count() >= 3:
+            game_status = GameStatus.THREEFOLD_REPETITION
+        else:
+            game_status = GameStatus.CHECK if in_check else GameStatus.ONGOING
+
+        self._status = PositionStatus(game_status, in_check, has_moves, legal_moves)
+        return self._status
+
+    def get_game_status(self) -> GameStatus:
+        """
+        Get the state of the game for the player to move.
+
+        Returns:
+            GameStatus: ONGOING or CHECK while the game goes on, otherwise CHECKMATE, STALEMATE
+                or the draw rule that ended it.
+        """
+        return self.evaluate_status(generate_moves=False).status
+
+    def check_if_current_player_is_in_checkmate(self) -> bool:
+        if self.get_game_status() == GameStatus.CHECKMATE:
+            self.is_in_checkmate=True
 
+        return self.is_in_checkmate
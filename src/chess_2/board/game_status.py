@@ -0,0 +1,74 @@
+"""
+The result of evaluating a position for the player to move: legal moves, check,
+checkmate, stalemate and the draw rules, worked out together in one pass.
+"""
+from dataclasses import dataclass
+
+from chess_2.utils.enums import Color, PieceType, GameStatus
+from chess_2.utils.types import Move
+from chess_2.board.piece_lists import PieceLists
+
+# Statuses that end the game
+GAME_OVER_STATUSES = frozenset({
+    GameStatus.CHECKMATE,
+    GameStatus.STALEMATE,
+    GameStatus.INSUFFICIENT_MATERIAL,
+    GameStatus.FIFTY_MOVE_RULE,
+    GameStatus.THREEFOLD_REPETITION,
+})
+
+DRAW_STATUSES = GAME_OVER_STATUSES - {GameStatus.CHECKMATE}
+
+# Half moves without a capture or pawn move after which the game is drawn
+FIFTY_MOVE_HALFMOVES = 100
+
+
+@dataclass(slots=True)
+class PositionStatus:
+    """
+    Everything evaluate_status works out about the position for the player to move.
+
+    Attributes:
+        status (GameStatus): The state of the game. Checkmate and stalemate take precedence over the draw rules.
+        in_check (bool): Whether the player to move is in check.
+        has_legal_moves (bool): Whether the player to move has a legal move.
+        legal_moves (list[Move] | None): Every legal move, or None if the evaluation stopped at the first one.
+    """
+    status: GameStatus
+    in_check: bool
+    has_legal_moves: bool
+    legal_moves: list[Move] | None = None
+
+    @property
+    def is_game_over(self) -> bool:
+        return self.status in GAME_OVER_STATUSES
+
+    @property
+    def is_draw(self) -> bool:
+        return self.status in DRAW_STATUSES
+
+
+def has_insufficient_material(pieces: PieceLists) -> bool:
+    """
+    Check whether neither side can possibly checkmate: bare kings, a single minor piece,
+    or only bishops that all stand on squares of one color.
+
+    Args:
+        pieces (PieceLists): The board's piece lists.
+
+    Returns:
+        bool: True if the position is a dead draw on material, False otherwise.
+    """
+    minors = []
+    for color in (Color.WHITE, Color.BLACK):
+        for piece_type in (PieceType.PAWN, PieceType.ROOK, PieceType.QUEEN):
+            if pieces.count(color, piece_type):
+                return False
+        minors += pieces.of_type(color, PieceType.KNIGHT) + pieces.of_type(color, PieceType.BISHOP)
+
+    if len(minors) <= 1:
+        return True
+
+    if any(piece.piece_type == PieceType.KNIGHT for piece in minors):
+        return False
+    return len({(piece.position.row + piece.position.col) % 2 for piece in minors}) == 1
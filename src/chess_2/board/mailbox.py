@@ -0,0 +1,256 @@
+"""
+10x12 mailbox board representation.
+
+The board is stored as a flat array of 120 small ints: the 8x8 playing area
+surrounded by a border of OFF_BOARD sentinels (two rows above and below, one
+column left and right). Stepping off the board always lands on a sentinel, so
+move generation needs no bounds checks and a square lookup is a plain list index.
+
+MailboxBoard implements the dict[Position, Piece] mapping interface on top of
+the array, so existing callers keep working unchanged.
+"""
+from collections.abc import MutableMapping
+
+from chess_2.utils.enums import Color, PieceType
+from chess_2.utils.types import Position
+from chess_2.piece.piece import Piece, empty_square
+
+EMPTY = 0
+OFF_BOARD = -1
+BLACK_BIT = 8  # Set on the code of every black piece
+
+PIECE_TYPE_CODES: dict[PieceType, int] = {
+    PieceType.EMPTY: 0,
+    PieceType.PAWN: 1,
+    PieceType.KNIGHT: 2,
+    PieceType.BISHOP: 3,
+    PieceType.ROOK: 4,
+    PieceType.QUEEN: 5,
+    PieceType.KING: 6,
+}
+
+COLOR_BITS: dict[Color, int] = {
+    Color.WHITE: 0,
+    Color.BLACK: BLACK_BIT,
+}
+
+# Mailbox index offsets for a single step in each direction
+ROOK_OFFSETS = (10, -10, 1, -1)
+BISHOP_OFFSETS = (11, 9, -9, -11)
+QUEEN_OFFSETS = ROOK_OFFSETS + (11, -11, 9, -9)
+KING_OFFSETS = ROOK_OFFSETS + BISHOP_OFFSETS
+KNIGHT_OFFSETS = (21, 12, -8, -19, -21, -12, 8, 19)
+
+# Offsets from a square to the pawns of each color that attack it
+WHITE_PAWN_ATTACKER_OFFSETS = (9, 11)
+BLACK_PAWN_ATTACKER_OFFSETS = (-9, -11)
+
+
+def to_mailbox_index(pos: Position) -> int:
+    """
+    Convert a (row, col) board position to its index in the 10x12 array.
+    """
+    row, col = pos
+    return 21 + row * 10 + col
+
+
+# Mailbox indices of the 64 playing squares, in row-major order
+BOARD_INDICES: list[int] = [21 + row * 10 + col for row in range(8) for col in range(8)]
+
+# Position of every mailbox index (None for the sentinel border)
+INDEX_TO_POSITION: list[Position | None] = [None] * 120
+for _row in range(8):
+    for _col in range(8):
+        INDEX_TO_POSITION[21 + _row * 10 + _col] = Position(_row, _col)
+
+
+def encode_piece(piece: Piece) -> int:
+    """
+    Encode a piece as a small int (0 for an empty square).
+
+    Args:
+        piece (Piece): The piece to encode.
+
+    Returns:
+        int: The piece type code, with BLACK_BIT set for black pieces.
+    """
+    if piece.piece_type == PieceType.EMPTY or piece.color == Color.NONE:
+        return EMPTY
+    return PIECE_TYPE_CODES[piece.piece_type] | COLOR_BITS[piece.color]
+
+
+class MailboxBoard(MutableMapping):
+    """
+    A board stored as a 10x12 mailbox array behind the dict[Position, Piece] interface.
+
+    Attributes:
+        codes (list[int]): 120 small ints, one per mailbox square (see encode_piece).
+        pieces (list[Piece | None]): The Piece object on each mailbox square (None on the border).
+    """
+
+    __slots__ = ("codes", "pieces")
+
+    def __init__(self, piece_loc: dict[Position, Piece] | None = None):
+        self.codes: list[int] = [OFF_BOARD] * 120
+        self.pieces: list[Piece | None] = [None] * 120
+
+        for index in BOARD_INDICES:
+            pos = INDEX_TO_POSITION[index]
+            self.codes[index] = EMPTY
+            self.pieces[index] = empty_square(pos)
+
+        if piece_loc is not None:
+            for pos, piece in piece_loc.items():
+                self[pos] = piece
+
+    def __getitem__(self, pos: Position) -> Piece:
+        row, col = pos
+        if not (0 <= row < 8 and 0 <= col < 8):
+            raise KeyError(pos)
+        return self.pieces[21 + row * 10 + col]
+
+    def get(self, pos: Position, default=None) -> Piece | None:
+        row, col = pos
+        if not (0 <= row < 8 and 0 <= col < 8):
+            return default
+        return self.pieces[21 + row * 10 + col]
+
+    def __setitem__(self, pos: Position, piece: Piece) -> None:
+        row, col = pos
+        if not (0 <= row < 8 and 0 <= col < 8):
+            raise KeyError(pos)
+        index = 21 + row * 10 + col
+        self.pieces[index] = piece
+        self.codes[index] = encode_piece(piece)
+
+    def __delitem__(self, pos: Position) -> None:
+        """
+        A mailbox always holds all 64 squares, so deleting a square empties it.
+        """
+        self[pos] = empty_square(pos)
+
+    def __contains__(self, pos) -> bool:
+        try:
+            row, col = pos
+        except (TypeError, ValueError):
+            return False
+        return 0 <= row < 8 and 0 <= col < 8
+
+    def __iter__(self):
+        return (INDEX_TO_POSITION[index] for index in BOARD_INDICES)
+
+    def __len__(self) -> int:
+        return 64
+
+    def values(self) -> list[Piece]:
+        pieces = self.pieces
+        return [pieces[index] for index in BOARD_INDICES]
+
+    def items(self) -> list[tuple[Position, Piece]]:
+        pieces = self.pieces
+        return [(INDEX_TO_POSITION[index], pieces[index]) for index in BOARD_INDICES]
+
+    def to_dict(self) -> dict[Position, Piece]:
+        """
+        Get the board as a plain dict, for callers that need a real dict.
+        """
+        return dict(self.items())
+
+    def is_attacked(self, pos: Position, by_color: Color) -> bool:
+        """
+        Check whether any piece of by_color attacks the square, scanning outward from it.
+
+        Args:
+            pos (Position): The square to check.
+            by_color (Color): The color of the attacking side.
+
+        Returns:
+            bool: True if the square is attacked, False otherwise.
+        """
+        codes = self.codes
+        index = to_mailbox_index(pos)
+        color_bit = COLOR_BITS[by_color]
+
+        # A white pawn attacks diagonally upwards, so it sits one row below the square (and vice versa)
+        pawn = PIECE_TYPE_CODES[PieceType.PAWN] | color_bit
+        pawn_offsets = WHITE_PAWN_ATTACKER_OFFSETS if by_color == Color.WHITE else BLACK_PAWN_ATTACKER_OFFSETS
+        for offset in pawn_offsets:
+            if codes[index + offset] == pawn:
+                return True
+
+        knight = PIECE_TYPE_CODES[PieceType.KNIGHT] | color_bit
+        for offset in KNIGHT_OFFSETS:
+            if codes[index + offset] == knight:
+                return True
+
+        king = PIECE_TYPE_CODES[PieceType.KING] | color_bit
+        for offset in KING_OFFSETS:
+            if codes[index + offset] == king:
+                return True
+
+        queen = PIECE_TYPE_CODES[PieceType.QUEEN] | color_bit
+        for offsets, slider in ((ROOK_OFFSETS, PIECE_TYPE_CODES[PieceType.ROOK] | color_bit),
+                                (BISHOP_OFFSETS, PIECE_TYPE_CODES[PieceType.BISHOP] | color_bit)):
+            for offset in offsets:
+                target = index + offset
+                while codes[target] == EMPTY:
+                    target += offset
+                if codes[target] == slider or codes[target] == queen:
+                    return True
+
+        return False
+
+    def slide_targets(self, pos: Position, offsets: tuple[int, ...], color: Color) -> list[Position]:
+        """
+        Get the squares a sliding piece can reach, stopping at the first occupied square in each direction.
+
+        Args:
+            pos (Position): The position of the sliding piece.
+            offsets (tuple[int, ...]): The mailbox offset of one step in each direction.
+            color (Color): The color of the sliding piece.
+
+        Returns:
+            list[Position]: Reachable empty squares and capturable opposing pieces.
+        """
+        codes = self.codes
+        ally_bit = COLOR_BITS[color]
+        start = to_mailbox_index(pos)
+        targets = []
+
+        for offset in offsets:
+            index = start + offset
+            code = codes[index]
+            while code == EMPTY:
+                targets.append(INDEX_TO_POSITION[index])
+                index += offset
+                code = codes[index]
+
+            if code != OFF_BOARD and code & BLACK_BIT != ally_bit:
+                targets.append(INDEX_TO_POSITION[index])
+
+        return targets
+
+    def step_targets(self, pos: Position, offsets: tuple[int, ...], color: Color) -> list[Position]:
+        """
+        Get the squares a stepping piece (knight or king) can reach in one step.
+
+        Args:
+            pos (Position): The position of the piece.
+            offsets (tuple[int, ...]): The mailbox offset of each step.
+            color (Color): The color of the piece.
+
+        Returns:
+            list[Position]: Reachable empty squares and capturable opposing pieces.
+        """
+        codes = self.codes
+        ally_bit = COLOR_BITS[color]
+        start = to_mailbox_index(pos)
+        targets = []
+
+        for offset in offsets:
+            index = start + offset
+            code = codes[index]
+            if code == EMPTY or (code != OFF_BOARD and code & BLACK_BIT != ally_bit):
+                targets.append(INDEX_TO_POSITION[index])
+
+        return targets
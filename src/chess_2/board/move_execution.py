@@ -0,0 +1,239 @@
+from dataclasses import dataclass, field
+
+from chess_2.utils.enums import Color, PieceType
+from chess_2.utils.types import Position, Move
+from chess_2.piece.piece import Piece, empty_square
+
+# Row on which a pawn of the given color lands after a 2-step advance.
+# These are the only squares that can hold an en_passantable pawn.
+EN_PASSANT_ROW: dict[Color, int] = {
+    Color.WHITE: 4,
+    Color.BLACK: 3,
+}
+
+EN_PASSANT_SQUARES: dict[Color, list[Position]] = {
+    color: [Position(row, col) for col in range(8)]
+    for color, row in EN_PASSANT_ROW.items()
+}
+
+# Row on which a pawn of the given color promotes
+PROMOTION_ROW: dict[Color, int] = {
+    Color.WHITE: 0,
+    Color.BLACK: 7,
+}
+
+# The pieces a pawn may promote to, most valuable first; a move that does not name one promotes to a queen
+PROMOTION_PIECE_TYPES: tuple[PieceType, ...] = (PieceType.QUEEN, PieceType.ROOK, PieceType.BISHOP, PieceType.KNIGHT)
+
+
+def get_en_passant_pawn(piece_loc: dict[Position, Piece]) -> Piece | None:
+    """
+    Get the pawn that may currently be captured en passant, if any.
+    """
+    for squares in EN_PASSANT_SQUARES.values():
+        for square in squares:
+            pawn = piece_loc.get(square)
+            if pawn is not None and pawn.en_passantable:
+                return pawn
+
+    return None
+
+
+def is_promotion(piece: Piece, to_pos: Position) -> bool:
+    """
+    Check whether moving the piece to to_pos promotes it.
+    """
+    return piece.piece_type == PieceType.PAWN and to_pos.row == PROMOTION_ROW[piece.color]
+
+
+def get_en_passant_capture_square(piece: Piece, to_pos: Position, piece_loc: dict[Position, Piece]) -> Position | None:
+    """
+    Get the square of the pawn captured en passant if moving the piece to to_pos is an en passant capture.
+
+    Args:
+        piece (Piece): The piece being moved.
+        to_pos (Position): Its destination.
+        piece_loc (dict[Position, Piece]): The board before the move.
+
+    Returns:
+        Position | None: The captured pawn's square, beside the moving pawn, or None if the move is not en passant.
+    """
+    if piece.piece_type != PieceType.PAWN or to_pos.col == piece.position.col:
+        return None
+
+    target = piece_loc.get(to_pos)
+    if target is not None and target.piece_type != PieceType.EMPTY:
+        return None  # An ordinary capture
+
+    square = Position(piece.position.row, to_pos.col)
+    pawn = piece_loc.get(square)
+    if pawn is None or pawn.piece_type != PieceType.PAWN or pawn.color == piece.color or not pawn.en_passantable:
+        return None
+    return square
+
+
+@dataclass
+class UndoInfo:
+    """
+    Everything needed to take back a move made with make_move.
+
+    Attributes:
+        move (Move): The move that was made.
+        piece (Piece): The piece that was moved.
+        captured (Piece | None): Whatever occupied the destination square (None if the square was missing).
+        had_moved (bool): The moved piece's has_moved flag before the move.
+        was_en_passantable (bool): The moved piece's en_passantable flag before the move.
+        cleared_en_passant (list[Piece]): Opposing pawns whose en_passantable flag was reset by the move.
+        rook_move (Move | None): The rook's move if the move was a castle.
+        rook_had_moved (bool): The castling rook's has_moved flag before the move.
+        rook_displaced (Piece | None): Whatever occupied the castling rook's destination square.
+        en_passant_captured (Piece | None): The pawn captured en passant; its position is the square it was taken on.
+        promoted (Piece | None): The piece a promoting pawn became. The pawn itself is kept in piece.
+        zobrist_key (int | None): The position's Zobrist key before the move, if the caller tracks one.
+        halfmove_clock (int): The halfmove clock before the move, if the caller tracks one.
+    """
+    move: Move
+    piece: Piece
+    captured: Piece | None
+    had_moved: bool
+    was_en_passantable: bool
+    cleared_en_passant: list[Piece] = field(default_factory=list)
+    rook_move: Move | None = None
+    rook_had_moved: bool = False
+    rook_displaced: Piece | None = None
+    en_passant_captured: Piece | None = None
+    promoted: Piece | None = None
+    zobrist_key: int | None = None
+    halfmove_clock: int = 0
+
+
+def get_castling_rook_move(piece: Piece, move: Move) -> Move | None:
+    """
+    Get the rook's move if the given move is a castle.
+
+    Args:
+        piece (Piece): The piece being moved.
+        move (Move): The move being made.
+
+    Returns:
+        Move | None: The rook's move, or None if the move is not a castle.
+    """
+    if piece.piece_type != PieceType.KING or abs(move.to_pos.col - move.from_pos.col) != 2:
+        return None
+
+    row = move.from_pos.row
+    if move.to_pos.col == 6:  # Kingside
+        return Move(Position(row, 7), Position(row, 5))
+    return Move(Position(row, 0), Position(row, 3))  # Queenside
+
+
+def make_move(piece_loc: dict[Position, Piece], move: Move) -> UndoInfo:
+    """
+    Make a move in place on the board.
+
+    The board is mutated directly rather than copied; pass the returned UndoInfo
+    to unmake_move to restore the exact previous state. An en passant capture
+    removes the captured pawn from beside the moving one, and a promoting pawn is
+    replaced by a new piece of type move.promotion (a queen when it is None).
+
+    Args:
+        piece_loc (dict[Position, Piece]): The current board state.
+        move (Move): The move to make.
+
+    Returns:
+        UndoInfo: The information required to take the move back.
+
+    Raises:
+        ValueError: If there is no piece on the move's from square. The board is left unchanged.
+    """
+    from_pos, to_pos, promotion = move
+    piece = piece_loc[from_pos]
+    if piece.piece_type == PieceType.EMPTY:
+        raise ValueError(f"No piece to move on {from_pos}")
+
+    undo = UndoInfo(
+        move=move,
+        piece=piece,
+        captured=piece_loc.get(to_pos),
+        had_moved=piece.has_moved,
+        was_en_passantable=piece.en_passantable,
+    )
+
+    en_passant_square = get_en_passant_capture_square(piece, to_pos, piece_loc)
+    if en_passant_square is not None:
+        undo.en_passant_captured = piece_loc[en_passant_square]
+        piece_loc[en_passant_square] = empty_square(en_passant_square)
+
+    # En passant rights only last for one turn, so the opponent loses them now
+    opp_color = Color.BLACK if piece.color == Color.WHITE else Color.WHITE
+    for square in EN_PASSANT_SQUARES[opp_color]:
+        pawn = piece_loc.get(square)
+        if pawn is not None and pawn.en_passantable:
+            pawn.en_passantable = False
+            undo.cleared_en_passant.append(pawn)
+
+    rook_move = get_castling_rook_move(piece, move)
+    if rook_move is not None:
+        rook = piece_loc[rook_move.from_pos]
+        undo.rook_move = rook_move
+        undo.rook_had_moved = rook.has_moved
+        undo.rook_displaced = piece_loc.get(rook_move.to_pos)
+
+        piece_loc[rook_move.from_pos] = empty_square(rook_move.from_pos)
+        rook.position = rook_move.to_pos
+        rook.has_moved = True
+        piece_loc[rook_move.to_pos] = rook
+
+    piece_loc[from_pos] = empty_square(from_pos)
+
+    if is_promotion(piece, to_pos):
+        # The pawn leaves the board, keeping its square, and a new piece takes its place
+        undo.promoted = Piece(to_pos, piece.color, promotion or PieceType.QUEEN, has_moved=True)
+        piece_loc[to_pos] = undo.promoted
+        return undo
+
+    piece.position = to_pos
+    piece.has_moved = True
+    piece.en_passantable = piece.piece_type == PieceType.PAWN and abs(to_pos.row - from_pos.row) == 2
+    piece_loc[to_pos] = piece
+
+    return undo
+
+
+def unmake_move(piece_loc: dict[Position, Piece], undo: UndoInfo) -> None:
+    """
+    Take back a move made with make_move, restoring the board exactly.
+
+    Args:
+        piece_loc (dict[Position, Piece]): The board the move was made on.
+        undo (UndoInfo): The information returned by make_move.
+    """
+    from_pos, to_pos, _ = undo.move
+    piece = undo.piece
+
+    if undo.captured is None:
+        del piece_loc[to_pos]
+    else:
+        piece_loc[to_pos] = undo.captured
+
+    piece.position = from_pos
+    piece.has_moved = undo.had_moved
+    piece.en_passantable = undo.was_en_passantable
+    piece_loc[from_pos] = piece
+
+    if undo.rook_move is not None:
+        rook = piece_loc[undo.rook_move.to_pos]
+        if undo.rook_displaced is None:
+            del piece_loc[undo.rook_move.to_pos]
+        else:
+            piece_loc[undo.rook_move.to_pos] = undo.rook_displaced
+
+        rook.position = undo.rook_move.from_pos
+        rook.has_moved = undo.rook_had_moved
+        piece_loc[undo.rook_move.from_pos] = rook
+
+    if undo.en_passant_captured is not None:
+        piece_loc[undo.en_passant_captured.position] = undo.en_passant_captured
+
+    for pawn in undo.cleared_en_passant:
+        pawn.en_passantable = True
@@ -0,0 +1,102 @@
+"""
+Piece lists: the live pieces of each color and type, kept beside the board.
+
+Move generation only needs the 16-or-fewer pieces of one color, so iterating
+the lists instead of all 64 squares of the board skips the empty squares and
+the opponent's pieces, and the king of either color is found without a scan.
+"""
+from operator import attrgetter
+
+from chess_2.utils.enums import Color, PieceType
+from chess_2.utils.types import Position
+from chess_2.piece.piece import Piece
+
+PIECE_TYPES: tuple[PieceType, ...] = (
+    PieceType.PAWN,
+    PieceType.KNIGHT,
+    PieceType.BISHOP,
+    PieceType.ROOK,
+    PieceType.QUEEN,
+    PieceType.KING,
+)
+
+_BY_POSITION = attrgetter("position")
+
+
+class PieceLists:
+    """
+    The pieces on a board, grouped by color and type, with each color's king at hand.
+
+    Pieces are tracked by identity, as Piece objects move with their piece rather
+    than being copied; a moved piece stays in its list and only its position changes.
+    Adding and removing a piece are O(1).
+
+    Args:
+        piece_loc (dict[Position, Piece] | None): The board to read the initial pieces from.
+    """
+
+    __slots__ = ("_by_type", "_kings")
+
+    def __init__(self, piece_loc: dict[Position, Piece] | None = None):
+        self._by_type: dict[Color, dict[PieceType, dict[int, Piece]]] = {
+            color: {piece_type: {} for piece_type in PIECE_TYPES}
+            for color in (Color.WHITE, Color.BLACK)
+        }
+        self._kings: dict[Color, Piece | None] = {Color.WHITE: None, Color.BLACK: None}
+
+        if piece_loc is not None:
+            for piece in piece_loc.values():
+                self.add(piece)
+
+    def add(self, piece: Piece) -> None:
+        """
+        Start tracking a piece. Empty squares are ignored.
+        """
+        if piece.piece_type == PieceType.EMPTY or piece.color == Color.NONE:
+            return
+
+        self._by_type[piece.color][piece.piece_type][id(piece)] = piece
+        if piece.piece_type == PieceType.KING:
+            self._kings[piece.color] = piece
+
+    def remove(self, piece: Piece) -> None:
+        """
+        Stop tracking a piece, e.g. when it is captured. Empty squares are ignored.
+        """
+        if piece.piece_type == PieceType.EMPTY or piece.color == Color.NONE:
+            return
+
+        group = self._by_type[piece.color][piece.piece_type]
+        group.pop(id(piece), None)
+        if piece.piece_type == PieceType.KING and self._kings[piece.color] is piece:
+            self._kings[piece.color] = next(iter(group.values()), None)
+
+    def pieces(self, color: Color) -> list[Piece]:
+        """
+        Get every piece of one color in board order, so moves are generated in the same order as by a board scan.
+        """
+        return sorted(
+            (piece for group in self._by_type[color].values() for piece in group.values()),
+            key=_BY_POSITION,
+        )
+
+    def of_type(self, color: Color, piece_type: PieceType) -> list[Piece]:
+        """
+        Get the pieces of one color and type.
+        """
+        return list(self._by_type[color][piece_type].values())
+
+    def count(self, color: Color, piece_type: PieceType) -> int:
+        """
+        Get the number of pieces of one color and type.
+        """
+        return len(self._by_type[color][piece_type])
+
+    def king(self, color: Color) -> Piece | None:
+        """
+        Get the king of one color, or None if it is not on the board.
+        """
+        return self._kings[color]
+
+    def __len__(self) -> int:
+        return sum(len(group) for groups in self._by_type.values() for group in groups.values())
@@ -0,0 +1,152 @@
+"""
+Fixed-size transposition table keyed by Zobrist position keys.
+
+The table is a flat list of slots indexed by the low bits of the key, so its
+memory use is bounded by the number of slots no matter how many positions are
+stored. Each entry keeps the full key to tell positions that share a slot apart,
+and its moves packed two bytes each (see encode_move).
+"""
+from array import array
+from dataclasses import dataclass
+
+from chess_2.utils.enums import GameStatus
+from chess_2.utils.types import Move, encode_move, decode_move
+
+# Replacement policies, used when a new position maps to an occupied slot
+REPLACE_ALWAYS = "always"    # The newest position wins
+REPLACE_NEVER = "never"      # The stored position is kept until the table is cleared
+REPLACE_TWO_WAY = "two_way"  # Each slot holds two entries and the least recently used one is replaced
+
+REPLACEMENT_POLICIES = (REPLACE_ALWAYS, REPLACE_NEVER, REPLACE_TWO_WAY)
+
+
+@dataclass(slots=True)
+class TTEntry:
+    """
+    Cached results for one position.
+
+    Attributes:
+        key (int): The Zobrist key of the position.
+        packed_moves (array): Every legal move for the player to move, packed with encode_move.
+        in_check (bool): Whether the player to move is in check.
+    """
+    key: int
+    packed_moves: array
+    in_check: bool
+
+    @property
+    def legal_moves(self) -> list[Move]:
+        return [decode_move(code) for code in self.packed_moves]
+
+    @property
+    def status(self) -> GameStatus:
+        if self.packed_moves:
+            return GameStatus.CHECK if self.in_check else GameStatus.ONGOING
+        return GameStatus.CHECKMATE if self.in_check else GameStatus.STALEMATE
+
+
+class TranspositionTable:
+    """
+    A bounded cache of position results.
+
+    Attributes:
+        size (int): The number of slots (a power of two).
+        policy (str): The replacement policy (one of REPLACEMENT_POLICIES).
+        hits (int): Probes that found the position.
+        misses (int): Probes that did not find the position.
+        stores (int): Entries written.
+        replacements (int): Entries that overwrote a different position.
+    """
+
+    def __init__(self, size: int = 1 << 14, policy: str = REPLACE_ALWAYS):
+        if size <= 0 or size & (size - 1):
+            raise ValueError(f"Transposition table size must be a power of two, got {size}")
+        if policy not in REPLACEMENT_POLICIES:
+            raise ValueError(f"Unknown replacement policy {policy!r}, expected one of {REPLACEMENT_POLICIES}")
+
+        self.size = size
+        self.policy = policy
+        self._mask = size - 1
+        self._ways = 2 if policy == REPLACE_TWO_WAY else 1
+        self._slots: list[TTEntry | None] = [None] * (size * self._ways)
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.replacements = 0
+
+    def __len__(self) -> int:
+        return sum(entry is not None for entry in self._slots)
+
+    @property
+    def hit_rate(self) -> float:
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    def probe(self, key: int) -> TTEntry | None:
+        """
+        Look up a position.
+
+        Args:
+            key (int): The Zobrist key of the position.
+
+        Returns:
+            TTEntry | None: The cached entry, or None if the position is not stored.
+        """
+        slots = self._slots
+        index = (key & self._mask) * self._ways
+
+        entry = slots[index]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+
+        if self._ways == 2:
+            other = slots[index + 1]
+            if other is not None and other.key == key:
+                # Keep the most recently used entry first, so the second one is replaced next
+                slots[index], slots[index + 1] = other, entry
+                self.hits += 1
+                return other
+
+        self.misses += 1
+        return None
+
+    def store(self, key: int, legal_moves: list[Move], in_check: bool) -> TTEntry:
+        """
+        Store the results for a position, following the replacement policy.
+
+        Args:
+            key (int): The Zobrist key of the position.
+            legal_moves (list[Move]): Every legal move for the player to move.
+            in_check (bool): Whether the player to move is in check.
+
+        Returns:
+            TTEntry: The new entry (returned even if the policy chose not to keep it).
+        """
+        entry = TTEntry(key=key, packed_moves=array("H", map(encode_move, legal_moves)), in_check=in_check)
+        slots = self._slots
+        index = (key & self._mask) * self._ways
+        current = slots[index]
+
+        if self.policy == REPLACE_NEVER and current is not None and current.key != key:
+            return entry
+
+        if self._ways == 2:
+            if current is not None and current.key != key:
+                # Demote the current entry, dropping whatever was least recently used
+                if slots[index + 1] is not None and slots[index + 1].key != key:
+                    self.replacements += 1
+                slots[index + 1] = current
+        elif current is not None and current.key != key:
+            self.replacements += 1
+
+        slots[index] = entry
+        self.stores += 1
+        return entry
+
+    def clear(self) -> None:
+        """
+        Remove every entry and reset the counters.
+        """
+        self._slots = [None] * (self.size * self._ways)
+        self.hits = self.misses = self.stores = self.replacements = 0
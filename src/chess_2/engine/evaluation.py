@@ -0,0 +1,405 @@
+"""
+Static evaluation: material, tapered piece-square tables, mobility and king safety.
+
+Material and piece-square scores are kept for a middlegame and an endgame, and
+blended by the game phase, which falls from MAX_PHASE towards 0 as pieces leave
+the board. Both only depend on which piece stands on which square, so
+PieceSquareScore keeps them up to date move by move and reading them is O(1);
+BoardState.scores holds one for its board. Mobility and king safety depend on
+how pieces interact and are computed at evaluation time.
+"""
+from chess_2.utils.enums import Color, PieceType
+from chess_2.utils.types import Position, SQUARES
+from chess_2.piece.piece import Piece
+from chess_2.piece_movement.lookup_tables import KING_TARGETS, PAWN_DIRECTION
+from chess_2.board.piece_lists import PieceLists
+from chess_2.board.attack_maps import get_attacked_squares
+
+# Material values in centipawns. The king has no material value but is given one
+# so it orders last as an attacker in MVV-LVA.
+PIECE_VALUES: dict[PieceType, int] = {
+    PieceType.EMPTY: 0,
+    PieceType.PAWN: 100,
+    PieceType.KNIGHT: 320,
+    PieceType.BISHOP: 330,
+    PieceType.ROOK: 500,
+    PieceType.QUEEN: 900,
+    PieceType.KING: 0,
+}
+
+# Material values in the endgame, where pawns and rooks gain and minor pieces lose
+ENDGAME_PIECE_VALUES: dict[PieceType, int] = {
+    PieceType.EMPTY: 0,
+    PieceType.PAWN: 120,
+    PieceType.KNIGHT: 300,
+    PieceType.BISHOP: 320,
+    PieceType.ROOK: 520,
+    PieceType.QUEEN: 920,
+    PieceType.KING: 0,
+}
+
+# How much each piece adds to the game phase; the starting position has MAX_PHASE
+PHASE_WEIGHTS: dict[PieceType, int] = {
+    PieceType.EMPTY: 0,
+    PieceType.PAWN: 0,
+    PieceType.KNIGHT: 1,
+    PieceType.BISHOP: 1,
+    PieceType.ROOK: 2,
+    PieceType.QUEEN: 4,
+    PieceType.KING: 0,
+}
+MAX_PHASE = 24
+
+# Piece-square bonuses for white, laid out as the board is printed: a8 first, h1 last.
+# Black uses the same tables mirrored vertically.
+PAWN_TABLE = (
+     0,   0,   0,   0,   0,   0,   0,   0,
+    50,  50,  50,  50,  50,  50,  50,  50,
+    10,  10,  20,  30,  30,  20,  10,  10,
+     5,   5,  10,  25,  25,  10,   5,   5,
+     0,   0,   0,  20,  20,   0,   0,   0,
+     5,  -5, -10,   0,   0, -10,  -5,   5,
+     5,  10,  10, -20, -20,  10,  10,   5,
+     0,   0,   0,   0,   0,   0,   0,   0,
+)
+
+PAWN_ENDGAME_TABLE = (
+     0,   0,   0,   0,   0,   0,   0,   0,
+    80,  80,  80,  80,  80,  80,  80,  80,
+    50,  50,  50,  50,  50,  50,  50,  50,
+    30,  30,  30,  30,  30,  30,  30,  30,
+    15,  15,  15,  15,  15,  15,  15,  15,
+     5,   5,   5,   5,   5,   5,   5,   5,
+     0,   0,   0,   0,   0,   0,   0,   0,
+     0,   0,   0,   0,   0,   0,   0,   0,
+)
+
+KNIGHT_TABLE = (
+   -50, -40, -30, -30, -30, -30, -40, -50,
+   -40, -20,   0,   0,   0,   0, -20, -40,
+   -30,   0,  10,  15,  15,  10,   0, -30,
+   -30,   5,  15,  20,  20,  15,   5, -30,
+   -30,   0,  15,  20,  20,  15,   0, -30,
+   -30,   5,  10,  15,  15,  10,   5, -30,
+   -40, -20,   0,   5,   5,   0, -20, -40,
+   -50, -40, -30, -30, -30, -30, -40, -50,
+)
+
+BISHOP_TABLE = (
+   -20, -10, -10, -10, -10, -10, -10, -20,
+   -10,   0,   0,   0,   0,   0,   0, -10,
+   -10,   0,   5,  10,  10,   5,   0, -10,
+   -10,   5,   5,  10,  10,   5,   5, -10,
+   -10,   0,  10,  10,  10,  10,   0, -10,
+   -10,  10,  10,  10,  10,  10,  10, -10,
+   -10,   5,   0,   0,   0,   0,   5, -10,
+   -20, -10, -10, -10, -10, -10, -10, -20,
+)
+
+ROOK_TABLE = (
+     0,   0,   0,   0,   0,   0,   0,   0,
+     5,  10,  10,  10,  10,  10,  10,   5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+     0,   0,   0,   5,   5,   0,   0,   0,
+)
+
+QUEEN_TABLE = (
+   -20, -10, -10,  -5,  -5, -10, -10, -20,
+   -10,   0,   0,   0,   0,   0,   0, -10,
+   -10,   0,   5,   5,   5,   5,   0, -10,
+    -5,   0,   5,   5,   5,   5,   0,  -5,
+     0,   0,   5,   5,   5,   5,   0,  -5,
+   -10,   5,   5,   5,   5,   5,   0, -10,
+   -10,   0,   5,   0,   0,   0,   0, -10,
+   -20, -10, -10,  -5,  -5, -10, -10, -20,
+)
+
+KING_TABLE = (
+   -30, -40, -40, -50, -50, -40, -40, -30,
+   -30, -40, -40, -50, -50, -40, -40, -30,
+   -30, -40, -40, -50, -50, -40, -40, -30,
+   -30, -40, -40, -50, -50, -40, -40, -30,
+   -20, -30, -30, -40, -40, -30, -30, -20,
+   -10, -20, -20, -20, -20, -20, -20, -10,
+    20,  20,   0,   0,   0,   0,  20,  20,
+    20,  30,  10,   0,   0,  10,  30,  20,
+)
+
+KING_ENDGAME_TABLE = (
+   -50, -40, -30, -20, -20, -30, -40, -50,
+   -30, -20, -10,   0,   0, -10, -20, -30,
+   -30, -10,  20,  30,  30,  20, -10, -30,
+   -30, -10,  30,  40,  40,  30, -10, -30,
+   -30, -10,  30,  40,  40,  30, -10, -30,
+   -30, -10,  20,  30,  30,  20, -10, -30,
+   -30, -30,   0,   0,   0,   0, -30, -30,
+   -50, -30, -30, -30, -30, -30, -30, -50,
+)
+
+MIDDLEGAME_TABLES: dict[PieceType, tuple[int, ...]] = {
+    PieceType.PAWN: PAWN_TABLE,
+    PieceType.KNIGHT: KNIGHT_TABLE,
+    PieceType.BISHOP: BISHOP_TABLE,
+    PieceType.ROOK: ROOK_TABLE,
+    PieceType.QUEEN: QUEEN_TABLE,
+    PieceType.KING: KING_TABLE,
+}
+
+ENDGAME_TABLES: dict[PieceType, tuple[int, ...]] = {
+    **MIDDLEGAME_TABLES,
+    PieceType.PAWN: PAWN_ENDGAME_TABLE,
+    PieceType.KING: KING_ENDGAME_TABLE,
+}
+
+# Centipawns per square a piece can move to
+MOBILITY_WEIGHTS: dict[PieceType, int] = {
+    PieceType.KNIGHT: 4,
+    PieceType.BISHOP: 5,
+    PieceType.ROOK: 2,
+    PieceType.QUEEN: 1,
+}
+
+# King safety, in middlegame centipawns: pawns sheltering the king and enemy attacks on the squares around it
+PAWN_SHIELD_BONUS = 12
+KING_ZONE_ATTACK_PENALTY = 8
+
+
+def _signed_scores(
+    values: dict[PieceType, int], tables: dict[PieceType, tuple[int, ...]]
+) -> dict[Color, dict[PieceType, dict[Position, int]]]:
+    # Material plus piece-square bonus, positive for white and negative for black
+    scores = {}
+    for color, sign in ((Color.WHITE, 1), (Color.BLACK, -1)):
+        scores[color] = {
+            piece_type: {
+                pos: sign * (values[piece_type] + table[(pos.row if color == Color.WHITE else 7 - pos.row) * 8 + pos.col])
+                for pos in SQUARES
+            }
+            for piece_type, table in tables.items()
+        }
+    return scores
+
+
+MIDDLEGAME_SCORES = _signed_scores(PIECE_VALUES, MIDDLEGAME_TABLES)
+ENDGAME_SCORES = _signed_scores(ENDGAME_PIECE_VALUES, ENDGAME_TABLES)
+
+
+def evaluate(piece_loc: dict[Position, Piece], color: Color) -> int:
+    """
+    Evaluate a position by material balance.
+
+    Args:
+        piece_loc (dict[Position, Piece]): The board state.
+        color (Color): The side to evaluate for.
+
+    Returns:
+        int: The material balance in centipawns, positive when color is ahead.
+    """
+    score = 0
+    for piece in piece_loc.values():
+        if piece.color == color:
+            score += PIECE_VALUES[piece.piece_type]
+        elif piece.color != Color.NONE:
+            score -= PIECE_VALUES[piece.piece_type]
+
+    return score
+
+
+class PieceSquareScore:
+    """
+    Material plus piece-square scores of a board, for the middlegame and the endgame, and its game phase.
+
+    The scores are from white's point of view. Each change to the board is applied
+    as a delta, so the scores never need to be recomputed from the whole board.
+
+    Attributes:
+        middlegame (int): The middlegame score in centipawns.
+        endgame (int): The endgame score in centipawns.
+        phase (int): The sum of PHASE_WEIGHTS over the pieces on the board.
+
+    Args:
+        piece_loc (dict[Position, Piece] | None): The board to compute the initial scores from.
+    """
+
+    __slots__ = ("middlegame", "endgame", "phase")
+
+    def __init__(self, piece_loc: dict[Position, Piece] | None = None):
+        self.middlegame = 0
+        self.endgame = 0
+        self.phase = 0
+
+        if piece_loc is not None:
+            for pos, piece in piece_loc.items():
+                self.add(piece, pos)
+
+    def add(self, piece: Piece, pos: Position) -> None:
+        """
+        Account for a piece placed on a square. Empty squares are ignored.
+        """
+        if piece.color == Color.NONE or piece.piece_type == PieceType.EMPTY:
+            return
+        self.middlegame += MIDDLEGAME_SCORES[piece.color][piece.piece_type][pos]
+        self.endgame += ENDGAME_SCORES[piece.color][piece.piece_type][pos]
+        self.phase += PHASE_WEIGHTS[piece.piece_type]
+
+    def remove(self, piece: Piece, pos: Position) -> None:
+        """
+        Account for a piece taken off a square. Empty squares are ignored.
+        """
+        if piece.color == Color.NONE or piece.piece_type == PieceType.EMPTY:
+            return
+        self.middlegame -= MIDDLEGAME_SCORES[piece.color][piece.piece_type][pos]
+        self.endgame -= ENDGAME_SCORES[piece.color][piece.piece_type][pos]
+        self.phase -= PHASE_WEIGHTS[piece.piece_type]
+
+    def move(self, piece: Piece, from_pos: Position, to_pos: Position) -> None:
+        """
+        Account for a piece moving between two squares.
+        """
+        middlegame = MIDDLEGAME_SCORES[piece.color][piece.piece_type]
+        endgame = ENDGAME_SCORES[piece.color][piece.piece_type]
+        self.middlegame += middlegame[to_pos] - middlegame[from_pos]
+        self.endgame += endgame[to_pos] - endgame[from_pos]
+
+    @property
+    def game_phase(self) -> int:
+        """
+        The phase, from MAX_PHASE in the opening down to 0 with only kings and pawns left.
+        """
+        return min(self.phase, MAX_PHASE)
+
+    def value(self, color: Color) -> int:
+        """
+        Get the tapered score from one side's point of view.
+        """
+        phase = self.game_phase
+        score = (self.middlegame * phase + self.endgame * (MAX_PHASE - phase)) // MAX_PHASE
+        return score if color == Color.WHITE else -score
+
+
+# The king's square and the squares around it, where enemy attacks count against king safety
+KING_ZONES: dict[Position, frozenset[Position]] = {pos: frozenset({pos, *KING_TARGETS[pos]}) for pos in SQUARES}
+
+
+def _activity(
+    piece_loc: dict[Position, Piece], color: Color, pieces: PieceLists, enemy_king_zone: frozenset[Position]
+) -> tuple[int, int]:
+    # One pass over the attacks of color's knights, bishops, rooks and queens gives both
+    # their mobility and how many attacks land in the enemy king's zone
+    mobility_score = zone_attacks = 0
+    for piece_type, weight in MOBILITY_WEIGHTS.items():
+        for piece in pieces.of_type(color, piece_type):
+            for pos in get_attacked_squares(piece, piece_loc):
+                if piece_loc[pos].color != color:
+                    mobility_score += weight
+                if pos in enemy_king_zone:
+                    zone_attacks += 1
+    return mobility_score, zone_attacks
+
+
+def _pawn_shield(piece_loc: dict[Position, Piece], king: Piece) -> int:
+    king_pos, color = king.position, king.color
+    forward = PAWN_DIRECTION[color]
+    shield = 0
+    for distance in (1, 2):
+        row = king_pos.row + forward * distance
+        for col in (king_pos.col - 1, king_pos.col, king_pos.col + 1):
+            occupant = piece_loc.get(Position(row, col))
+            if occupant is not None and occupant.color == color and occupant.piece_type == PieceType.PAWN:
+                shield += PAWN_SHIELD_BONUS // distance
+    return shield
+
+
+def _king_zone(pieces: PieceLists, color: Color) -> frozenset[Position]:
+    king = pieces.king(color)
+    return KING_ZONES[king.position] if king is not None else frozenset()
+
+
+def mobility(piece_loc: dict[Position, Piece], color: Color, pieces: PieceLists | None = None) -> int:
+    """
+    Score the mobility of one side's knights, bishops, rooks and queens.
+
+    Args:
+        piece_loc (dict[Position, Piece]): The board state.
+        color (Color): The side to score.
+        pieces (PieceLists | None): The board's piece lists, if already built.
+
+    Returns:
+        int: The mobility bonus in centipawns.
+    """
+    pieces = pieces if pieces is not None else PieceLists(piece_loc)
+    return _activity(piece_loc, color, pieces, frozenset())[0]
+
+
+def king_safety(
+    piece_loc: dict[Position, Piece], color: Color, pieces: PieceLists | None = None, phase: int = MAX_PHASE
+) -> int:
+    """
+    Score the safety of one side's king: a bonus for pawns in front of it and a penalty
+    for each attack by an enemy knight, bishop, rook or queen on the king and the squares
+    around it. Both fade out with the phase, as the king should become active in the endgame.
+
+    Args:
+        piece_loc (dict[Position, Piece]): The board state.
+        color (Color): The side whose king to score.
+        pieces (PieceLists | None): The board's piece lists, if already built.
+        phase (int): The game phase, from MAX_PHASE down to 0.
+
+    Returns:
+        int: The king safety score in centipawns.
+    """
+    pieces = pieces if pieces is not None else PieceLists(piece_loc)
+    king = pieces.king(color)
+    if king is None or phase <= 0:
+        return 0
+
+    opponent = Color.BLACK if color == Color.WHITE else Color.WHITE
+    zone_attacks = _activity(piece_loc, opponent, pieces, KING_ZONES[king.position])[1]
+    return (_pawn_shield(piece_loc, king) - KING_ZONE_ATTACK_PENALTY * zone_attacks) * phase // MAX_PHASE
+
+
+def evaluate_position(
+    piece_loc: dict[Position, Piece],
+    color: Color,
+    pieces: PieceLists | None = None,
+    scores: PieceSquareScore | None = None,
+) -> int:
+    """
+    Evaluate a position by tapered material and piece-square scores, mobility and king safety.
+
+    Pass a board's incrementally kept piece lists and scores (BoardState.pieces and
+    BoardState.scores) to skip recomputing them; the attacks of each side are then
+    walked once, for mobility and king safety together.
+
+    Args:
+        piece_loc (dict[Position, Piece]): The board state.
+        color (Color): The side to evaluate for.
+        pieces (PieceLists | None): The board's piece lists.
+        scores (PieceSquareScore | None): The board's material and piece-square scores.
+
+    Returns:
+        int: The score in centipawns, positive when color is better.
+    """
+    pieces = pieces if pieces is not None else PieceLists(piece_loc)
+    scores = scores if scores is not None else PieceSquareScore(piece_loc)
+    opponent = Color.BLACK if color == Color.WHITE else Color.WHITE
+    phase = scores.game_phase
+
+    own_mobility, attacks_on_opponent = _activity(piece_loc, color, pieces, _king_zone(pieces, opponent))
+    opponent_mobility, attacks_on_own = _activity(piece_loc, opponent, pieces, _king_zone(pieces, color))
+    score = scores.value(color) + own_mobility - opponent_mobility
+
+    if phase > 0:
+        own_king, opponent_king = pieces.king(color), pieces.king(opponent)
+        safety = KING_ZONE_ATTACK_PENALTY * (attacks_on_opponent - attacks_on_own)
+        if own_king is not None:
+            safety += _pawn_shield(piece_loc, own_king)
+        if opponent_king is not None:
+            safety -= _pawn_shield(piece_loc, opponent_king)
+        score += safety * phase // MAX_PHASE
+
+    return score
@@ -0,0 +1,359 @@
+"""
+Negamax alpha-beta search with iterative deepening.
+
+The search runs on a BoardState, making and unmaking moves in place and
+taking legal move lists from the board's transposition table. Each iteration
+searches one ply deeper than the last, so when the time or node budget runs
+out the best move of the last completed iteration is returned.
+
+Moves are ordered: the previous iteration's best move first, then captures by
+MVV-LVA (most valuable victim, least valuable attacker), then killer moves
+(quiet moves that caused a cutoff at the same ply), then quiet moves by their
+history score. Leaf positions are resolved with a quiescence search over
+captures and queen promotions, generated without the quiet moves, so the
+evaluation is not taken in the middle of an exchange. A side in check cannot
+stand pat there: every evasion is searched, so mates at the horizon are seen.
+
+A position that repeats one seen earlier, in the game or along the searched line,
+or that has reached the fifty-move rule, is scored as a draw.
+"""
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from chess_2.utils.enums import PieceType
+from chess_2.utils.types import Move
+from chess_2.board.board_state import BoardState
+from chess_2.board.game_status import FIFTY_MOVE_HALFMOVES
+from chess_2.engine.evaluation import PIECE_VALUES, evaluate_position
+
+MATE_SCORE = 100_000
+INFINITY = MATE_SCORE + 1
+MAX_PLY = 64
+
+# How many nodes pass between checks of the clock
+TIME_CHECK_INTERVAL = 256
+
+# Ordering scores for each class of move, highest searched first
+PV_MOVE_SCORE = 1 << 30
+CAPTURE_SCORE = 1 << 20
+KILLER_SCORE = 1 << 19
+
+
+class SearchAborted(Exception):
+    """
+    Raised inside the search when the time or node budget runs out.
+    """
+
+
+@dataclass
+class IterationInfo:
+    """
+    The result of one iterative deepening iteration.
+
+    Attributes:
+        depth (int): The depth searched.
+        score (int): The score of the best move in centipawns, from the side to move's point of view.
+        best_move (Move | None): The best move found.
+        nodes (int): Nodes searched in this iteration.
+        elapsed (float): Seconds spent on this iteration.
+    """
+    depth: int
+    score: int
+    best_move: Move | None
+    nodes: int
+    elapsed: float
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass
+class SearchResult:
+    """
+    The result of a search.
+
+    Attributes:
+        best_move (Move | None): The best move of the deepest completed iteration (None if there are no legal moves).
+        score (int): Its score in centipawns.
+        depth (int): The deepest completed iteration.
+        nodes (int): Total nodes searched, including any aborted iteration.
+        elapsed (float): Total seconds spent searching.
+        iterations (list[IterationInfo]): One entry per completed iteration.
+    """
+    best_move: Move | None
+    score: int
+    depth: int
+    nodes: int
+    elapsed: float
+    iterations: list[IterationInfo] = field(default_factory=list)
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def is_capture(board_state: BoardState, move: Move) -> bool:
+    piece_loc = board_state.piece_pos
+    target = piece_loc.get(move.to_pos)
+    if target is not None and target.piece_type != PieceType.EMPTY:
+        return True
+    # En passant: the only move of a pawn off its file onto an empty square
+    return move.from_pos.col != move.to_pos.col and piece_loc[move.from_pos].piece_type == PieceType.PAWN
+
+
+def mvv_lva_score(board_state: BoardState, move: Move) -> int:
+    """
+    Score a capture so that taking the most valuable victim with the least valuable attacker comes first.
+    """
+    piece_loc = board_state.piece_pos
+    target = piece_loc[move.to_pos].piece_type
+    if target == PieceType.EMPTY and move.from_pos.col != move.to_pos.col:
+        target = PieceType.PAWN  # En passant
+    victim = PIECE_VALUES[target] + (PIECE_VALUES[move.promotion] if move.promotion else 0)
+    attacker = PIECE_VALUES[piece_loc[move.from_pos].piece_type] or PIECE_VALUES[PieceType.QUEEN] + 100
+    return victim * 16 - attacker // 10
+
+
+class Searcher:
+    """
+    Iterative deepening alpha-beta search over a BoardState.
+
+    Attributes:
+        board_state (BoardState): The position to search. It is restored before search returns.
+        nodes (int): Nodes searched so far.
+        killers (list[list[Move | None]]): Two killer moves per ply.
+        history (dict[Move, int]): History score of quiet moves that caused cutoffs.
+    """
+
+    def __init__(self, board_state: BoardState):
+        self.board_state = board_state
+        self.nodes = 0
+        self.killers: list[list[Move | None]] = [[None, None] for _ in range(MAX_PLY)]
+        self.history: dict[Move, int] = {}
+        self._deadline: float | None = None
+        self._node_limit: int | None = None
+        self._stop: threading.Event | None = None
+        self._pv_move: Move | None = None
+
+    def search(
+        self,
+        max_depth: int = MAX_PLY,
+        time_limit_ms: int | None = None,
+        node_limit: int | None = None,
+        stop: threading.Event | None = None,
+        on_iteration: Callable[[IterationInfo], None] | None = None,
+    ) -> SearchResult:
+        """
+        Search the position with iterative deepening until a limit is reached.
+
+        Args:
+            max_depth (int): The deepest iteration to run.
+            time_limit_ms (int | None): Stop after this many milliseconds.
+            node_limit (int | None): Stop after this many nodes.
+            stop (threading.Event | None): Stop as soon as the event is set, e.g. from another thread.
+            on_iteration (Callable[[IterationInfo], None] | None): Called after each completed iteration.
+
+        Returns:
+            SearchResult: The best move of the deepest completed iteration and per-iteration statistics.
+        """
+        start = time.perf_counter()
+        self.nodes = 0
+        self._deadline = start + time_limit_ms / 1000 if time_limit_ms is not None else None
+        self._node_limit = node_limit
+        self._stop = stop
+        self._pv_move = None
+
+        result = SearchResult(best_move=None, score=0, depth=0, nodes=0, elapsed=0.0)
+        root_moves = self.board_state.get_legal_moves()
+        if root_moves:
+            # Always have a move to play, even if the first iteration is cut short
+            result.best_move = root_moves[0]
+
+        for depth in range(1, min(max_depth, MAX_PLY) + 1):
+            iteration_start = time.perf_counter()
+            nodes_before = self.nodes
+            try:
+                score, best_move = self._search_root(depth)
+            except SearchAborted:
+                break
+
+            info = IterationInfo(
+                depth=depth,
+                score=score,
+                best_move=best_move,
+                nodes=self.nodes - nodes_before,
+                elapsed=time.perf_counter() - iteration_start,
+            )
+            result.iterations.append(info)
+            result.best_move, result.score, result.depth = best_move, score, depth
+            self._pv_move = best_move
+            if on_iteration is not None:
+                on_iteration(info)
+
+            # A forced mate or a position without moves will not change with more depth
+            if best_move is None or abs(score) >= MATE_SCORE - MAX_PLY:
+                break
+
+        result.nodes = self.nodes
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    def _check_budget(self) -> None:
+        if self._node_limit is not None and self.nodes >= self._node_limit:
+            raise SearchAborted
+        if self.nodes % TIME_CHECK_INTERVAL == 0:
+            if self._deadline is not None and time.perf_counter() >= self._deadline:
+                raise SearchAborted
+            if self._stop is not None and self._stop.is_set():
+                raise SearchAborted
+
+    def _order_moves(self, moves: list[Move], ply: int, pv_move: Move | None = None) -> list[Move]:
+        board_state = self.board_state
+        killers = self.killers[ply]
+        history = self.history
+
+        def score(move: Move) -> int:
+            if move == pv_move:
+                return PV_MOVE_SCORE
+            if is_capture(board_state, move):
+                return CAPTURE_SCORE + mvv_lva_score(board_state, move)
+            if move in killers:
+                return KILLER_SCORE
+            return history.get(move, 0)
+
+        return sorted(moves, key=score, reverse=True)
+
+    def _search_root(self, depth: int) -> tuple[int, Move | None]:
+        board_state = self.board_state
+        moves = board_state.get_legal_moves()
+        if not moves:
+            return (-MATE_SCORE if board_state.is_in_check() else 0), None
+
+        alpha, beta = -INFINITY, INFINITY
+        best_move = None
+        for move in self._order_moves(moves, 0, self._pv_move):
+            undo = board_state.make_move(move)
+            try:
+                score = -self._negamax(depth - 1, 1, -beta, -alpha)
+            finally:
+                board_state.unmake_move(undo)
+
+            if score > alpha:
+                alpha, best_move = score, move
+
+        return alpha, best_move
+
+    def _negamax(self, depth: int, ply: int, alpha: int, beta: int) -> int:
+        self.nodes += 1
+        self._check_budget()
+
+        board_state = self.board_state
+        if board_state.is_repetition():
+            return 0
+
+        moves = board_state.get_legal_moves()
+        if not moves:
+            # Prefer the quickest mate and the slowest defeat
+            return -MATE_SCORE + ply if board_state.is_in_check() else 0
+        if board_state.halfmove_clock >= FIFTY_MOVE_HALFMOVES:
+            return 0
+
+        if depth <= 0 or ply >= MAX_PLY - 1:
+            return self._quiescence(ply, alpha, beta)
+
+        for move in self._order_moves(moves, ply):
+            capture = is_capture(board_state, move)
+            undo = board_state.make_move(move)
+            try:
+                score = -self._negamax(depth - 1, ply + 1, -beta, -alpha)
+            finally:
+                board_state.unmake_move(undo)
+
+            if score >= beta:
+                if not capture:
+                    killers = self.killers[ply]
+                    if killers[0] != move:
+                        killers[1], killers[0] = killers[0], move
+                    self.history[move] = self.history.get(move, 0) + depth * depth
+                return beta
+
+            if score > alpha:
+                alpha = score
+
+        return alpha
+
+    def _quiescence(self, ply: int, alpha: int, beta: int) -> int:
+        self.nodes += 1
+        self._check_budget()
+
+        board_state = self.board_state
+        if ply >= MAX_PLY - 1:
+            return evaluate_position(board_state.piece_pos, board_state.player_turn, board_state.pieces,
+                                     board_state.scores)
+
+        if board_state.is_in_check():
+            # No standing pat in check: every evasion is searched, and having none is mate
+            moves = board_state.get_legal_moves()
+            if not moves:
+                return -MATE_SCORE + ply
+            moves = self._order_moves(moves, ply)
+        else:
+            stand_pat = evaluate_position(
+                board_state.piece_pos, board_state.player_turn, board_state.pieces, board_state.scores
+            )
+            if stand_pat >= beta:
+                return beta
+            if stand_pat > alpha:
+                alpha = stand_pat
+
+            # Underpromotions are left to the main search
+            moves = [move for move in board_state.get_legal_captures() if move.promotion in (None, PieceType.QUEEN)]
+            moves.sort(key=lambda move: mvv_lva_score(board_state, move), reverse=True)
+
+        for move in moves:
+            undo = board_state.make_move(move)
+            try:
+                score = -self._quiescence(ply + 1, -beta, -alpha)
+            finally:
+                board_state.unmake_move(undo)
+
+            if score >= beta:
+                return beta
+            if score > alpha:
+                alpha = score
+
+        return alpha
+
+
+def find_best_move(
+    board_state: BoardState,
+    max_depth: int = MAX_PLY,
+    time_limit_ms: int | None = None,
+    node_limit: int | None = None,
+    stop: threading.Event | None = None,
+    on_iteration: Callable[[IterationInfo], None] | None = None,
+) -> SearchResult:
+    """
+    Search for the best move for the player to move.
+
+    Args:
+        board_state (BoardState): The position to search. It is restored before returning.
+        max_depth (int): The deepest iteration to run.
+        time_limit_ms (int | None): Stop after this many milliseconds.
+        node_limit (int | None): Stop after this many nodes.
+        stop (threading.Event | None): Stop as soon as the event is set, e.g. from another thread.
+        on_iteration (Callable[[IterationInfo], None] | None): Called after each completed iteration.
+
+    Returns:
+        SearchResult: The best move, its score and per-iteration node counts and speed.
+    """
+    return Searcher(board_state).search(
+        max_depth=max_depth,
+        time_limit_ms=time_limit_ms,
+        node_limit=node_limit,
+        stop=stop,
+        on_iteration=on_iteration,
+    )
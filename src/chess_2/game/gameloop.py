@@ -1,11 +1,15 @@
 from chess_2.board.board_state import BoardState
 from chess_2.board.board_representation import generate_board_repr
+from chess_2.board.move_execution import is_promotion
 
 from chess_2.piece.piece import Piece
 
 from chess_2.utils.enums import Color, PieceType
 from chess_2.utils.fen import START_FEN, parse_fen, parse_user_input
-from chess_2.utils.types import Position
+from chess_2.utils.san import san_to_move, move_to_san
+from chess_2.utils.types import Position, Move
+from chess_2.piece_movement import move_generator
+from chess_2.bitboard import move_generator as bitboard_move_generator
 from chess_2.utils.input_validation import (
     does_piece_exist_at_pos,
     InvalidNotation,
@@ -19,50 +23,105 @@ def get_player_input(board_state:BoardState) -> str:
     Prompts the user to enter a move.
 
     Returns:
-        Tuple of (from_pos, to_pos) in algebraic notation, e.g., ('e2', 'e4').
+        str: The move as typed, in SAN (e.g., 'Nf3') or the long form (e.g., 'Pg1f3').
     """
 
     print(f"{board_state.player_turn}'s move:")
-    move = input(f"Enter your move (e.g., be2e4): ")
+    move = input(f"Enter your move (e.g., Nf3 or Pg1f3): ")
     return move
 
-def run_game():
-    board_state = BoardState()
+def resolve_move(board_state: BoardState, text: str, legal_moves: list[Move]) -> Move:
+    """
+    Turn a move typed by a player into a legal move of the player to move.
+
+    Args:
+        board_state (BoardState): The current position.
+        text (str): The move in SAN (e.g., 'Nf3') or the long form (e.g., 'Pg1f3').
+        legal_moves (list[Move]): The legal moves of the position.
+
+    Returns:
+        Move: The legal move.
+
+    Raises:
+        InvalidNotation: If the text is neither SAN nor the long form.
+        PieceDoesNotExist: If the long form names a piece that is not on its square.
+        IllegalMove: If the move is not legal.
+    """
+    result = parse_user_input(text, board_state.player_turn)
+
+    if result is None:
+        # Not the long form, so try SAN
+        return san_to_move(board_state, text, legal_moves)
+
+    piece_to_move, final_pos = result
+
+    if not does_piece_exist_at_pos(board_state.piece_pos, piece_to_move):
+        raise PieceDoesNotExist(piece_to_move.position)
+
+    # The long form has no promotion piece, so a pawn reaching the last rank becomes a queen
+    promotion = PieceType.QUEEN if is_promotion(piece_to_move, final_pos) else None
+    move = Move(piece_to_move.position, final_pos, promotion)
+    if move not in legal_moves:
+        raise IllegalMove(text, reason="Move is not legal for this piece")
+    return move
+
+def play_move(board_state: BoardState, move: Move, legal_moves: list[Move]) -> str:
+    """
+    Play a legal move, recording it in the move history.
+
+    Args:
+        board_state (BoardState): The current position.
+        move (Move): The move to play.
+        legal_moves (list[Move]): The legal moves of the position.
+
+    Returns:
+        str: The move in SAN.
+    """
+    san = move_to_san(board_state, move, legal_moves)
+
+    board_state.move_piece(board_state.piece_pos[move.from_pos], move.to_pos, move.promotion)
+    board_state.move_history.append(san)
+    board_state.switch_player_turn()
+    return san
+
+def run_game(backend: str = "dict"):
+    """
+    Runs an interactive game between two players, until checkmate or a draw.
+
+    Args:
+        backend (str): The move generation backend: "dict", "mailbox" or "bitboard".
+
+    Returns:
+        GameStatus: The status that ended the game.
+    """
+    get_legal_move_list = (
+        bitboard_move_generator.get_legal_move_list if backend == "bitboard"
+        else move_generator.get_legal_move_list
+    )
+
+    board_state = BoardState(move_list_generator=get_legal_move_list)
     # Initialize from fixed starting position
-    board_state.piece_pos = parse_fen(START_FEN)
+    board_state.piece_pos = parse_fen(START_FEN, mailbox=backend == "mailbox")
     
     while True:
         print(generate_board_repr(board_state.piece_pos))
-        move = get_player_input(board_state)
 
-        try:
-            result = parse_user_input(move, board_state.player_turn)
-            
-            if result is None:
-                raise InvalidNotation(move)
-
-            piece_to_move, final_pos = result
-
-            if not does_piece_exist_at_pos(board_state.piece_pos, piece_to_move):
-                raise PieceDoesNotExist(piece_to_move.position)
+        # One evaluation per turn serves the end-of-game check, validation, SAN parsing and SAN writing
+        status = board_state.evaluate_status()
+        if status.is_game_over:
+            print(f"Game over: {status.status.value}")
+            return status.status
 
-            from chess_2.piece_movement.move_generator import get_all_valid_moves
-            all_valid = get_all_valid_moves(piece_to_move.color, board_state.piece_pos)
-
-            for piece, moves in all_valid:
-                if piece.position == piece_to_move.position and final_pos in moves:
-                    break
-            else:
-                raise IllegalMove(move, reason="Move is not legal for this piece")
+        legal_moves = status.legal_moves
+        move = get_player_input(board_state)
 
+        try:
+            move = resolve_move(board_state, move, legal_moves)
         except (InvalidNotation, PieceDoesNotExist, IllegalMove) as e:
             print(e.message)
             continue
 
-
-        board_state.move_piece(piece_to_move, final_pos)
-        board_state.move_history.append(move)
-        board_state.switch_player_turn()
+        play_move(board_state, move, legal_moves)
             
 if __name__ == "__main__":
     run_game()
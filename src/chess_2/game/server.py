@@ -0,0 +1,363 @@
+"""
+An asyncio game server hosting many concurrent games in one process.
+
+Clients connect over TCP and send one command per line; every command gets one
+reply line starting with "ok" or "error":
+
+    new [fen]               start a game, replies with its id
+    move <id> <move>        play a move in SAN or the long form, replies with its SAN and the status
+    go <id> [movetime_ms]   let the engine play a move, replies like move
+    moves <id>              list the legal moves in SAN
+    fen <id>                the position as a FEN string
+    close <id>              end a game and free it
+    stats [id]              server metrics, or the metrics of one game
+    quit                    close the connection
+
+Games are not tied to a connection, so two players can share a game by its id.
+The event loop only reads lines and routes replies: move validation and playing
+run in a thread pool, since they work on the game's BoardState in place, and
+engine searches, which are CPU-bound, go to a process pool (when engine workers
+are configured) as a FEN string. A lock per game keeps commands on one game in
+order while different games proceed concurrently.
+
+Usage:
+    python -m chess_2.game.server --port 8765 --workers 8 --engine-workers 4
+"""
+import argparse
+import asyncio
+import itertools
+import sys
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from chess_2.utils.fen import START_FEN
+from chess_2.utils.san import legal_moves_to_san
+from chess_2.utils.types import Move
+from chess_2.utils.input_validation import InvalidNotation, PieceDoesNotExist, IllegalMove
+from chess_2.board.board_state import BoardState
+from chess_2.board.game_status import PositionStatus
+from chess_2.board.transposition_table import TranspositionTable
+from chess_2.engine.search import find_best_move
+from chess_2.game.gameloop import resolve_move, play_move
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# A game only walks one line of play, so a small table per game is enough and keeps thousands of games cheap
+GAME_TT_SIZE = 1 << 6
+
+DEFAULT_MOVETIME_MS = 1000
+
+# Number of recent request latencies kept for the percentiles
+LATENCY_WINDOW = 4096
+
+
+class GameError(Exception):
+    """
+    Raised for a command that cannot be carried out; its message is sent back to the client.
+    """
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
+@dataclass(slots=True)
+class LatencyStats:
+    """
+    Running latency totals of the requests handled.
+
+    Attributes:
+        count (int): Requests handled.
+        total (float): Seconds spent on them, from receiving the command to having the reply.
+        max (float): Seconds spent on the slowest one.
+    """
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+@dataclass(slots=True)
+class Game:
+    """
+    One hosted game.
+
+    Attributes:
+        game_id (int): The id clients refer to the game by.
+        board_state (BoardState): The position, played in place.
+        lock (asyncio.Lock): Held while a command works on the game.
+        latency (LatencyStats): Latency of the commands on this game.
+    """
+    game_id: int
+    board_state: BoardState
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    latency: LatencyStats = field(default_factory=LatencyStats)
+
+
+@dataclass(slots=True)
+class ServerMetrics:
+    """
+    Counters over the server's lifetime.
+
+    Attributes:
+        games_started (int): Games created.
+        games_finished (int): Games that reached checkmate or a draw.
+        requests (int): Commands handled.
+        errors (int): Commands answered with an error.
+        latency (LatencyStats): Latency of every command.
+        recent (deque[float]): Latencies of the most recent commands, for percentiles.
+    """
+    games_started: int = 0
+    games_finished: int = 0
+    requests: int = 0
+    errors: int = 0
+    latency: LatencyStats = field(default_factory=LatencyStats)
+    recent: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Get a latency percentile, in seconds, over the most recent commands.
+        """
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def _play_text(board_state: BoardState, text: str) -> tuple[str, PositionStatus]:
+    legal_moves = board_state.evaluate_status().legal_moves
+    move = resolve_move(board_state, text, legal_moves)
+    san = play_move(board_state, move, legal_moves)
+    return san, board_state.evaluate_status()
+
+
+def _play_engine_move(board_state: BoardState, move: Move) -> tuple[str, PositionStatus]:
+    san = play_move(board_state, move, board_state.evaluate_status().legal_moves)
+    return san, board_state.evaluate_status()
+
+
+def search_fen(fen: str, movetime_ms: int) -> Move | None:
+    """
+    Search a position given as a FEN string, so the search can run in another process.
+
+    The position's earlier moves are not known to the search, so it cannot see repetitions.
+
+    Args:
+        fen (str): The position.
+        movetime_ms (int): Milliseconds to search for.
+
+    Returns:
+        Move | None: The best move, or None if there are no legal moves.
+    """
+    return find_best_move(BoardState.from_fen(fen), time_limit_ms=movetime_ms).best_move
+
+
+class GameServer:
+    """
+    Hosts games and answers protocol commands.
+
+    Args:
+        workers (int | None): Threads for move validation and playing (default: the ThreadPoolExecutor default).
+        engine_workers (int): Processes for engine searches. With 0, searches run in the thread pool.
+    """
+
+    def __init__(self, workers: int | None = None, engine_workers: int = 0):
+        self.games: dict[int, Game] = {}
+        self.metrics = ServerMetrics()
+        self._ids = itertools.count(1)
+        self._executor: Executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chess-game")
+        self._engine_executor: Executor = (
+            ProcessPoolExecutor(max_workers=engine_workers) if engine_workers else self._executor
+        )
+
+    @property
+    def active_games(self) -> int:
+        return len(self.games)
+
+    def close(self) -> None:
+        """
+        Shut down the worker pools.
+        """
+        self._executor.shutdown(cancel_futures=True)
+        if self._engine_executor is not self._executor:
+            self._engine_executor.shutdown(cancel_futures=True)
+
+    async def handle_line(self, line: str) -> str:
+        """
+        Carry out one protocol command.
+
+        Args:
+            line (str): The command, without the line ending.
+
+        Returns:
+            str: The reply, without the line ending.
+        """
+        start = time.perf_counter()
+        game = None
+        try:
+            command, *args = line.split(maxsplit=2) or [""]
+            if command == "new":
+                game = self._new_game(" ".join(args) or START_FEN)
+                reply = str(game.game_id)
+            elif command == "stats":
+                reply = self._stats(self._get_game(args[0]) if args else None)
+            else:
+                if not args:
+                    raise GameError(f"Expected a game id after {command!r}" if command else "Empty command")
+                game = self._get_game(args[0])
+                reply = await self._game_command(game, command, args[1:])
+        except GameError as e:
+            self.metrics.errors += 1
+            reply = f"error {e.message}"
+        else:
+            reply = f"ok {reply}" if reply else "ok"
+
+        elapsed = time.perf_counter() - start
+        self.metrics.requests += 1
+        self.metrics.latency.record(elapsed)
+        self.metrics.recent.append(elapsed)
+        if game is not None:
+            game.latency.record(elapsed)
+        return reply
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Answer the commands of one client until it quits or disconnects.
+        """
+        try:
+            while line := await reader.readline():
+                text = line.decode(errors="replace").strip()
+                if not text:
+                    continue
+                if text == "quit":
+                    break
+                writer.write((await self.handle_line(text)).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.Server:
+        """
+        Start listening for clients.
+
+        Returns:
+            asyncio.Server: The listening server.
+        """
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    def _new_game(self, fen: str) -> Game:
+        try:
+            board_state = BoardState.from_fen(fen, transposition_table=TranspositionTable(GAME_TT_SIZE))
+        except ValueError as e:
+            raise GameError(str(e)) from e
+
+        game = Game(next(self._ids), board_state)
+        self.games[game.game_id] = game
+        self.metrics.games_started += 1
+        return game
+
+    def _get_game(self, game_id: str) -> Game:
+        game = self.games.get(int(game_id)) if game_id.isdigit() else None
+        if game is None:
+            raise GameError(f"Unknown game {game_id}")
+        return game
+
+    async def _game_command(self, game: Game, command: str, args: list[str]) -> str:
+        loop = asyncio.get_running_loop()
+        board_state = game.board_state
+
+        async with game.lock:
+            if game.game_id not in self.games:
+                # Closed while this command waited for the lock
+                raise GameError(f"Unknown game {game.game_id}")
+
+            match command:
+                case "move" | "go":
+                    status = await loop.run_in_executor(self._executor, board_state.evaluate_status)
+                    if status.is_game_over:
+                        raise GameError(f"Game over: {status.status.value}")
+
+                    if command == "move":
+                        if not args:
+                            raise GameError("Expected a move")
+                        result = loop.run_in_executor(self._executor, _play_text, board_state, args[0])
+                    else:
+                        movetime = int(args[0]) if args and args[0].isdigit() else DEFAULT_MOVETIME_MS
+                        move = await loop.run_in_executor(
+                            self._engine_executor, search_fen, board_state.to_fen(), movetime
+                        )
+                        result = loop.run_in_executor(self._executor, _play_engine_move, board_state, move)
+
+                    try:
+                        san, status = await result
+                    except (InvalidNotation, PieceDoesNotExist, IllegalMove) as e:
+                        raise GameError(e.message) from e
+
+                    if status.is_game_over:
+                        self.metrics.games_finished += 1
+                    return f"{san} {status.status.value}"
+                case "moves":
+                    sans = await loop.run_in_executor(self._executor, legal_moves_to_san, board_state)
+                    return " ".join(sorted(sans.values()))
+                case "fen":
+                    return board_state.to_fen()
+                case "close":
+                    del self.games[game.game_id]
+                    return ""
+                case _:
+                    raise GameError(f"Unknown command {command!r}")
+
+    def _stats(self, game: Game | None) -> str:
+        if game is not None:
+            latency = game.latency
+            return (f"moves={len(game.board_state.move_history)} requests={latency.count} "
+                    f"mean_ms={latency.mean * 1000:.3f} max_ms={latency.max * 1000:.3f}")
+
+        metrics = self.metrics
+        return (f"active={self.active_games} started={metrics.games_started} finished={metrics.games_finished} "
+                f"requests={metrics.requests} errors={metrics.errors} "
+                f"mean_ms={metrics.latency.mean * 1000:.3f} p50_ms={metrics.percentile(0.5) * 1000:.3f} "
+                f"p99_ms={metrics.percentile(0.99) * 1000:.3f} max_ms={metrics.latency.max * 1000:.3f}")
+
+
+async def _serve_forever(server: GameServer, host: str, port: int) -> None:
+    listener = await server.serve(host, port)
+    print(f"Listening on {', '.join(str(sock.getsockname()) for sock in listener.sockets)}", file=sys.stderr)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chess_2.game.server", description="Host chess games over TCP.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on")
+    parser.add_argument("--workers", type=int, default=None, help="threads for move validation and playing")
+    parser.add_argument("--engine-workers", type=int, default=0,
+                        help="processes for engine searches (default: search in the thread pool)")
+    args = parser.parse_args(argv)
+
+    server = GameServer(args.workers, args.engine_workers)
+    try:
+        asyncio.run(_serve_forever(server, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,416 @@
+"""
+Perft (performance test) driver for the move generator.
+
+Perft walks the legal move tree to a fixed depth and counts the leaf nodes.
+Comparing the counts against published values catches move generation bugs,
+and timing the walk measures move generator throughput.
+
+Usage:
+    python -m chess_2.perft --depth 3
+    python -m chess_2.perft --fen "<fen>" --depth 2 --divide
+    python -m chess_2.perft --suite --max-depth 2
+    python -m chess_2.perft --backend mailbox --depth 3
+    python -m chess_2.perft --backend bitboard --suite --max-depth 3
+    python -m chess_2.perft --depth 4 --workers 4 --split-depth 2 --divide --compare-serial
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from chess_2.board.backends import BACKENDS, load_position
+from chess_2.board.board_state import BoardState
+from chess_2.utils.fen import START_FEN, move_to_str
+from chess_2.piece_movement.move_generator import get_legal_move_list
+from chess_2.bitboard import move_generator as bitboard
+from chess_2.bitboard.position import BitboardPosition
+
+
+@dataclass
+class PerftPosition:
+    """
+    A benchmark position with its published perft node counts.
+
+    Attributes:
+        name (str): A short name for the position.
+        fen (str): The FEN string of the position.
+        node_counts (dict[int, int]): Expected number of leaf nodes for each depth.
+    """
+    name: str
+    fen: str
+    node_counts: dict[int, int]
+
+
+# Node counts from https://www.chessprogramming.org/Perft_Results
+BENCHMARK_SUITE: list[PerftPosition] = [
+    PerftPosition(
+        name="start",
+        fen=START_FEN + " w KQkq - 0 1",
+        node_counts={1: 20, 2: 400, 3: 8902, 4: 197281, 5: 4865609},
+    ),
+    PerftPosition(
+        name="kiwipete",
+        fen="r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        node_counts={1: 48, 2: 2039, 3: 97862, 4: 4085603},
+    ),
+    PerftPosition(
+        name="rook_pawn_endgame",
+        fen="8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+        node_counts={1: 14, 2: 191, 3: 2812, 4: 43238, 5: 674624},
+    ),
+    PerftPosition(
+        name="promotion_endgame",
+        fen="n1n5/PPPk4/8/8/8/8/4Kppp/5N1N b - - 0 1",
+        node_counts={1: 24, 2: 496, 3: 9483, 4: 182838},
+    ),
+    PerftPosition(
+        name="position_4",
+        fen="r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+        node_counts={1: 6, 2: 264, 3: 9467, 4: 422333},
+    ),
+    PerftPosition(
+        name="position_5",
+        fen="rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+        node_counts={1: 44, 2: 1486, 3: 62379},
+    ),
+    PerftPosition(
+        name="position_6",
+        fen="r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+        node_counts={1: 46, 2: 2079, 3: 89890},
+    ),
+]
+
+
+@dataclass
+class PerftResult:
+    """
+    The outcome of a single timed perft run.
+
+    Attributes:
+        name (str): The name of the position searched.
+        depth (int): The depth searched.
+        nodes (int): The number of leaf nodes counted.
+        seconds (float): Wall-clock time taken.
+        expected (int | None): The published node count, if known.
+        error (str | None): The error raised by the move generator, if the run did not complete.
+    """
+    name: str
+    depth: int
+    nodes: int
+    seconds: float
+    expected: int | None = None
+    error: str | None = None
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.seconds if self.seconds > 0 else float("inf")
+
+    @property
+    def passed(self) -> bool:
+        return self.error is None and (self.expected is None or self.nodes == self.expected)
+
+
+def perft(board_state: BoardState, depth: int) -> int:
+    """
+    Count the leaf nodes of the legal move tree.
+
+    Args:
+        board_state (BoardState): The position to search from. It is restored before returning.
+        depth (int): The number of plies to search.
+
+    Returns:
+        int: The number of leaf nodes at the given depth.
+    """
+    if depth == 0:
+        return 1
+
+    moves = get_legal_move_list(board_state.player_turn, board_state.piece_pos, board_state.pieces, board_state.attacks)
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        undo = board_state.make_move(move)
+        nodes += perft(board_state, depth - 1)
+        board_state.unmake_move(undo)
+
+    return nodes
+
+
+def divide(board_state: BoardState, depth: int) -> dict[str, int]:
+    """
+    Count the leaf nodes below each root move.
+
+    Args:
+        board_state (BoardState): The position to search from. It is restored before returning.
+        depth (int): The number of plies to search, including the root move.
+
+    Returns:
+        dict[str, int]: Leaf node counts keyed by root move in long algebraic notation.
+    """
+    counts = {}
+    legal_moves = get_legal_move_list(board_state.player_turn, board_state.piece_pos, board_state.pieces, board_state.attacks)
+    for move in legal_moves:
+        undo = board_state.make_move(move)
+        counts[move_to_str(move)] = perft(board_state, depth - 1)
+        board_state.unmake_move(undo)
+
+    return counts
+
+
+def run_divide(fen: str, depth: int, backend: str = "dict", attack_maps: bool = False) -> dict[str, int]:
+    """
+    Run divide from a FEN string on the given backend.
+    """
+    board_state = load_position(fen, backend, attack_maps)
+
+    if backend == "bitboard":
+        return bitboard.divide(BitboardPosition.from_piece_loc(board_state.piece_pos, board_state.player_turn), depth)
+    return divide(board_state, depth)
+
+
+def run_perft(fen: str, depth: int, name: str = "custom", expected: int | None = None,
+              backend: str = "dict", attack_maps: bool = False) -> PerftResult:
+    """
+    Time a perft run from a FEN string on the given backend.
+    """
+    board_state = load_position(fen, backend, attack_maps)
+
+    start = time.perf_counter()
+    if backend == "bitboard":
+        nodes = bitboard.perft(BitboardPosition.from_piece_loc(board_state.piece_pos, board_state.player_turn), depth)
+    else:
+        nodes = perft(board_state, depth)
+    seconds = time.perf_counter() - start
+
+    return PerftResult(name=name, depth=depth, nodes=nodes, seconds=seconds, expected=expected)
+
+
+def run_benchmark(max_depth: int, positions: list[PerftPosition] = BENCHMARK_SUITE,
+                  backend: str = "dict", attack_maps: bool = False) -> list[PerftResult]:
+    """
+    Run every position of the suite at each known depth up to max_depth.
+
+    A position whose run raises is recorded as a failed result and skipped at deeper depths,
+    so one broken position does not hide the results of the rest of the suite.
+
+    Args:
+        max_depth (int): The deepest depth to run.
+        positions (list[PerftPosition]): The positions to run.
+        backend (str): The board representation to use, one of BACKENDS.
+        attack_maps (bool): Keep incremental attack maps on the board state.
+
+    Returns:
+        list[PerftResult]: One result per position and depth.
+    """
+    results = []
+    for position in positions:
+        for depth, expected in sorted(position.node_counts.items()):
+            if depth > max_depth:
+                break
+            try:
+                results.append(run_perft(position.fen, depth, name=position.name, expected=expected,
+                                         backend=backend, attack_maps=attack_maps))
+            except Exception as e:
+                results.append(PerftResult(name=position.name, depth=depth, nodes=0, seconds=0.0,
+                                           expected=expected, error=f"{type(e).__name__}: {e}"))
+                break
+
+    return results
+
+
+@dataclass
+class ParallelPerftResult:
+    """
+    The outcome of a perft run split across worker processes.
+
+    Attributes:
+        counts (dict[str, int]): Leaf node counts keyed by root move, merged from every work unit.
+        depth (int): The depth searched.
+        workers (int): The number of worker processes.
+        work_units (int): The number of work units the tree was split into.
+        seconds (float): Wall time of the parallel run.
+        serial_seconds (float | None): Wall time of the serial run, if one was timed for comparison.
+    """
+    counts: dict[str, int]
+    depth: int
+    workers: int
+    work_units: int
+    seconds: float
+    serial_seconds: float | None = None
+
+    @property
+    def nodes(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def speedup(self) -> float | None:
+        if self.serial_seconds is None or self.seconds <= 0:
+            return None
+        return self.serial_seconds / self.seconds
+
+
+def _play_path(fen: str, path: tuple[str, ...], backend: str) -> BoardState | BitboardPosition:
+    """
+    Rebuild the position from a FEN string and play a sequence of moves in long algebraic notation.
+    """
+    board_state = load_position(fen, backend)
+
+    if backend == "bitboard":
+        position = BitboardPosition.from_piece_loc(board_state.piece_pos, board_state.player_turn)
+        for text in path:
+            move = next(m for m in bitboard.generate_legal_moves(position) if bitboard.move_to_str(m) == text)
+            position.make_move(move)
+        return position
+
+    for text in path:
+        legal_moves = get_legal_move_list(board_state.player_turn, board_state.piece_pos, board_state.pieces)
+        move = next(m for m in legal_moves if move_to_str(m) == text)
+        board_state.make_move(move)
+    return board_state
+
+
+def _legal_move_strings(fen: str, path: tuple[str, ...], backend: str) -> list[str]:
+    position = _play_path(fen, path, backend)
+    if backend == "bitboard":
+        return [bitboard.move_to_str(move) for move in bitboard.generate_legal_moves(position)]
+    return [move_to_str(move) for move in get_legal_move_list(position.player_turn, position.piece_pos, position.pieces)]
+
+
+def _perft_work_unit(fen: str, path: tuple[str, ...], depth: int, backend: str) -> int:
+    """
+    Count the leaf nodes below a path of moves; run in a worker process.
+    """
+    position = _play_path(fen, path, backend)
+    if backend == "bitboard":
+        return bitboard.perft(position, depth - len(path))
+    return perft(position, depth - len(path))
+
+
+def parallel_divide(fen: str, depth: int, workers: int | None = None, split_depth: int = 1,
+                    backend: str = "dict") -> ParallelPerftResult:
+    """
+    Run divide with the move tree split into work units executed in a process pool.
+
+    Each work unit is the subtree below one root move (split_depth=1) or below one root
+    move and reply (split_depth=2). Workers rebuild the board from the FEN string and play
+    the unit's moves themselves, so only strings cross process boundaries. Splitting at
+    the second ply gives many more, smaller units, which balances the load better when a
+    few root moves dominate the tree.
+
+    Args:
+        fen (str): The FEN string of the position.
+        depth (int): The number of plies to search, including the root move.
+        workers (int | None): Number of worker processes (default: one per CPU).
+        split_depth (int): How many plies to split the tree at: 1 or 2.
+        backend (str): The board representation to use, one of BACKENDS.
+
+    Returns:
+        ParallelPerftResult: The merged per-root-move counts and timing.
+    """
+    if split_depth not in (1, 2):
+        raise ValueError(f"split_depth must be 1 or 2, got {split_depth}")
+
+    workers = workers or os.cpu_count() or 1
+    split_depth = min(split_depth, depth)
+    start = time.perf_counter()
+
+    root_moves = _legal_move_strings(fen, (), backend)
+    paths = [(move,) for move in root_moves]
+    if split_depth == 2:
+        paths = [path + (reply,) for path in paths for reply in _legal_move_strings(fen, path, backend)]
+
+    # A few chunks per worker keeps the pool busy without paying a round trip per small unit
+    chunksize = max(1, len(paths) // (workers * 4))
+
+    counts = dict.fromkeys(root_moves, 0)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        nodes = executor.map(_perft_work_unit, [fen] * len(paths), paths, [depth] * len(paths), [backend] * len(paths),
+                             chunksize=chunksize)
+        for path, unit_nodes in zip(paths, nodes):
+            counts[path[0]] += unit_nodes
+
+    return ParallelPerftResult(
+        counts=counts,
+        depth=depth,
+        workers=workers,
+        work_units=len(paths),
+        seconds=time.perf_counter() - start,
+    )
+
+
+def format_result(result: PerftResult) -> str:
+    if result.error is not None:
+        return f"{result.name:<20} depth {result.depth}  ERROR {result.error}"
+
+    status = "ok" if result.passed else f"FAIL (expected {result.expected})"
+    return (
+        f"{result.name:<20} depth {result.depth}  nodes {result.nodes:>10}  "
+        f"time {result.seconds:8.3f}s  nps {result.nodes_per_second:>12,.0f}  {status}"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chess_2.perft", description="Run perft on the move generator.")
+    parser.add_argument("--fen", default=START_FEN + " w KQkq - 0 1", help="position to search (default: start position)")
+    parser.add_argument("--depth", type=int, default=3, help="depth to search")
+    parser.add_argument("--divide", action="store_true", help="print the node count below each root move")
+    parser.add_argument("--suite", action="store_true", help="run the benchmark suite instead of a single position")
+    parser.add_argument("--max-depth", type=int, default=2, help="deepest depth to run in the benchmark suite")
+    parser.add_argument("--backend", choices=BACKENDS, default="dict", help="board representation to use")
+    parser.add_argument("--workers", type=int, default=None, help="split the tree across this many worker processes")
+    parser.add_argument("--split-depth", type=int, choices=(1, 2), default=1, help="plies to split the tree at with --workers")
+    parser.add_argument("--compare-serial", action="store_true", help="also time a serial run and report the speedup")
+    parser.add_argument("--attack-maps", action="store_true",
+                        help="keep incremental attack maps on the board (dict and mailbox backends)")
+    args = parser.parse_args(argv)
+
+    if args.workers is not None:
+        result = parallel_divide(args.fen, args.depth, args.workers, args.split_depth, args.backend)
+        if args.compare_serial:
+            start = time.perf_counter()
+            serial_counts = run_divide(args.fen, args.depth, args.backend)
+            result.serial_seconds = time.perf_counter() - start
+            if serial_counts != result.counts:
+                print("parallel counts differ from the serial run", file=sys.stderr)
+                return 1
+
+        if args.divide:
+            for move, nodes in sorted(result.counts.items()):
+                print(f"{move}: {nodes}")
+            print()
+
+        print(f"moves {len(result.counts)}  nodes {result.nodes}  workers {result.workers}  "
+              f"work units {result.work_units}  time {result.seconds:.3f}s  nps {result.nodes / result.seconds:,.0f}")
+        if result.speedup is not None:
+            print(f"serial time {result.serial_seconds:.3f}s  speedup {result.speedup:.2f}x")
+        return 0
+
+    if args.suite:
+        results = run_benchmark(args.max_depth, backend=args.backend, attack_maps=args.attack_maps)
+        for result in results:
+            print(format_result(result))
+
+        total_nodes = sum(result.nodes for result in results)
+        total_seconds = sum(result.seconds for result in results)
+        print(f"total nodes {total_nodes}  time {total_seconds:.3f}s  nps {total_nodes / total_seconds:,.0f}")
+        return 0 if all(result.passed for result in results) else 1
+
+    if args.divide:
+        start = time.perf_counter()
+        counts = run_divide(args.fen, args.depth, args.backend, args.attack_maps)
+        seconds = time.perf_counter() - start
+
+        for move, nodes in sorted(counts.items()):
+            print(f"{move}: {nodes}")
+        print(f"\nmoves {len(counts)}  nodes {sum(counts.values())}  time {seconds:.3f}s")
+        return 0
+
+    print(format_result(run_perft(args.fen, args.depth, backend=args.backend, attack_maps=args.attack_maps)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 
-from chess_2.utils.types import Position
+from chess_2.utils.types import Position, SQUARES
 from chess_2.utils.enums import Color, PieceType
 from chess_2.board.board_representation import get_piece_repr
 
-@dataclass
+@dataclass(slots=True)
 class Piece:
     position: Position 
     color: Color
@@ -18,3 +18,53 @@ class Piece:
         Get the string representation of the piece.
         """
         return get_piece_repr(self.color, self.piece_type)
+
+
+class _EmptySquare(Piece):
+    """
+    An empty square shared by every board. Assigning to it raises AttributeError, as a change
+    would show up on every board at once; moves replace the empty square instead.
+    """
+    __slots__ = ()
+
+    def __init__(self, position: Position):
+        object.__setattr__(self, "position", position)
+        object.__setattr__(self, "color", Color.NONE)
+        object.__setattr__(self, "piece_type", PieceType.EMPTY)
+        object.__setattr__(self, "has_moved", False)
+        object.__setattr__(self, "en_passantable", False)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"The shared empty square at {self.position} cannot be modified")
+
+    def __eq__(self, other) -> bool:
+        # Equal to an ordinary empty Piece on the same square
+        if not isinstance(other, Piece):
+            return NotImplemented
+        return (other.position, other.color, other.piece_type, other.has_moved, other.en_passantable) == (
+            self.position, Color.NONE, PieceType.EMPTY, False, False
+        )
+
+    def __reduce__(self):
+        return empty_square, (self.position,)
+
+
+# One shared, immutable empty piece per square, so every board can point at the
+# same objects instead of allocating 32+ of its own.
+EMPTY_SQUARES: dict[Position, Piece] = {pos: _EmptySquare(pos) for pos in SQUARES}
+
+
+def empty_square(pos: Position) -> Piece:
+    """
+    Get the shared empty piece for a square.
+
+    Args:
+        pos (Position): The square.
+
+    Returns:
+        Piece: An EMPTY piece with no color, shared by every board. It cannot be modified.
+    """
+    piece = EMPTY_SQUARES.get(pos)
+    if piece is None:
+        piece = Piece(position=Position(*pos), color=Color.NONE, piece_type=PieceType.EMPTY)
+    return piece
@@ -3,41 +3,37 @@ from chess_2.piece.piece import Piece
 from chess_2.utils.types import Position
 from chess_2.utils.enums import Color
 from chess_2.piece_movement.piece_move import PieceMovement
-from chess_2.utils.move_validation import (
-    is_within_board,
-    is_occupied_by_ally,
-
-)
+from chess_2.board.mailbox import MailboxBoard, KING_OFFSETS
+from chess_2.piece_movement.lookup_tables import KING_TARGETS
 from chess_2.utils.move_validation import can_castle_kingside, can_castle_queenside
+from chess_2.board.attack_maps import AttackMaps
 
 class KingMovement(PieceMovement):
     """
     Defines movement rules for the king piece.
+
+    Args:
+        piece (Piece): The king.
+        attacks (AttackMaps | None): Attack maps to check the castling path against, instead of scanning the board.
     """
+    def __init__(self, piece: Piece, attacks: AttackMaps | None = None):
+        super().__init__(piece)
+        self.attacks = attacks
+
     def get_potential_moves(self, piece_loc: Dict[Position, Piece]) -> List[Position]:
-        directions = [
-            (1, 0), (-1, 0), (0, 1), (0, -1),  # vertical/horizontal
-            (1, 1), (1, -1), (-1, 1), (-1, -1)  # diagonal
-        ]
-        potential_moves = []
         row, col = self.piece.position
 
-        for dx, dy in directions:
-            new_row = row + dx
-            new_col = col + dy
-            next_pos = Position(new_row, new_col)
-
-            if not is_within_board(next_pos):
-                continue
+        if isinstance(piece_loc, MailboxBoard):
+            potential_moves = piece_loc.step_targets(self.piece.position, KING_OFFSETS, self.piece.color)
 
-            if not is_occupied_by_ally(piece_loc, next_pos, self.piece.color):
-                potential_moves.append(next_pos)
+        else:
+            potential_moves = self._step_targets(piece_loc, KING_TARGETS[self.piece.position])
 
         # Castling checks
-        if can_castle_kingside(self.piece.color, piece_loc):
+        if can_castle_kingside(self.piece.color, piece_loc, self.attacks):
             potential_moves.append(Position(row, 6))  # g1 or g8
 
-        if can_castle_queenside(self.piece.color, piece_loc):
+        if can_castle_queenside(self.piece.color, piece_loc, self.attacks):
             potential_moves.append(Position(row, 2))  # c1 or c8
 
         return potential_moves
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""
+Precomputed move and ray tables for every square.
+
+Built once at import time, so movement code iterates ready-made lists of
+on-board squares instead of stepping through (row, col) offsets and bounds
+checking each step. All positions are the shared ones from SQUARES.
+
+BUILD_TIME records how long building the tables took, in seconds.
+"""
+import time
+
+from chess_2.utils.enums import Color
+from chess_2.utils.types import Position, SQUARES
+
+KNIGHT_DIRECTIONS = [(2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1)]
+KING_DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+ROOK_DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+BISHOP_DIRECTIONS = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+QUEEN_DIRECTIONS = ROOK_DIRECTIONS + [(1, 1), (-1, -1), (1, -1), (-1, 1)]
+
+# Row direction a pawn of each color moves in, and the row it starts on
+PAWN_DIRECTION: dict[Color, int] = {Color.WHITE: -1, Color.BLACK: 1}
+PAWN_START_ROW: dict[Color, int] = {Color.WHITE: 6, Color.BLACK: 1}
+
+
+def _square(row: int, col: int) -> Position | None:
+    return SQUARES[row * 8 + col] if 0 <= row < 8 and 0 <= col < 8 else None
+
+
+def _step_table(directions: list[tuple[int, int]]) -> dict[Position, tuple[Position, ...]]:
+    table = {}
+    for pos in SQUARES:
+        targets = (_square(pos.row + dx, pos.col + dy) for dx, dy in directions)
+        table[pos] = tuple(target for target in targets if target is not None)
+    return table
+
+
+def _ray(pos: Position, dx: int, dy: int) -> tuple[Position, ...]:
+    ray = []
+    target = _square(pos.row + dx, pos.col + dy)
+    while target is not None:
+        ray.append(target)
+        target = _square(target.row + dx, target.col + dy)
+    return tuple(ray)
+
+
+def _ray_table(directions: list[tuple[int, int]]) -> dict[Position, tuple[tuple[Position, ...], ...]]:
+    # Empty rays (pointing off the board) are dropped
+    return {
+        pos: tuple(ray for ray in (_ray(pos, dx, dy) for dx, dy in directions) if ray)
+        for pos in SQUARES
+    }
+
+
+def _pawn_push_table(color: Color) -> dict[Position, tuple[Position, ...]]:
+    """
+    The squares a pawn advances to: one step, plus a second step from its starting row.
+    """
+    table = {}
+    direction = PAWN_DIRECTION[color]
+    for pos in SQUARES:
+        pushes = []
+        one_forward = _square(pos.row + direction, pos.col)
+        if one_forward is not None:
+            pushes.append(one_forward)
+            if pos.row == PAWN_START_ROW[color]:
+                pushes.append(_square(pos.row + 2 * direction, pos.col))
+        table[pos] = tuple(pushes)
+    return table
+
+
+def _pawn_capture_table(color: Color) -> dict[Position, tuple[Position, ...]]:
+    direction = PAWN_DIRECTION[color]
+    return _step_table([(direction, -1), (direction, 1)])
+
+
+_start = time.perf_counter()
+
+KNIGHT_TARGETS: dict[Position, tuple[Position, ...]] = _step_table(KNIGHT_DIRECTIONS)
+KING_TARGETS: dict[Position, tuple[Position, ...]] = _step_table(KING_DIRECTIONS)
+
+# PAWN_PUSHES[color][pos] and PAWN_CAPTURES[color][pos]: squares for a pawn of that color on pos
+PAWN_PUSHES: dict[Color, dict[Position, tuple[Position, ...]]] = {
+    color: _pawn_push_table(color) for color in (Color.WHITE, Color.BLACK)
+}
+PAWN_CAPTURES: dict[Color, dict[Position, tuple[Position, ...]]] = {
+    color: _pawn_capture_table(color) for color in (Color.WHITE, Color.BLACK)
+}
+
+# Rays ordered outward from the square, one per direction that stays on the board
+ROOK_RAYS: dict[Position, tuple[tuple[Position, ...], ...]] = _ray_table(ROOK_DIRECTIONS)
+BISHOP_RAYS: dict[Position, tuple[tuple[Position, ...], ...]] = _ray_table(BISHOP_DIRECTIONS)
+QUEEN_RAYS: dict[Position, tuple[tuple[Position, ...], ...]] = _ray_table(QUEEN_DIRECTIONS)
+
+BUILD_TIME: float = time.perf_counter() - _start
@@ -1,6 +1,6 @@
-import copy
+from collections.abc import Iterator
 
-from chess_2.utils.types import Position
+from chess_2.utils.types import Position, Move
 from chess_2.piece.piece import Piece
 from chess_2.utils.enums import Color, PieceType
 
@@ -10,40 +10,76 @@ from chess_2.piece_movement.knight import KnightMovement
 from chess_2.piece_movement.queen import QueenMovement
 from chess_2.piece_movement.king import KingMovement
 from chess_2.piece_movement.pawn import PawnMovement
+from chess_2.piece_movement.piece_move import PieceMovement
+from chess_2.board.move_execution import PROMOTION_PIECE_TYPES, is_promotion, make_move, unmake_move
+from chess_2.board.mailbox import MailboxBoard
+from chess_2.board.piece_lists import PieceLists
+from chess_2.board.attack_maps import AttackMaps
+from chess_2.piece_movement.lookup_tables import (
+    KNIGHT_TARGETS,
+    KING_TARGETS,
+    PAWN_CAPTURES,
+    ROOK_RAYS,
+    BISHOP_RAYS,
+)
+
+def get_piece_movement(piece: Piece) -> PieceMovement | None:
+    """
+    Gets the movement rules for a piece.
+
+    Args:
+        piece (Piece): The piece to get movement rules for.
 
-def get_all_potential_moves(color: Color, piece_loc: dict[Position, Piece]) -> list[tuple[Piece, list[Position]]]:
+    Returns:
+        PieceMovement | None: The movement rules, or None for an empty square.
+    """
+    match piece.piece_type:
+        case PieceType.ROOK:
+            return RookMovement(piece)
+        case PieceType.BISHOP:
+            return BishopMovement(piece)
+        case PieceType.KNIGHT:
+            return KnightMovement(piece)
+        case PieceType.QUEEN:
+            return QueenMovement(piece)
+        case PieceType.KING:
+            return KingMovement(piece)
+        case PieceType.PAWN:
+            return PawnMovement(piece)
+        case _: # _ is a wildcard — it matches anything not explicitly matched earlier.
+            return None
+
+def _pieces_of(color: Color, piece_loc: dict[Position, Piece], pieces: PieceLists | None = None) -> list[Piece]:
+    """
+    Get the pieces of one color, from the piece lists when given, otherwise by scanning the board.
+    """
+    if pieces is not None:
+        return pieces.pieces(color)
+    return [piece for piece in piece_loc.values() if piece.color == color and piece.piece_type != PieceType.EMPTY]
+
+def get_all_potential_moves(
+    color: Color,
+    piece_loc: dict[Position, Piece],
+    pieces: PieceLists | None = None
+) -> list[tuple[Piece, list[Position]]]:
     """
     Gets all potential moves for the given color on the current board.
 
     Args:
         color (Color): The color of the player to generate moves for.
         piece_loc (dict[Position, Piece]): The current board state.
+        pieces (PieceLists | None): The board's piece lists, to avoid scanning every square.
 
     Returns:
         list of tuples: Each tuple is (piece, [list of potential target Positions])
     """
     potential_moves = []
 
-    for piece in piece_loc.values():
-        if piece.color != color or piece.piece_type == PieceType.EMPTY:
+    for piece in _pieces_of(color, piece_loc, pieces):
+        movement = get_piece_movement(piece)
+        if movement is None:
             continue
 
-        match piece.piece_type:
-            case PieceType.ROOK:
-                movement = RookMovement(piece)
-            case PieceType.BISHOP:
-                movement = BishopMovement(piece)
-            case PieceType.KNIGHT:
-                movement = KnightMovement(piece)
-            case PieceType.QUEEN:
-                movement = QueenMovement(piece)
-            case PieceType.KING:
-                movement = KingMovement(piece)
-            case PieceType.PAWN:
-                movement = PawnMovement(piece)
-            case _: # _ is a wildcard — it matches anything not explicitly matched earlier.
-                continue 
-
         moves = movement.get_potential_moves(piece_loc)
         if moves:
             potential_moves.append((piece, moves))
@@ -51,85 +87,447 @@ def get_all_potential_moves(color: Color, piece_loc: dict[Position, Piece]) -> l
     return potential_moves
 
 
-def get_all_valid_moves(color: Color, piece_loc: dict[Position, Piece]) -> list[tuple[Piece, list[Position]]]:
+def get_all_valid_moves(
+    color: Color,
+    piece_loc: dict[Position, Piece],
+    simulate: bool = False,
+    pieces: PieceLists | None = None,
+    attacks: AttackMaps | None = None
+) -> list[tuple[Piece, list[Position]]]:
     """
     Gets all valid moves for the given color on the current board.
 
+    By default checks and pins are computed once from the king's position and used to
+    filter each piece's potential moves directly. Only king moves and en passant captures
+    are simulated on the board.
+
     Args:
         color (Color): The color of the player to generate moves for.
         piece_loc (dict[Position, Piece]): The current board state.
+        simulate (bool): Simulate every potential move instead of using checks and pins.
+        pieces (PieceLists | None): The board's piece lists, to avoid scanning every square.
+        attacks (AttackMaps | None): The board's attack maps. When the king is not in check,
+            king moves and castling are then checked against them instead of being simulated.
 
     Returns:
         list of tuples: Each tuple is (piece, [list of valid target Positions])
     """
-    valid_moves = []
-
-    for piece in piece_loc.values():
-        if piece.color != color or piece.piece_type == PieceType.EMPTY:
+    return list(_iter_all_valid_moves(color, piece_loc, simulate, pieces, attacks))
+
+def _iter_all_valid_moves(
+    color: Color,
+    piece_loc: dict[Position, Piece],
+    simulate: bool = False,
+    pieces: PieceLists | None = None,
+    attacks: AttackMaps | None = None
+) -> Iterator[tuple[Piece, list[Position]]]:
+    """
+    Yield (piece, valid target Positions) for each piece with a move, one piece at a time,
+    so callers that only need to know whether a move exists can stop at the first one.
+    """
+    if simulate:
+        king = None
+    else:
+        king = pieces.king(color) if pieces is not None else find_king(color, piece_loc)
+    if king is None:
+        yield from _iter_simulated_moves(color, piece_loc, pieces)
+        return
+
+    checks, pins = get_checks_and_pins(king, piece_loc)
+
+    # The pieces are a snapshot, as king moves are simulated on piece_loc
+    for piece in _pieces_of(color, piece_loc, pieces):
+        movement = get_piece_movement(piece)
+        if movement is None:
             continue
 
-        match piece.piece_type:
-            case PieceType.ROOK:
-                movement = RookMovement(piece)
-            case PieceType.BISHOP:
-                movement = BishopMovement(piece)
-            case PieceType.KNIGHT:
-                movement = KnightMovement(piece)
-            case PieceType.QUEEN:
-                movement = QueenMovement(piece)
-            case PieceType.KING:
-                movement = KingMovement(piece)
-            case PieceType.PAWN:
-                movement = PawnMovement(piece)
-            case _: # _ is a wildcard — it matches anything not explicitly matched earlier.
-                continue 
+        if piece is king:
+            moves = _get_king_moves(king, movement, piece_loc, checks, attacks)
+
+        elif len(checks) > 1:
+            continue  # Only the king can answer a double check
+
+        else:
+            moves = _filter_by_checks_and_pins(
+                piece, movement.get_potential_moves(piece_loc), checks, pins, piece_loc, king
+            )
+
+        if moves:
+            yield piece, moves
+
+def _iter_simulated_moves(
+    color: Color,
+    piece_loc: dict[Position, Piece],
+    pieces: PieceLists | None = None
+) -> Iterator[tuple[Piece, list[Position]]]:
+    # The pieces are a snapshot, as legality checks temporarily make moves on piece_loc
+    for piece in _pieces_of(color, piece_loc, pieces):
+        movement = get_piece_movement(piece)
+        if movement is None:
+            continue
 
         moves = movement.get_valid_moves(piece_loc)
         if moves:
-            valid_moves.append((piece, moves))
+            yield piece, moves
+
+def _get_king_moves(
+    king: Piece,
+    movement: PieceMovement,
+    piece_loc: dict[Position, Piece],
+    checks: list[set[Position]],
+    attacks: AttackMaps | None = None,
+    captures_only: bool = False
+) -> list[Position]:
+    if attacks is None or checks:
+        if not captures_only:
+            return movement.get_valid_moves(piece_loc)
+        # Only the captures are simulated
+        return [
+            to_pos for to_pos in movement.get_potential_moves(piece_loc)
+            if piece_loc[to_pos].piece_type != PieceType.EMPTY
+            and not is_king_in_check_after_move(king, to_pos, piece_loc)
+        ]
+
+    # Out of check, no slider's ray runs through the king, so a square the opponent does not
+    # attack now stays unattacked once the king steps onto it
+    opp_color = Color.BLACK if king.color == Color.WHITE else Color.WHITE
+    return [
+        to_pos for to_pos in KingMovement(king, attacks).get_potential_moves(piece_loc)
+        if not attacks.is_attacked(to_pos, opp_color)
+    ]
+
+def _get_allowed_squares(
+    piece: Piece, checks: list[set[Position]], pins: dict[Position, set[Position]]
+) -> set[Position] | None:
+    """
+    Get the squares a non-king piece may move to under the current check and its pin, or None if unrestricted.
+    """
+    allowed = pins.get(piece.position)
+    if checks:
+        allowed = checks[0] if allowed is None else allowed & checks[0]
+    return allowed
+
+def _moves_to(piece: Piece, to_pos: Position) -> tuple[Move, ...]:
+    """
+    Get the moves of the piece to to_pos: one per promotion piece for a promoting pawn, otherwise just the one.
+    """
+    if is_promotion(piece, to_pos):
+        return tuple(Move(piece.position, to_pos, promotion) for promotion in PROMOTION_PIECE_TYPES)
+    return (Move(piece.position, to_pos),)
+
+def _is_tactical(piece: Piece, to_pos: Position, piece_loc: dict[Position, Piece]) -> bool:
+    """
+    Check whether moving the piece to to_pos captures (en passant included) or promotes.
+    """
+    if piece_loc[to_pos].piece_type != PieceType.EMPTY:
+        return True
+    return piece.piece_type == PieceType.PAWN and (to_pos.col != piece.position.col or is_promotion(piece, to_pos))
+
+def _is_en_passant_capture(piece: Piece, to_pos: Position, piece_loc: dict[Position, Piece]) -> bool:
+    # En passant removes a pawn from a square other than to_pos, which the pin and check
+    # sets do not account for (e.g. a discovered check along the rank), so it is simulated.
+    return (piece.piece_type == PieceType.PAWN and to_pos.col != piece.position.col
+            and piece_loc[to_pos].piece_type == PieceType.EMPTY)
+
+def _filter_by_checks_and_pins(
+    piece: Piece,
+    potential_moves: list[Position],
+    checks: list[set[Position]],
+    pins: dict[Position, set[Position]],
+    piece_loc: dict[Position, Piece],
+    king: Piece | None = None
+) -> list[Position]:
+    allowed = _get_allowed_squares(piece, checks, pins)
+
+    moves = []
+    for to_pos in potential_moves:
+        if _is_en_passant_capture(piece, to_pos, piece_loc):
+            if not is_king_in_check_after_move(piece, to_pos, piece_loc, king):
+                moves.append(to_pos)
+
+        elif allowed is None or to_pos in allowed:
+            moves.append(to_pos)
+
+    return moves
+
+def iter_legal_moves(
+    color: Color,
+    piece_loc: dict[Position, Piece],
+    pieces: PieceLists | None = None,
+    attacks: AttackMaps | None = None,
+    from_pos: Position | None = None,
+    captures_only: bool = False
+) -> Iterator[Move]:
+    """
+    Yield the legal moves for the given color one at a time, cheapest to verify first.
+
+    Moves of pieces other than the king come first, as checks and pins settle them with a
+    set lookup. King moves follow, as they are simulated on the board (or checked against
+    the attack maps when out of check), and en passant captures, always simulated, come last.
+    Each piece's moves are only generated when the iteration reaches it, so a caller that
+    stops early, e.g. to learn whether any move exists, skips the rest of the work.
+
+    The board must not be changed while the iteration is in progress.
+
+    Args:
+        color (Color): The color of the player to generate moves for.
+        piece_loc (dict[Position, Piece]): The current board state.
+        pieces (PieceLists | None): The board's piece lists, to avoid scanning every square.
+        attacks (AttackMaps | None): The board's attack maps, to check king moves against.
+        from_pos (Position | None): Only yield the moves of the piece on this square.
+        captures_only (bool): Only yield captures and promotions. Quiet moves are dropped before
+            their legality is checked, so this is much cheaper than filtering the full list.
+
+    Yields:
+        Move: Each legal (from_pos, to_pos, promotion) move; a promoting pawn yields one move per promotion piece.
+    """
+    color_pieces = _pieces_of(color, piece_loc, pieces)
+    if from_pos is not None:
+        color_pieces = [piece for piece in color_pieces if piece.position == from_pos]
+
+    king = pieces.king(color) if pieces is not None else find_king(color, piece_loc)
+    if king is None:
+        for piece in color_pieces:
+            movement = get_piece_movement(piece)
+            for to_pos in movement.get_valid_moves(piece_loc) if movement is not None else ():
+                if not captures_only or _is_tactical(piece, to_pos, piece_loc):
+                    yield from _moves_to(piece, to_pos)
+        return
+
+    checks, pins = get_checks_and_pins(king, piece_loc)
+    en_passant_captures = []
+
+    if len(checks) <= 1:  # Only the king can answer a double check
+        for piece in color_pieces:
+            movement = get_piece_movement(piece)
+            if piece is king or movement is None:
+                continue
+
+            allowed = _get_allowed_squares(piece, checks, pins)
+            for to_pos in movement.get_potential_moves(piece_loc):
+                if captures_only and not _is_tactical(piece, to_pos, piece_loc):
+                    continue
+                if _is_en_passant_capture(piece, to_pos, piece_loc):
+                    en_passant_captures.append(Move(piece.position, to_pos))
+                elif allowed is None or to_pos in allowed:
+                    yield from _moves_to(piece, to_pos)
+
+    if any(piece is king for piece in color_pieces):
+        for to_pos in _get_king_moves(king, get_piece_movement(king), piece_loc, checks, attacks, captures_only):
+            if not captures_only or _is_tactical(king, to_pos, piece_loc):
+                yield Move(king.position, to_pos)
+
+    for move in en_passant_captures:
+        if not is_king_in_check_after_move(piece_loc[move.from_pos], move.to_pos, piece_loc, king):
+            yield move
+
+def get_legal_move_list(
+    color: Color,
+    piece_loc: dict[Position, Piece],
+    pieces: PieceLists | None = None,
+    attacks: AttackMaps | None = None
+) -> list[Move]:
+    """
+    Gets all valid moves for the given color as a flat list of moves.
+
+    Args:
+        color (Color): The color of the player to generate moves for.
+        piece_loc (dict[Position, Piece]): The current board state.
+        pieces (PieceLists | None): The board's piece lists, to avoid scanning every square.
+        attacks (AttackMaps | None): The board's attack maps, to check king moves against.
+
+    Returns:
+        list[Move]: Every valid (from_pos, to_pos, promotion) move, with one move per promotion piece for a promoting pawn.
+    """
+    return [
+        move
+        for piece, destinations in get_all_valid_moves(color, piece_loc, pieces=pieces, attacks=attacks)
+        for to_pos in destinations
+        for move in _moves_to(piece, to_pos)
+    ]
+
+def get_legal_captures(
+    color: Color,
+    piece_loc: dict[Position, Piece],
+    pieces: PieceLists | None = None,
+    attacks: AttackMaps | None = None
+) -> list[Move]:
+    """
+    Gets the legal captures (en passant included) and promotions for the given color.
 
-    return valid_moves
+    Args:
+        color (Color): The color of the player to generate moves for.
+        piece_loc (dict[Position, Piece]): The current board state.
+        pieces (PieceLists | None): The board's piece lists, to avoid scanning every square.
+        attacks (AttackMaps | None): The board's attack maps, to check king moves against.
 
-def has_valid_moves(color: Color, piece_loc: dict[Position, Piece]) -> bool:
+    Returns:
+        list[Move]: Every legal capture and promotion, with one move per promotion piece.
     """
-    Checks if any piece of the given color has at least one potential move.
+    return list(iter_legal_moves(color, piece_loc, pieces, attacks, captures_only=True))
+
+def has_valid_moves(
+    color: Color,
+    piece_loc: dict[Position, Piece],
+    simulate: bool = False,
+    pieces: PieceLists | None = None,
+    attacks: AttackMaps | None = None
+) -> bool:
+    """
+    Checks if any piece of the given color has at least one valid move.
+
+    Stops at the first valid move found, trying the cheapest to verify first (see iter_legal_moves).
 
     Returns:
-        bool: True if there is at least one potential move, False otherwise.
+        bool: True if there is at least one valid move, False otherwise.
     """
-    return bool(get_all_valid_moves(color, piece_loc)) # Python treats empty containers as False
+    if simulate:
+        return next(_iter_simulated_moves(color, piece_loc, pieces), None) is not None
+    return next(iter_legal_moves(color, piece_loc, pieces, attacks), None) is not None
+
+
+def _is_attacker(piece: Piece | None, color: Color, piece_types: tuple[PieceType, ...]) -> bool:
+    return piece is not None and piece.color == color and piece.piece_type in piece_types
 
+def _is_attacked_along_rays(
+    rays: tuple[tuple[Position, ...], ...],
+    color: Color,
+    piece_types: tuple[PieceType, ...],
+    piece_loc: dict[Position, Piece]
+) -> bool:
+    for ray in rays:
+        for next_pos in ray:
+            piece = piece_loc.get(next_pos)
+            if piece is not None and piece.piece_type != PieceType.EMPTY:
+                if piece.color == color and piece.piece_type in piece_types:
+                    return True
+                break  # Any other piece blocks the ray
+
+    return False
 
 def is_square_under_attack(pos:Position, curr_color:Color, piece_loc:dict[Position, Piece]):
     """
     Determines if a square is under attack by any piece of the opposing color.
+
+    Looks outward from the square for an attacker (pawn diagonals, knight and king
+    offsets, then rays for sliders) and stops at the first one found, rather than
+    generating the opponent's moves.
     """
     opp_color = Color.BLACK if curr_color == Color.WHITE else Color.WHITE
-    all_moves = get_all_potential_moves(opp_color, piece_loc)
 
-    return any(pos in destinations for _, destinations in all_moves)
-    # The underscore _ means: “I don’t care about the piece itself.”
-    # Returns True if any one of those checks is True.
+    if isinstance(piece_loc, MailboxBoard):
+        return piece_loc.is_attacked(pos, opp_color)
 
-def is_kingside_castling_path_under_attack(color: Color, piece_loc: dict[Position, Piece]) -> bool:
-    squares_to_check = {
-        Color.WHITE: [Position(7, 5), Position(7, 6)],  # f1, g1
-        Color.BLACK: [Position(0, 5), Position(0, 6)],  # f8, g8
-    }[color]
+    # A pawn attacking the square sits where a pawn of our color on the square would capture
+    for pawn_pos in PAWN_CAPTURES[curr_color][pos]:
+        if _is_attacker(piece_loc.get(pawn_pos), opp_color, (PieceType.PAWN,)):
+            return True
+
+    for knight_pos in KNIGHT_TARGETS[pos]:
+        if _is_attacker(piece_loc.get(knight_pos), opp_color, (PieceType.KNIGHT,)):
+            return True
 
-    return any(
-        is_square_under_attack(square, color, piece_loc) for square in squares_to_check
+    for king_pos in KING_TARGETS[pos]:
+        if _is_attacker(piece_loc.get(king_pos), opp_color, (PieceType.KING,)):
+            return True
+
+    return (
+        _is_attacked_along_rays(ROOK_RAYS[pos], opp_color, (PieceType.ROOK, PieceType.QUEEN), piece_loc)
+        or _is_attacked_along_rays(BISHOP_RAYS[pos], opp_color, (PieceType.BISHOP, PieceType.QUEEN), piece_loc)
     )
 
-def is_queenside_castling_path_under_attack(color: Color, piece_loc: dict[Position, Piece]) -> bool:
+def find_king(color: Color, piece_loc: dict[Position, Piece]) -> Piece | None:
+    """
+    Locate the king of the given color, or None if it is not on the board.
+    """
+    return next(
+        (p for p in piece_loc.values() if p.color == color and p.piece_type == PieceType.KING),
+        None  # default
+    )
+
+def get_checks_and_pins(
+    king: Piece,
+    piece_loc: dict[Position, Piece]
+) -> tuple[list[set[Position]], dict[Position, set[Position]]]:
+    """
+    Find the pieces checking the king and the allied pieces pinned to it, scanning outward from the king.
+
+    Args:
+        king (Piece): The king to find checks and pins for.
+        piece_loc (dict[Position, Piece]): The current state of the chessboard.
+
+    Returns:
+        tuple: (checks, pins) where
+            checks is one set of squares per checking piece: the checker's square plus, for a slider,
+            the squares between it and the king. A non-king move must land in the set to resolve the check.
+            pins maps the position of each pinned piece to the squares it can move to while staying on the pin ray.
+    """
+    opp_color = Color.BLACK if king.color == Color.WHITE else Color.WHITE
+    checks = []
+    pins = {}
+
+    # A pawn checking the king sits where a pawn of the king's color would capture
+    for pawn_pos in PAWN_CAPTURES[king.color][king.position]:
+        if _is_attacker(piece_loc.get(pawn_pos), opp_color, (PieceType.PAWN,)):
+            checks.append({pawn_pos})
+
+    for knight_pos in KNIGHT_TARGETS[king.position]:
+        if _is_attacker(piece_loc.get(knight_pos), opp_color, (PieceType.KNIGHT,)):
+            checks.append({knight_pos})
+
+    for rays, sliders in ((ROOK_RAYS[king.position], (PieceType.ROOK, PieceType.QUEEN)),
+                          (BISHOP_RAYS[king.position], (PieceType.BISHOP, PieceType.QUEEN))):
+        for squares in rays:
+            ray = set()
+            pinned = None
+
+            for next_pos in squares:
+                ray.add(next_pos)
+                piece = piece_loc.get(next_pos)
+
+                if piece is not None and piece.piece_type != PieceType.EMPTY:
+                    if piece.color == king.color:
+                        if pinned is not None:
+                            break  # Two allied pieces in a row: no pin
+                        pinned = piece
+
+                    else:
+                        if piece.piece_type in sliders:
+                            if pinned is None:
+                                checks.append(ray)
+                            else:
+                                pins[pinned.position] = ray
+                        break
+
+    return checks, pins
+
+def _is_any_square_attacked(
+    squares: list[Position], curr_color: Color, piece_loc: dict[Position, Piece], attacks: AttackMaps | None = None
+) -> bool:
+    if attacks is not None:
+        opp_color = Color.BLACK if curr_color == Color.WHITE else Color.WHITE
+        return any(attacks.is_attacked(square, opp_color) for square in squares)
+    return any(is_square_under_attack(square, curr_color, piece_loc) for square in squares)
+
+def is_kingside_castling_path_under_attack(
+    color: Color, piece_loc: dict[Position, Piece], attacks: AttackMaps | None = None
+) -> bool:
     squares_to_check = {
-        Color.WHITE: [Position(7, 3), Position(7, 2)],  # d1, c1
-        Color.BLACK: [Position(0, 3), Position(0, 2)],  # d8, c8
-    }[color]
+        Color.WHITE: [Position(7, 4), Position(7, 5), Position(7, 6)],  # e1, f1, g1
+        Color.BLACK: [Position(0, 4), Position(0, 5), Position(0, 6)],  # e8, f8, g8
+    }[color]  # The king may not castle out of, through or into check
 
-    return any(
-        is_square_under_attack(square, color, piece_loc) for square in squares_to_check
-    )
+    return _is_any_square_attacked(squares_to_check, color, piece_loc, attacks)
+
+def is_queenside_castling_path_under_attack(
+    color: Color, piece_loc: dict[Position, Piece], attacks: AttackMaps | None = None
+) -> bool:
+    squares_to_check = {
+        Color.WHITE: [Position(7, 4), Position(7, 3), Position(7, 2)],  # e1, d1, c1
+        Color.BLACK: [Position(0, 4), Position(0, 3), Position(0, 2)],  # e8, d8, c8
+    }[color]  # The king may not castle out of, through or into check
+
+    return _is_any_square_attacked(squares_to_check, color, piece_loc, attacks)
 
 def is_king_in_check(king:Piece, piece_loc: dict[Position, Piece]) -> bool:
     """
@@ -144,44 +542,46 @@ def is_king_in_check(king:Piece, piece_loc: dict[Position, Piece]) -> bool:
     """
     return is_square_under_attack(pos=king.position, curr_color=king.color, piece_loc=piece_loc)
 
-def is_king_in_checkmate(king:Piece, piece_loc: dict[Position, Piece]) -> bool:
+def is_king_in_checkmate(king:Piece, piece_loc: dict[Position, Piece], simulate: bool = False) -> bool:
     """
     Check if the king of the given color is in check in the current position.
 
     Args:
         king: The king Piece
         piece_loc (dict[Position, Piece]): The current state of the chessboard.
+        simulate (bool): Simulate every potential move instead of using checks and pins.
 
     Returns:
         bool: True if the king is in checkmate, False otherwise.
     """
     
-    return is_king_in_check(king, piece_loc) and not has_valid_moves(king.color, piece_loc)
+    return is_king_in_check(king, piece_loc) and not has_valid_moves(king.color, piece_loc, simulate=simulate)
 
 def is_king_in_check_after_move(
     piece: Piece,
     to_pos: Position,
-    piece_loc: dict[Position, Piece]
+    piece_loc: dict[Position, Piece],
+    king: Piece | None = None
 ) -> bool:
     """
     Simulate the move and check if the current player's king is left in check.
+
+    The move is made in place on piece_loc and taken back before returning,
+    so the board is left exactly as it was passed in. The king is looked up on
+    the board only when it is neither the moving piece nor passed in.
     """
-    # 1. Copy the board state
-    temp_board = copy.deepcopy(piece_loc)
+    undo = make_move(piece_loc, Move(piece.position, to_pos))
 
-    # 2. Simulate the move
-    temp_board[piece.position] = Piece(position=piece.position, color=Color.NONE, piece_type=PieceType.EMPTY)
-    moved_piece = Piece(position=to_pos, color=piece.color, piece_type=piece.piece_type)
-    temp_board[to_pos] = moved_piece
+    try:
+        if piece.piece_type == PieceType.KING:
+            king = piece
+        elif king is None:
+            king = find_king(piece.color, piece_loc)
 
-    # 3. Locate the king
-    king = next(
-        (p for p in temp_board.values() if p.color == piece.color and p.piece_type == PieceType.KING),
-        None  # default
-    )
+        if not king:
+            raise ValueError("King not found on the board for simulation.")
 
-    if not king:
-        raise ValueError("King not found on the board for simulation.")
+        return is_king_in_check(king, piece_loc)
 
-    # 4. Check if king is in check
-    return is_king_in_check(king, temp_board)
+    finally:
+        unmake_move(piece_loc, undo)
@@ -3,11 +3,7 @@ from chess_2.piece.piece import Piece
 from chess_2.utils.types import Position
 from chess_2.utils.enums import Color, PieceType
 from chess_2.piece_movement.piece_move import PieceMovement
-from chess_2.utils.move_validation import (
-    is_within_board,
-    is_square_empty,
-    is_occupied_by_opposing,
-)
+from chess_2.piece_movement.lookup_tables import PAWN_PUSHES, PAWN_CAPTURES
 
 class PawnMovement(PieceMovement):
     """
@@ -15,25 +11,26 @@ class PawnMovement(PieceMovement):
     """
 
     def get_potential_moves(self, piece_loc: Dict[Position, Piece]) -> List[Position]:
-        direction = -1 if self.piece.color == Color.WHITE else 1
-        start_row = 6 if self.piece.color == Color.WHITE else 1
-        row, col = self.piece.position
+        color = self.piece.color
         potential_moves = []
 
-        # 1-step forward
-        one_forward = Position(row + direction, col)
-        if is_within_board(one_forward) and is_square_empty(piece_loc, one_forward):
-            potential_moves.append(one_forward)
+        # 1-step forward, then 2-step forward from the starting row if the first square is empty
+        for pos in PAWN_PUSHES[color][self.piece.position]:
+            target = piece_loc.get(pos)
+            if target is not None and target.piece_type != PieceType.EMPTY:
+                break
+            potential_moves.append(pos)
 
-            # 2-step forward from starting row
-            two_forward = Position(row + 2 * direction, col)
-            if row == start_row and is_square_empty(piece_loc, two_forward):
-                potential_moves.append(two_forward)
-
-        # Diagonal captures
-        for dc in [-1, 1]:  # left and right
-            diag_pos = Position(row + direction, col + dc)
-            if is_within_board(diag_pos) and is_occupied_by_opposing(piece_loc, diag_pos, self.piece.color):
-                potential_moves.append(diag_pos)
+        # Diagonal captures, and en passant onto the empty square behind a pawn that just advanced two squares
+        for pos in PAWN_CAPTURES[color][self.piece.position]:
+            target = piece_loc.get(pos)
+            if target is None:
+                continue
+            if target.piece_type == PieceType.EMPTY:
+                passed = piece_loc.get(Position(self.piece.position.row, pos.col))
+                if passed is not None and passed.en_passantable and passed.color != color:
+                    potential_moves.append(pos)
+            elif target.color != color and target.color != Color.NONE:
+                potential_moves.append(pos)
 
         return potential_moves
@@ -1,4 +1,5 @@
 from chess_2.utils.types import Position
+from chess_2.utils.enums import PieceType
 from chess_2.piece.piece import Piece
 from abc import ABC, abstractmethod
 
@@ -27,6 +28,38 @@ class PieceMovement(ABC):
         """
         pass
 
+    def _slide_targets(
+        self, piece_loc: dict[Position, Piece], rays: tuple[tuple[Position, ...], ...]
+    ) -> list[Position]:
+        """
+        Walk each precomputed ray until it is blocked, keeping empty squares and the first opposing piece.
+        """
+        color = self.piece.color
+        targets = []
+
+        for ray in rays:
+            for pos in ray:
+                piece = piece_loc.get(pos)
+                if piece is None or piece.piece_type == PieceType.EMPTY:
+                    targets.append(pos)
+                    continue
+
+                if piece.color != color:
+                    targets.append(pos)
+                break
+
+        return targets
+
+    def _step_targets(self, piece_loc: dict[Position, Piece], squares: tuple[Position, ...]) -> list[Position]:
+        """
+        Keep the precomputed target squares that are not occupied by an allied piece.
+        """
+        color = self.piece.color
+        return [
+            pos for pos in squares
+            if (piece := piece_loc.get(pos)) is None or piece.color != color or piece.piece_type == PieceType.EMPTY
+        ]
+
     def get_valid_moves(self, piece_loc: dict[Position, Piece]) -> list[Position]:
         """
         Get legal moves for the piece (excluding those that leave king in check).
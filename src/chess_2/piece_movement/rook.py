@@ -1,11 +1,8 @@
 from chess_2.piece_movement.piece_move import PieceMovement
+from chess_2.board.mailbox import MailboxBoard, ROOK_OFFSETS
 from chess_2.piece.piece import Piece
 from chess_2.utils.types import Position
-from chess_2.utils.move_validation import (
-    is_within_board,
-    is_square_empty,
-    is_occupied_by_ally,
-)
+from chess_2.piece_movement.lookup_tables import ROOK_RAYS
 
 class RookMovement(PieceMovement):
     """
@@ -24,32 +21,7 @@ class RookMovement(PieceMovement):
         Returns:
             list[Position]: A list of valid moves for the rook.
         """
-        # Define directions for rook movement: up, down, left, right
-        directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+        if isinstance(piece_loc, MailboxBoard):
+            return piece_loc.slide_targets(self.piece.position, ROOK_OFFSETS, self.piece.color)
 
-        potential_moves = []
-        row, col  = self.piece.position
-
-        for dx, dy in directions:
-            step = 1
-            while True:
-                new_row = row + dx * step
-                new_col = col + dy * step
-                next_pos = Position(new_row, new_col)
-
-                if not is_within_board(next_pos):
-                    break
-
-                if is_square_empty(piece_loc, next_pos):
-                    potential_moves.append(next_pos)
-
-                elif is_occupied_by_ally(piece_loc, next_pos, self.piece.color):
-                    break
-                
-                else:
-                    potential_moves.append(next_pos)
-                    break
-
-                step += 1
-
-        return potential_moves
+        return self._slide_targets(piece_loc, ROOK_RAYS[self.piece.position])
@@ -0,0 +1,318 @@
+"""
+A UCI (Universal Chess Interface) front-end, so chess GUIs and tournament managers can drive the engine.
+
+The engine keeps one BoardState for the whole session. A position command that
+extends the previous one (the usual case, as GUIs resend the whole game before
+every search) only makes the new moves, and one that takes moves back unmakes
+them, instead of replaying the game from the start.
+
+Searches run on a background thread, so stop, isready and the other commands
+are answered while the engine thinks; stop makes the search return within a few
+hundred nodes and reports the best move found so far.
+
+In infinite and ponder mode the best move is held back until the GUI sends stop
+(or ponderhit, for a ponder search), even if the search ends sooner, as UCI
+requires. After ponderhit the search goes on within the time the go command
+would have allowed, then answers.
+
+Usage:
+    python -m chess_2.uci
+"""
+import argparse
+import sys
+import threading
+from collections.abc import Callable
+from typing import TextIO
+
+from chess_2.utils.enums import Color, PieceType
+from chess_2.utils.fen import PIECE_TYPE_FEN_MAP, START_FEN, algebraic_to_index, move_to_str
+from chess_2.utils.types import Move
+from chess_2.board.board_state import BoardState
+from chess_2.board.move_execution import UndoInfo
+from chess_2.engine.search import IterationInfo, MATE_SCORE, MAX_PLY, find_best_move
+
+ENGINE_NAME = "chess_2"
+ENGINE_AUTHOR = "chess_2 developers"
+
+# Moves assumed left in the game when the GUI does not send movestogo
+DEFAULT_MOVES_TO_GO = 30
+
+# Milliseconds kept back from the clock for communication overhead
+MOVE_OVERHEAD_MS = 50
+
+
+def uci_to_move(text: str) -> Move:
+    """
+    Parse a move in UCI notation (e.g., 'e2e4', 'e7e8q').
+
+    Raises:
+        ValueError: If the text is not a UCI move.
+    """
+    if len(text) not in (4, 5):
+        raise ValueError(f"Invalid UCI move {text!r}")
+    try:
+        promotion = PIECE_TYPE_FEN_MAP[text[4]] if len(text) == 5 else None
+        move = Move(algebraic_to_index(text[:2]), algebraic_to_index(text[2:4]), promotion)
+    except KeyError:
+        raise ValueError(f"Invalid UCI move {text!r}") from None
+    if promotion in (PieceType.PAWN, PieceType.KING):
+        raise ValueError(f"Invalid UCI move {text!r}")
+    return move
+
+
+def move_to_uci(move: Move | None) -> str:
+    """
+    Write a move in UCI notation, or the null move '0000' for None.
+    """
+    if move is None:
+        return "0000"
+    return move_to_str(move)
+
+
+def score_to_uci(score: int) -> str:
+    """
+    Write a search score as 'cp <centipawns>', or 'mate <moves>' for a forced mate (negative when being mated).
+    """
+    if abs(score) >= MATE_SCORE - MAX_PLY:
+        moves = (MATE_SCORE - abs(score) + 1) // 2
+        return f"mate {moves if score > 0 else -moves}"
+    return f"cp {score}"
+
+
+def search_time_ms(options: dict[str, int], white_to_move: bool) -> int | None:
+    """
+    Work out how long to search from the go command's options.
+
+    Args:
+        options (dict[str, int]): The numeric options of the go command (movetime, wtime, btime, winc, binc, movestogo).
+        white_to_move (bool): Whether white is to move.
+
+    Returns:
+        int | None: Milliseconds to search for, or None to search without a time limit.
+    """
+    if "movetime" in options:
+        return options["movetime"]
+
+    remaining = options.get("wtime" if white_to_move else "btime")
+    if remaining is None:
+        return None
+
+    increment = options.get("winc" if white_to_move else "binc", 0)
+    budget = remaining // options.get("movestogo", DEFAULT_MOVES_TO_GO) + increment // 2
+    return max(1, min(budget, remaining - MOVE_OVERHEAD_MS))
+
+
+class UciEngine:
+    """
+    Answers UCI commands for one session.
+
+    Args:
+        write (Callable[[str], None]): Sends one line of output to the GUI.
+    """
+
+    def __init__(self, write: Callable[[str], None]):
+        self._write = write
+        self._output_lock = threading.Lock()
+        self.board_state = BoardState.from_fen(START_FEN)
+        self._base_fen = START_FEN
+        self._moves: list[str] = []
+        self._undos: list[UndoInfo] = []
+        self._search_thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        # Set once the search may send its best move; held clear in infinite and ponder mode
+        self._release = threading.Event()
+        self._ponder_time_ms: int | None = None
+        self._ponder_timer: threading.Timer | None = None
+
+    def send(self, line: str) -> None:
+        with self._output_lock:
+            self._write(line)
+
+    def handle(self, line: str) -> bool:
+        """
+        Carry out one UCI command.
+
+        Args:
+            line (str): The command.
+
+        Returns:
+            bool: False once the GUI sent quit, True otherwise.
+        """
+        command, *args = line.split() or [""]
+        match command:
+            case "uci":
+                self.send(f"id name {ENGINE_NAME}")
+                self.send(f"id author {ENGINE_AUTHOR}")
+                self.send("uciok")
+            case "isready":
+                self.send("readyok")
+            case "ucinewgame":
+                self.stop()
+                self.board_state = BoardState.from_fen(START_FEN)
+                self._base_fen = START_FEN
+                self._moves, self._undos = [], []
+            case "position":
+                self.stop()
+                self.set_position(args)
+            case "go":
+                self.stop()
+                self.go(args)
+            case "stop":
+                self.stop()
+            case "ponderhit":
+                self.ponderhit()
+            case "quit":
+                self.stop()
+                return False
+            case _:
+                if command:
+                    self.send(f"info string Unknown command: {command}")
+        return True
+
+    def set_position(self, args: list[str]) -> None:
+        """
+        Bring the board to the position of a position command, making and unmaking as few moves as possible.
+
+        Args:
+            args (list[str]): The arguments of the command: 'startpos' or 'fen <fen>', then optionally 'moves ...'.
+        """
+        if "moves" in args:
+            split = args.index("moves")
+            setup, moves = args[:split], args[split + 1:]
+        else:
+            setup, moves = args, []
+
+        if setup[:1] == ["startpos"]:
+            fen = START_FEN
+        elif setup[:1] == ["fen"] and len(setup) > 1:
+            fen = " ".join(setup[1:])
+        else:
+            self.send("info string Expected 'startpos' or 'fen' in position command")
+            return
+
+        if fen != self._base_fen:
+            try:
+                self.board_state = BoardState.from_fen(fen)
+            except ValueError as e:
+                self.send(f"info string {e}")
+                return
+            self._base_fen = fen
+            self._moves, self._undos = [], []
+
+        # Keep the moves the board already has in common with the new line
+        common = 0
+        for old, new in zip(self._moves, moves):
+            if old != new:
+                break
+            common += 1
+
+        while len(self._moves) > common:
+            self.board_state.unmake_move(self._undos.pop())
+            self._moves.pop()
+
+        for text in moves[common:]:
+            try:
+                move = uci_to_move(text)
+            except ValueError:
+                move = None
+            if move not in self.board_state.get_legal_moves():
+                self.send(f"info string Illegal move {text}")
+                return
+            self._undos.append(self.board_state.make_move(move))
+            self._moves.append(text)
+
+    def go(self, args: list[str]) -> None:
+        """
+        Start searching the current position on a background thread; bestmove is sent when it ends.
+
+        Args:
+            args (list[str]): The arguments of the go command.
+        """
+        options: dict[str, int] = {}
+        for name, value in zip(args, args[1:]):
+            if value.lstrip("-").isdigit():
+                options[name] = int(value)
+
+        infinite = "infinite" in args
+        ponder = "ponder" in args
+        time_limit_ms = None if infinite else search_time_ms(options, self.board_state.player_turn == Color.WHITE)
+        max_depth = options.get("depth", MAX_PLY)
+        node_limit = options.get("nodes")
+
+        # A ponder search runs without a time limit; the budget starts counting at ponderhit
+        self._ponder_time_ms = time_limit_ms if ponder else None
+        if ponder:
+            time_limit_ms = None
+
+        self._stop.clear()
+        if infinite or ponder:
+            self._release.clear()
+        else:
+            self._release.set()
+        self._search_thread = threading.Thread(
+            target=self._search, args=(max_depth, time_limit_ms, node_limit), name="uci-search", daemon=True
+        )
+        self._search_thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop a running search and wait for it to send its best move.
+        """
+        if self._ponder_timer is not None:
+            self._ponder_timer.cancel()
+            self._ponder_timer = None
+        if self._search_thread is not None:
+            self._stop.set()
+            self._release.set()
+            self._search_thread.join()
+            self._search_thread = None
+
+    def ponderhit(self) -> None:
+        """
+        The opponent played the move pondered on: keep searching within the normal time budget, then answer.
+        """
+        if self._search_thread is None or self._release.is_set() or self._ponder_time_ms is None:
+            return  # Not pondering, or pondering without a time control, which waits for stop
+
+        self._ponder_timer = threading.Timer(self._ponder_time_ms / 1000, self._stop.set)
+        self._ponder_timer.daemon = True
+        self._ponder_timer.start()
+        self._release.set()
+
+    def _search(self, max_depth: int, time_limit_ms: int | None, node_limit: int | None) -> None:
+        result = find_best_move(
+            self.board_state,
+            max_depth=max_depth,
+            time_limit_ms=time_limit_ms,
+            node_limit=node_limit,
+            stop=self._stop,
+            on_iteration=self._send_info,
+        )
+        # UCI forbids bestmove in infinite and ponder mode until stop or ponderhit
+        self._release.wait()
+        self.send(f"bestmove {move_to_uci(result.best_move)}")
+
+    def _send_info(self, info: IterationInfo) -> None:
+        self.send(
+            f"info depth {info.depth} score {score_to_uci(info.score)} nodes {info.nodes} "
+            f"nps {info.nodes_per_second:.0f} time {info.elapsed * 1000:.0f} pv {move_to_uci(info.best_move)}"
+        )
+
+
+def main(argv: list[str] | None = None, stdin: TextIO | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chess_2.uci", description="Speak UCI on standard input and output.")
+    parser.parse_args(argv)
+
+    def write(line: str) -> None:
+        print(line, flush=True)
+
+    engine = UciEngine(write)
+    for line in stdin or sys.stdin:
+        if not engine.handle(line.strip()):
+            break
+    engine.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -37,3 +37,25 @@ class PieceType(Enum):
     QUEEN = "queen"
     KNIGHT = "knight"
     KING = "king"
+
+class GameStatus(Enum):
+    """
+    Enumeration representing the state of the game for the player to move.
+
+    Attributes:
+        ONGOING (str): The player to move has legal moves and is not in check.
+        CHECK (str): The player to move is in check but has legal moves.
+        CHECKMATE (str): The player to move is in check and has no legal moves.
+        STALEMATE (str): The player to move is not in check and has no legal moves.
+        INSUFFICIENT_MATERIAL (str): Drawn, as neither side has the material left to checkmate.
+        FIFTY_MOVE_RULE (str): Drawn, after fifty moves by each side without a capture or pawn move.
+        THREEFOLD_REPETITION (str): Drawn, as the position has occurred three times.
+    """
+
+    ONGOING = "ongoing"
+    CHECK = "check"
+    CHECKMATE = "checkmate"
+    STALEMATE = "stalemate"
+    INSUFFICIENT_MATERIAL = "insufficient material"
+    FIFTY_MOVE_RULE = "fifty-move rule"
+    THREEFOLD_REPETITION = "threefold repetition"
@@ -1,8 +1,11 @@
 import re
 
 from chess_2.utils.enums import PieceType, Color
-from chess_2.piece.piece import Piece
-from chess_2.utils.types import Position
+from chess_2.piece.piece import Piece, empty_square
+from chess_2.utils.types import Position, Move, SQUARES
+from chess_2.board.mailbox import MailboxBoard
+from chess_2.board.move_execution import EN_PASSANT_ROW, get_en_passant_pawn
+from chess_2.utils.move_validation import CASTLING_HOME_SQUARES, get_castling_rights
 
 # dictionary of fen as keys and PieceType as values
 PIECE_TYPE_FEN_MAP: dict[str, PieceType] = {
@@ -14,40 +17,193 @@ PIECE_TYPE_FEN_MAP: dict[str, PieceType] = {
     "n": PieceType.KNIGHT,
 }
 
+FEN_PIECE_CHARS: dict[PieceType, str] = {piece_type: char for char, piece_type in PIECE_TYPE_FEN_MAP.items()}
+
 START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR"
 
 
-def parse_fen(fen: str) -> dict[Position, Piece]:
+def parse_fen(fen: str, mailbox: bool = False) -> dict[Position, Piece]:
     """
     Process the FEN string and initialize the board with the specified piece positions.
 
+    Only the piece placement field is read; any further fields are ignored (see parse_full_fen).
+
     Args:
         fen (str): The FEN string representing the piece positions.
+        mailbox (bool): Store the board in a MailboxBoard array instead of a dict.
 
     Returns:
         dict[Position, Piece]: A dictionary representing the board with initialized piece positions.
-    """
 
-    piece_loc: dict[Position, Piece] = {}
-    rows = fen.split('/')
+    Raises:
+        ValueError: If the placement is not 8 ranks of 8 files, or holds a character other than a piece letter or a digit 1-8.
+    """
 
+    piece_loc: dict[Position, Piece] = MailboxBoard() if mailbox else {}
+    rows = fen.split()[0].split('/') if fen.strip() else []
+    if len(rows) != 8:
+        raise ValueError(f"Expected 8 ranks, found {len(rows)}, in FEN {fen!r}")
 
     for row_idx, row in enumerate(rows):
+        if sum(int(char) if char in "12345678" else 1 for char in row) != 8:
+            raise ValueError(f"Rank {8 - row_idx} does not have 8 files in FEN {fen!r}")
+
         col_idx = 0
         for char in row:
+            if char.lower() not in PIECE_TYPE_FEN_MAP and char not in "12345678":
+                raise ValueError(f"Invalid character {char!r} in FEN {fen!r}")
+
             if char.isdigit():
                 for _ in range(int(char)):  # Repeat for the number of empty squares
-                    piece_loc[Position(row=row_idx, col=col_idx)] = Piece(position=Position(row=row_idx, col=col_idx), color=Color.NONE, piece_type=PieceType.EMPTY)
+                    pos = SQUARES[row_idx * 8 + col_idx]
+                    piece_loc[pos] = empty_square(pos)
                     col_idx += 1  # Move to the next column
 
             else:
                 color = Color.WHITE if char.isupper() else Color.BLACK
                 piece_type = PIECE_TYPE_FEN_MAP[char.lower()]
-                piece_loc[Position(row=row_idx, col=col_idx)] = Piece(position=Position(row=row_idx, col=col_idx), color=color, piece_type=piece_type)
+                pos = SQUARES[row_idx * 8 + col_idx]
+                piece_loc[pos] = Piece(position=pos, color=color, piece_type=piece_type)
                 col_idx += 1
 
     return piece_loc
 
+def parse_full_fen(fen: str, mailbox: bool = False) -> tuple[dict[Position, Piece], Color, int, int]:
+    """
+    Parse all six fields of a FEN string.
+
+    Castling rights and the en passant square are stored on the pieces: a king or rook
+    that lost its castling right is marked has_moved, and the pawn that can be captured
+    en passant is marked en_passantable. When the castling field is missing, rights are
+    implied by kings and rooks standing on their starting squares.
+
+    Args:
+        fen (str): The FEN string (e.g., 'rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1').
+        mailbox (bool): Store the board in a MailboxBoard array instead of a dict.
+
+    Returns:
+        tuple: (piece_loc, player_turn, halfmove_clock, fullmove_number)
+
+    Raises:
+        ValueError: If a field is malformed or contradicts the placement (a castling right
+            without its king and rook at home, an en passant square on the wrong rank), there
+            are more than six fields, or either side does not have exactly one king.
+    """
+    fields = fen.split()
+    if len(fields) > 6:
+        raise ValueError(f"Expected at most six fields in FEN {fen!r}")
+    piece_loc = parse_fen(fen, mailbox=mailbox)
+
+    for color in (Color.WHITE, Color.BLACK):
+        kings = sum(1 for piece in piece_loc.values() if piece.piece_type == PieceType.KING and piece.color == color)
+        if kings != 1:
+            raise ValueError(f"Expected one {color} king, found {kings}, in FEN {fen!r}")
+
+    side = fields[1] if len(fields) > 1 else "w"
+    if side not in ("w", "b"):
+        raise ValueError(f"Invalid side to move {side!r} in FEN {fen!r}")
+    player_turn = Color.WHITE if side == "w" else Color.BLACK
+
+    if len(fields) > 2:
+        castling = fields[2]
+        if castling != "-" and (not castling or any(right not in CASTLING_HOME_SQUARES for right in castling)):
+            raise ValueError(f"Invalid castling rights {castling!r} in FEN {fen!r}")
+
+        for right, (color, king_pos, rook_pos) in CASTLING_HOME_SQUARES.items():
+            if right in castling:
+                king, rook = piece_loc.get(king_pos), piece_loc.get(rook_pos)
+                if (king is None or king.piece_type != PieceType.KING or king.color != color
+                        or rook is None or rook.piece_type != PieceType.ROOK or rook.color != color):
+                    raise ValueError(f"Castling right {right!r} has no king and rook at home in FEN {fen!r}")
+                continue
+            # The rook has lost this right; the king only once both of its rights are gone
+            rook = piece_loc.get(rook_pos)
+            if rook is not None and rook.piece_type == PieceType.ROOK and rook.color == color:
+                rook.has_moved = True
+            king = piece_loc.get(king_pos)
+            king_rights = "KQ" if color == Color.WHITE else "kq"
+            if (king is not None and king.piece_type == PieceType.KING and king.color == color
+                    and not any(r in castling for r in king_rights)):
+                king.has_moved = True
+
+    if len(fields) > 3 and fields[3] != "-":
+        try:
+            if len(fields[3]) != 2:
+                raise KeyError(fields[3])
+            target = algebraic_to_index(fields[3])
+        except (KeyError, IndexError):
+            raise ValueError(f"Invalid en passant square {fields[3]!r} in FEN {fen!r}") from None
+
+        # The pawn that just advanced two squares stands one row past the target square
+        mover = Color.BLACK if player_turn == Color.WHITE else Color.WHITE
+        pawn_pos = Position(EN_PASSANT_ROW[mover], target.col)
+        if target.row != pawn_pos.row + (1 if mover == Color.WHITE else -1):
+            raise ValueError(f"En passant square {fields[3]!r} is on the wrong rank in FEN {fen!r}")
+        pawn = piece_loc.get(pawn_pos)
+        if pawn is None or pawn.piece_type != PieceType.PAWN or pawn.color != mover:
+            raise ValueError(f"En passant square {fields[3]!r} has no pawn behind it in FEN {fen!r}")
+        pawn.has_moved = True
+        pawn.en_passantable = True
+
+    clocks = fields[4:6]
+    if not all(clock.isascii() and clock.isdigit() for clock in clocks):
+        raise ValueError(f"Invalid move clocks in FEN {fen!r}")
+    halfmove_clock = int(fields[4]) if len(fields) > 4 else 0
+    fullmove_number = int(fields[5]) if len(fields) > 5 else 1
+    if fullmove_number < 1:
+        raise ValueError(f"Invalid fullmove number {fullmove_number} in FEN {fen!r}")
+
+    return piece_loc, player_turn, halfmove_clock, fullmove_number
+
+def get_fen_placement(piece_loc: dict[Position, Piece]) -> str:
+    """
+    Get the piece placement field of a FEN string for a board.
+    """
+    rows = []
+    for row_idx in range(8):
+        row = ""
+        empty = 0
+        for col_idx in range(8):
+            piece = piece_loc.get(SQUARES[row_idx * 8 + col_idx])
+            if piece is None or piece.piece_type == PieceType.EMPTY:
+                empty += 1
+                continue
+
+            if empty:
+                row += str(empty)
+                empty = 0
+            char = FEN_PIECE_CHARS[piece.piece_type]
+            row += char.upper() if piece.color == Color.WHITE else char
+
+        rows.append(row + (str(empty) if empty else ""))
+
+    return "/".join(rows)
+
+def to_fen(piece_loc: dict[Position, Piece], player_turn: Color, halfmove_clock: int = 0, fullmove_number: int = 1) -> str:
+    """
+    Serialize a position as a six-field FEN string.
+
+    Args:
+        piece_loc (dict[Position, Piece]): The board state.
+        player_turn (Color): The color to move.
+        halfmove_clock (int): Half moves since the last capture or pawn move.
+        fullmove_number (int): The current move number, starting at 1.
+
+    Returns:
+        str: The FEN string.
+    """
+    castling = get_castling_rights(piece_loc) or "-"
+
+    en_passant = "-"
+    pawn = get_en_passant_pawn(piece_loc)
+    if pawn is not None:
+        # The target square is the one the pawn passed over
+        behind = 1 if pawn.color == Color.WHITE else -1
+        en_passant = index_to_algebraic(Position(pawn.position.row + behind, pawn.position.col))
+
+    side = "w" if player_turn == Color.WHITE else "b"
+    return f"{get_fen_placement(piece_loc)} {side} {castling} {en_passant} {halfmove_clock} {fullmove_number}"
+
 def parse_user_input(user_input: str, piece_color:Color) -> tuple[Piece, Position]:
     """
     Parse the user input for chess moves.
@@ -125,4 +281,10 @@ def index_to_algebraic(pos: Position) -> str:
     """
     file = INDEX_TO_FILE[pos.col]
     rank = INDEX_TO_RANK[pos.row]
-    return f"{file}{rank}"
\ No newline at end of file
+    return f"{file}{rank}"
+def move_to_str(move: Move) -> str:
+    """
+    Convert a move to long algebraic notation (e.g., 'e2e4', 'e7e8q').
+    """
+    text = index_to_algebraic(move.from_pos) + index_to_algebraic(move.to_pos)
+    return text + FEN_PIECE_CHARS[move.promotion] if move.promotion else text
@@ -20,7 +20,8 @@ def does_piece_exist_at_pos(piece_pos:dict[Position, Piece], piece_to_move):
         bool: True if a piece exists at the position, False otherwise.
     """
 
-    return piece_pos.get(piece_to_move.position) == piece_to_move
+    piece = piece_pos.get(piece_to_move.position)
+    return piece is not None and piece.color == piece_to_move.color and piece.piece_type == piece_to_move.piece_type
 
 class PieceDoesNotExist(Exception):
     """Exception raised for invalid move notation."""
@@ -1,6 +1,7 @@
 from chess_2.utils.types import Position
 from chess_2.piece.piece import Piece
 from chess_2.utils.enums import Color, PieceType
+from chess_2.board.attack_maps import AttackMaps
 
 def is_within_board(position: Position) -> bool:
     """
@@ -109,7 +110,37 @@ def has_horizontal_path_clear_between(
     
     return True
 
-def can_castle_kingside(color: Color, piece_loc: dict[Position, Piece]) -> bool:
+# King and rook home squares for each castling right, in FEN order
+CASTLING_HOME_SQUARES: dict[str, tuple[Color, Position, Position]] = {
+    "K": (Color.WHITE, Position(7, 4), Position(7, 7)),
+    "Q": (Color.WHITE, Position(7, 4), Position(7, 0)),
+    "k": (Color.BLACK, Position(0, 4), Position(0, 7)),
+    "q": (Color.BLACK, Position(0, 4), Position(0, 0)),
+}
+
+def get_castling_rights(piece_loc: dict[Position, Piece]) -> str:
+    """
+    Get the castling rights still available, read from the has_moved flags of the kings and rooks.
+
+    Args:
+        piece_loc (dict[Position, Piece]): The current board.
+
+    Returns:
+        str: The available rights in FEN order (e.g., 'KQkq'), or an empty string if there are none.
+    """
+    rights = ""
+    for right, (color, king_pos, rook_pos) in CASTLING_HOME_SQUARES.items():
+        king = piece_loc.get(king_pos)
+        rook = piece_loc.get(rook_pos)
+
+        if (king is not None and rook is not None
+                and king.piece_type == PieceType.KING and king.color == color and not king.has_moved
+                and rook.piece_type == PieceType.ROOK and rook.color == color and not rook.has_moved):
+            rights += right
+
+    return rights
+
+def can_castle_kingside(color: Color, piece_loc: dict[Position, Piece], attacks: AttackMaps | None = None) -> bool:
 
     from chess_2.piece_movement.move_generator import is_kingside_castling_path_under_attack
 
@@ -128,12 +159,12 @@ def can_castle_kingside(color: Color, piece_loc: dict[Position, Piece]) -> bool:
     if not has_horizontal_path_clear_between(piece_loc, king_pos, rook_pos):
         return False
 
-    if is_kingside_castling_path_under_attack(color=color, piece_loc=piece_loc):
+    if is_kingside_castling_path_under_attack(color=color, piece_loc=piece_loc, attacks=attacks):
         return False
 
     return True
 
-def can_castle_queenside(color: Color, piece_loc: dict[Position, Piece]) -> bool:
+def can_castle_queenside(color: Color, piece_loc: dict[Position, Piece], attacks: AttackMaps | None = None) -> bool:
 
     from chess_2.piece_movement.move_generator import is_queenside_castling_path_under_attack
 
@@ -152,7 +183,7 @@ def can_castle_queenside(color: Color, piece_loc: dict[Position, Piece]) -> bool
     if not has_horizontal_path_clear_between(piece_loc, king_pos, rook_pos):
         return False
 
-    if is_queenside_castling_path_under_attack(color=color, piece_loc=piece_loc):
+    if is_queenside_castling_path_under_attack(color=color, piece_loc=piece_loc, attacks=attacks):
         return False
 
     return True
@@ -0,0 +1,296 @@
+"""
+Streaming PGN (Portable Game Notation) reader and writer.
+
+read_games pulls lines from a file one at a time and yields each game once the
+next game's first header line (or the end of the file) is read, so memory use
+depends on the longest game, not on the size of the file. Comments, variations, NAGs and move numbers are skipped;
+only the main line's SAN moves are kept.
+
+Usage (benchmark):
+    python -m chess_2.utils.pgn games.pgn
+    python -m chess_2.utils.pgn sample.pgn --generate 200
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import TextIO
+
+from chess_2.utils.types import Move
+from chess_2.utils.fen import START_FEN
+from chess_2.utils.san import san_to_move, moves_to_san
+from chess_2.utils.input_validation import InvalidNotation, IllegalMove
+from chess_2.board.board_state import BoardState
+from chess_2.board.transposition_table import TranspositionTable
+
+RESULTS = ("1-0", "0-1", "1/2-1/2", "*")
+
+# Seven Tag Roster, written first and in this order
+SEVEN_TAG_ROSTER = ("Event", "Site", "Date", "Round", "White", "Black", "Result")
+
+HEADER_PATTERN = re.compile(r'^\s*\[(?P<name>\w+)\s+"(?P<value>(?:[^"\\]|\\.)*)"\s*\]\s*$')
+MOVETEXT_TOKEN_PATTERN = re.compile(r"\{[^}]*\}?|;.*|\(|\)|\$\d+|\d+\.+|[^\s(){};]+")
+
+START_POSITION_FEN = START_FEN + " w KQkq - 0 1"
+
+
+@dataclass
+class PgnGame:
+    """
+    One game read from a PGN file.
+
+    Attributes:
+        headers (dict[str, str]): The tag pairs, e.g. {'White': 'Carlsen, Magnus'}.
+        moves (list[str]): The main line's moves in SAN.
+        result (str): The game result ('1-0', '0-1', '1/2-1/2' or '*').
+    """
+    headers: dict[str, str] = field(default_factory=dict)
+    moves: list[str] = field(default_factory=list)
+    result: str = "*"
+
+    @property
+    def starting_fen(self) -> str:
+        return self.headers.get("FEN", START_POSITION_FEN)
+
+
+def _parse_movetext(game: PgnGame, movetext: list[str]) -> None:
+    depth = 0  # Nesting depth of variations
+
+    for token in MOVETEXT_TOKEN_PATTERN.findall("\n".join(movetext)):
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth = max(depth - 1, 0)
+        elif depth or token[0] in "{;$" or token[0].isdigit() and token.endswith("."):
+            continue
+        elif token in RESULTS:
+            game.result = token
+        else:
+            game.moves.append(token)
+
+
+def read_games(source: Iterable[str]) -> Iterator[PgnGame]:
+    """
+    Stream games from PGN text.
+
+    Args:
+        source (Iterable[str]): Lines of PGN text, e.g. an open file.
+
+    Yields:
+        PgnGame: Each game, in file order.
+    """
+    game = PgnGame()
+    movetext: list[str] = []
+    in_comment = False
+
+    for line in source:
+        # A header line starts a new game once the previous one has movetext
+        header = None if in_comment else HEADER_PATTERN.match(line)
+        if header is not None:
+            if movetext:
+                _parse_movetext(game, movetext)
+                yield game
+                game, movetext = PgnGame(), []
+            game.headers[header["name"]] = header["value"].replace('\\"', '"').replace("\\\\", "\\")
+            continue
+
+        stripped = line.strip()
+        if stripped and not stripped.startswith("%"):  # '%' lines are escape-mechanism lines
+            movetext.append(stripped)
+            in_comment = stripped.count("{") > stripped.count("}") if not in_comment else "}" not in stripped
+
+    if movetext or game.headers:
+        _parse_movetext(game, movetext)
+        yield game
+
+
+def replay_game(game: PgnGame, transposition_table: TranspositionTable | None = None) -> Iterator[tuple[Move, BoardState]]:
+    """
+    Play through a game's moves, resolving each SAN move against the legal moves of its position.
+
+    The same BoardState is updated in place and yielded after every move; call to_fen on
+    it to keep a snapshot.
+
+    Args:
+        game (PgnGame): The game to replay.
+        transposition_table (TranspositionTable | None): Table to cache positions in. Sharing one
+            across games lets common openings be resolved from the cache.
+
+    Yields:
+        tuple[Move, BoardState]: Each move and the position after it.
+
+    Raises:
+        InvalidNotation, IllegalMove: If a move cannot be resolved.
+        ValueError: If the game's FEN header is malformed.
+    """
+    board_state = BoardState.from_fen(game.starting_fen, transposition_table=transposition_table)
+
+    for san in game.moves:
+        move = san_to_move(board_state, san)
+        board_state.move_history.append(san)
+        board_state.make_move(move)
+        yield move, board_state
+
+
+def read_game_moves(
+    source: Iterable[str],
+    on_error: Callable[[PgnGame, Exception], None] | None = None,
+) -> Iterator[list[Move]]:
+    """
+    Stream games from PGN text as lists of resolved moves.
+
+    A game with a move that cannot be resolved, or a malformed FEN header, is skipped
+    and reading continues with the next game.
+
+    Args:
+        source (Iterable[str]): Lines of PGN text, e.g. an open file.
+        on_error (Callable[[PgnGame, Exception], None] | None): Called with each skipped game
+            and the error that rejected it.
+
+    Yields:
+        list[Move]: The moves of each game that replays cleanly, in file order.
+    """
+    transposition_table = TranspositionTable()
+    for game in read_games(source):
+        try:
+            moves = [move for move, _ in replay_game(game, transposition_table)]
+        except (InvalidNotation, IllegalMove, ValueError) as e:
+            if on_error is not None:
+                on_error(game, e)
+            continue
+        yield moves
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def write_game(game: PgnGame, out: TextIO, line_width: int = 80) -> None:
+    """
+    Write a game as PGN, wrapping the movetext.
+
+    Args:
+        game (PgnGame): The game to write.
+        out (TextIO): The stream to write to.
+        line_width (int): Maximum length of a movetext line.
+    """
+    headers = dict(game.headers)
+    headers["Result"] = game.result
+    for name in SEVEN_TAG_ROSTER:
+        headers.setdefault(name, "?")
+
+    ordered = list(SEVEN_TAG_ROSTER) + [name for name in headers if name not in SEVEN_TAG_ROSTER]
+    for name in ordered:
+        out.write(f'[{name} "{_quote(headers[name])}"]\n')
+    out.write("\n")
+
+    # Move numbers continue from the FEN's fullmove number, starting with "N..." when black moves first
+    fen_fields = game.starting_fen.split()
+    number = int(fen_fields[5]) if len(fen_fields) > 5 else 1
+    black_to_move = len(fen_fields) > 1 and fen_fields[1] == "b"
+
+    tokens = []
+    for san in game.moves:
+        if not black_to_move:
+            tokens.append(f"{number}. {san}")
+        elif not tokens:
+            tokens.append(f"{number}... {san}")
+        else:
+            tokens.append(san)
+
+        if black_to_move:
+            number += 1
+        black_to_move = not black_to_move
+    tokens.append(game.result)
+
+    line = ""
+    for token in tokens:
+        if line and len(line) + 1 + len(token) > line_width:
+            out.write(line + "\n")
+            line = token
+        else:
+            line = f"{line} {token}" if line else token
+    out.write(line + "\n\n")
+
+
+def board_state_to_game(board_state: BoardState, headers: dict[str, str] | None = None,
+                        starting_fen: str | None = None, result: str = "*") -> PgnGame:
+    """
+    Build a game for export from a BoardState's move_history (which must hold SAN moves).
+
+    Args:
+        board_state (BoardState): The game's board.
+        headers (dict[str, str] | None): Tag pairs to include.
+        starting_fen (str | None): The game's starting position, if not the standard one.
+        result (str): The game result.
+
+    Returns:
+        PgnGame: The game, ready for write_game.
+    """
+    game = PgnGame(headers=dict(headers or {}), moves=list(board_state.move_history), result=result)
+    if starting_fen is not None and starting_fen != START_POSITION_FEN:
+        game.headers["SetUp"] = "1"
+        game.headers["FEN"] = starting_fen
+    return game
+
+
+def generate_random_games(count: int, max_plies: int = 80, seed: int = 0) -> Iterator[PgnGame]:
+    """
+    Generate games of random legal moves, for benchmarking the reader.
+    """
+    rng = random.Random(seed)
+    transposition_table = TranspositionTable()
+
+    for index in range(count):
+        board_state = BoardState.from_fen(START_POSITION_FEN, transposition_table=transposition_table)
+        moves = []
+        undos = []
+        for _ in range(max_plies):
+            legal_moves = board_state.get_legal_moves()
+            if not legal_moves:
+                break
+
+            move = rng.choice(legal_moves)
+            moves.append(move)
+            undos.append(board_state.make_move(move))
+
+        for undo in reversed(undos):
+            board_state.unmake_move(undo)
+
+        yield PgnGame(headers={"Event": "Random game", "Round": str(index + 1)},
+                      moves=moves_to_san(board_state, moves), result="*")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chess_2.utils.pgn", description="Benchmark the PGN reader.")
+    parser.add_argument("file", help="PGN file to read")
+    parser.add_argument("--generate", type=int, metavar="N", help="first write N random games to the file")
+    args = parser.parse_args(argv)
+
+    if args.generate:
+        with open(args.file, "w") as out:
+            for game in generate_random_games(args.generate):
+                write_game(game, out)
+
+    with open(args.file) as source:
+        start = time.perf_counter()
+        games = sum(1 for _ in read_games(source))
+        parse_seconds = time.perf_counter() - start
+
+    skipped = []
+    with open(args.file) as source:
+        start = time.perf_counter()
+        plies = sum(len(moves) for moves in read_game_moves(source, on_error=lambda game, e: skipped.append(e)))
+        replay_seconds = time.perf_counter() - start
+
+    print(f"parse   games {games}  time {parse_seconds:.3f}s  games/s {games / parse_seconds:,.0f}")
+    print(f"replay  games {games}  plies {plies}  skipped {len(skipped)}  time {replay_seconds:.3f}s  "
+          f"games/s {games / replay_seconds:,.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
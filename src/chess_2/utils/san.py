@@ -0,0 +1,267 @@
+"""
+Standard Algebraic Notation (SAN), e.g. 'Nf3', 'exd5', 'R1a3', 'O-O', 'e8=Q+', 'Qh4#'.
+
+Disambiguation is worked out from the position's legal move list, grouped once by
+piece type and destination, so writing moves never regenerates moves per move.
+A check suffix only needs an attack scan of the opponent's king; the opponent's
+moves are only generated to tell check from mate.
+"""
+import re
+
+from chess_2.utils.enums import PieceType
+from chess_2.utils.types import Position, Move
+from chess_2.utils.fen import FILE_TO_INDEX, RANK_TO_INDEX, index_to_algebraic, algebraic_to_index
+from chess_2.utils.input_validation import InvalidNotation, IllegalMove
+from chess_2.board.board_state import BoardState
+from chess_2.piece_movement.move_generator import is_king_in_check
+
+SAN_PIECE_LETTERS: dict[PieceType, str] = {
+    PieceType.KNIGHT: "N",
+    PieceType.BISHOP: "B",
+    PieceType.ROOK: "R",
+    PieceType.QUEEN: "Q",
+    PieceType.KING: "K",
+}
+SAN_LETTER_PIECES: dict[str, PieceType] = {letter: piece_type for piece_type, letter in SAN_PIECE_LETTERS.items()}
+
+SAN_PATTERN = re.compile(
+    r"^(?P<piece>[NBRQK])?(?P<from_file>[a-h])?(?P<from_rank>[1-8])?(?P<capture>x)?"
+    r"(?P<to>[a-h][1-8])(?:=?(?P<promotion>[NBRQ]))?$"
+)
+CASTLING_SAN = {"O-O": 6, "O-O-O": 2, "0-0": 6, "0-0-0": 2}  # Castling notation -> king's destination column
+
+# Check/mate markers and annotation glyphs that may trail a SAN move
+SAN_SUFFIX_CHARS = "+#!?"
+
+
+def san_to_move(board_state: BoardState, san: str, legal_moves: list[Move] | None = None) -> Move:
+    """
+    Resolve a SAN move against the legal moves of the player to move.
+
+    Args:
+        board_state (BoardState): The position the move is played in.
+        san (str): The move in SAN (check, mate and annotation suffixes are allowed).
+        legal_moves (list[Move] | None): The legal moves of the position, if already generated.
+
+    Returns:
+        Move: The matching legal move.
+
+    Raises:
+        InvalidNotation: If the text is not SAN, or matches more than one legal move.
+        IllegalMove: If no legal move matches.
+    """
+    if legal_moves is None:
+        legal_moves = board_state.get_legal_moves()
+    piece_loc = board_state.piece_pos
+    text = san.rstrip(SAN_SUFFIX_CHARS)
+
+    if text in CASTLING_SAN:
+        to_col = CASTLING_SAN[text]
+        candidates = [
+            move for move in legal_moves
+            if piece_loc[move.from_pos].piece_type == PieceType.KING
+            and abs(move.to_pos.col - move.from_pos.col) == 2 and move.to_pos.col == to_col
+        ]
+    else:
+        match = SAN_PATTERN.match(text)
+        if match is None:
+            raise InvalidNotation(san)
+
+        piece_type = SAN_LETTER_PIECES[match["piece"]] if match["piece"] else PieceType.PAWN
+        to_pos = algebraic_to_index(match["to"])
+        from_col = FILE_TO_INDEX[match["from_file"]] if match["from_file"] else None
+        from_row = RANK_TO_INDEX[match["from_rank"]] if match["from_rank"] else None
+        promotion = SAN_LETTER_PIECES[match["promotion"]] if match["promotion"] else None
+
+        # A promotion without a piece letter promotes to a queen
+        candidates = [
+            move for move in legal_moves
+            if move.to_pos == to_pos
+            and piece_loc[move.from_pos].piece_type == piece_type
+            and (from_col is None or move.from_pos.col == from_col)
+            and (from_row is None or move.from_pos.row == from_row)
+            and (move.promotion == (promotion or PieceType.QUEEN) if move.promotion else promotion is None)
+        ]
+
+    if not candidates:
+        raise IllegalMove(san, reason="No legal move matches")
+    if len(candidates) > 1:
+        raise InvalidNotation(san)
+    return candidates[0]
+
+
+def _destination_groups(piece_loc: dict, legal_moves: list[Move]) -> dict[tuple[PieceType, Position], list[Position]]:
+    """
+    Group the legal moves' origin squares by (piece type, destination), in one pass.
+    """
+    groups: dict[tuple[PieceType, Position], list[Position]] = {}
+    for move in legal_moves:
+        groups.setdefault((piece_loc[move.from_pos].piece_type, move.to_pos), []).append(move.from_pos)
+    return groups
+
+
+def _san_without_suffix(piece_loc: dict, move: Move, groups: dict[tuple[PieceType, Position], list[Position]]) -> str:
+    piece = piece_loc[move.from_pos]
+
+    if piece.piece_type == PieceType.KING and abs(move.to_pos.col - move.from_pos.col) == 2:
+        return "O-O" if move.to_pos.col == 6 else "O-O-O"
+
+    to_square = index_to_algebraic(move.to_pos)
+    from_square = index_to_algebraic(move.from_pos)
+
+    if piece.piece_type == PieceType.PAWN:
+        san = to_square
+        if move.from_pos.col != move.to_pos.col:  # Pawn captures, including en passant
+            san = from_square[0] + "x" + san
+        if move.to_pos.row in (0, 7):
+            san += "=" + SAN_PIECE_LETTERS[move.promotion or PieceType.QUEEN]
+        return san
+
+    rivals = [pos for pos in groups.get((piece.piece_type, move.to_pos), ()) if pos != move.from_pos]
+    if not rivals:
+        disambiguation = ""
+    elif all(pos.col != move.from_pos.col for pos in rivals):
+        disambiguation = from_square[0]
+    elif all(pos.row != move.from_pos.row for pos in rivals):
+        disambiguation = from_square[1]
+    else:
+        disambiguation = from_square
+
+    target = piece_loc.get(move.to_pos)
+    capture = "x" if target is not None and target.piece_type != PieceType.EMPTY else ""
+    return SAN_PIECE_LETTERS[piece.piece_type] + disambiguation + capture + to_square
+
+
+def _check_suffix(board_state: BoardState, next_legal_moves: list[Move] | None = None) -> str:
+    """
+    Get '+' or '#' for the position after a move (board_state must already have the move made).
+
+    Mate is only looked for when the side to move is in check, and next_legal_moves is used
+    when the caller already generated them.
+    """
+    king = board_state.pieces.king(board_state.player_turn)
+    if king is None or not is_king_in_check(king, board_state.piece_pos):
+        return ""
+
+    if next_legal_moves is None:
+        next_legal_moves = board_state.get_legal_moves()
+    return "+" if next_legal_moves else "#"
+
+
+def move_to_san(board_state: BoardState, move: Move, legal_moves: list[Move] | None = None) -> str:
+    """
+    Write a legal move in SAN, with the minimal disambiguation and a check or mate suffix.
+
+    A promoting move without a promotion piece is written as promoting to a queen. To write many moves of one
+    position, use legal_moves_to_san; to write a whole line, use moves_to_san.
+
+    Args:
+        board_state (BoardState): The position the move is played in. It is restored before returning.
+        move (Move): The move to write.
+        legal_moves (list[Move] | None): The legal moves of the position, if already generated.
+
+    Returns:
+        str: The move in SAN.
+    """
+    if legal_moves is None:
+        legal_moves = board_state.get_legal_moves()
+
+    san = _san_without_suffix(board_state.piece_pos, move, _destination_groups(board_state.piece_pos, legal_moves))
+
+    undo = board_state.make_move(move)
+    san += _check_suffix(board_state)
+    board_state.unmake_move(undo)
+    return san
+
+
+def legal_moves_to_san(board_state: BoardState, legal_moves: list[Move] | None = None) -> dict[Move, str]:
+    """
+    Write every legal move of a position in SAN, disambiguating from a single grouping of the move list.
+
+    Args:
+        board_state (BoardState): The position. It is restored before returning.
+        legal_moves (list[Move] | None): The legal moves of the position, if already generated.
+
+    Returns:
+        dict[Move, str]: The SAN of each legal move.
+    """
+    if legal_moves is None:
+        legal_moves = board_state.get_legal_moves()
+    groups = _destination_groups(board_state.piece_pos, legal_moves)
+
+    sans = {}
+    for move in legal_moves:
+        san = _san_without_suffix(board_state.piece_pos, move, groups)
+        undo = board_state.make_move(move)
+        sans[move] = san + _check_suffix(board_state)
+        board_state.unmake_move(undo)
+
+    return sans
+
+
+def moves_to_san(board_state: BoardState, moves: list[Move]) -> list[str]:
+    """
+    Write a line of moves in SAN, generating the legal moves of each position only once.
+
+    The move list generated after each move serves both the mate test for that move and the
+    disambiguation of the next one, so a game of n moves costs n generations.
+
+    Args:
+        board_state (BoardState): The position the line starts from. It is restored before returning.
+        moves (list[Move]): The moves, which must be legal in turn.
+
+    Returns:
+        list[str]: The SAN of each move.
+
+    Raises:
+        IllegalMove: If a move is not legal in its position.
+    """
+    sans = []
+    undos = []
+    legal_moves = board_state.get_legal_moves()
+
+    try:
+        for move in moves:
+            if move not in legal_moves:
+                raise IllegalMove(f"{index_to_algebraic(move.from_pos)}{index_to_algebraic(move.to_pos)}",
+                                  reason="Move is not legal in this position")
+
+            san = _san_without_suffix(board_state.piece_pos, move, _destination_groups(board_state.piece_pos, legal_moves))
+            undos.append(board_state.make_move(move))
+
+            legal_moves = board_state.get_legal_moves()
+            sans.append(san + _check_suffix(board_state, legal_moves))
+    finally:
+        for undo in reversed(undos):
+            board_state.unmake_move(undo)
+
+    return sans
+
+
+def san_to_moves(board_state: BoardState, sans: list[str]) -> list[Move]:
+    """
+    Resolve a line of SAN moves, generating the legal moves of each position only once.
+
+    Args:
+        board_state (BoardState): The position the line starts from. It is restored before returning.
+        sans (list[str]): The moves in SAN.
+
+    Returns:
+        list[Move]: The resolved moves.
+
+    Raises:
+        InvalidNotation, IllegalMove: If a move cannot be resolved.
+    """
+    moves = []
+    undos = []
+
+    try:
+        for san in sans:
+            move = san_to_move(board_state, san)
+            moves.append(move)
+            undos.append(board_state.make_move(move))
+    finally:
+        for undo in reversed(undos):
+            board_state.unmake_move(undo)
+
+    return moves
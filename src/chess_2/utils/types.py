@@ -1,5 +1,54 @@
 from collections import namedtuple
 
+from chess_2.utils.enums import PieceType
+
 Position = namedtuple('Position', ['row', 'col'])
 
- 
\ No newline at end of file
+# promotion is the piece type a pawn promotes to, None for every other move
+Move = namedtuple('Move', ['from_pos', 'to_pos', 'promotion'], defaults=[None])
+
+# One shared Position per square, indexed by row * 8 + col
+SQUARES: list[Position] = [Position(row, col) for row in range(8) for col in range(8)]
+
+# Moves packed into an int: from square | to square << 6 | promotion code << 12, with squares
+# numbered row * 8 + col. Packed moves stay below 2**15, so they fit in an unsigned short.
+MOVE_SQUARE_BITS = 6
+MOVE_SQUARE_MASK = (1 << MOVE_SQUARE_BITS) - 1
+MOVE_PROMOTION_SHIFT = 2 * MOVE_SQUARE_BITS
+
+# Promotion code 0 means no promotion
+PROMOTION_CODES: dict[PieceType | None, int] = {
+    None: 0,
+    PieceType.KNIGHT: 1,
+    PieceType.BISHOP: 2,
+    PieceType.ROOK: 3,
+    PieceType.QUEEN: 4,
+}
+PROMOTION_CODE_PIECES: dict[int, PieceType | None] = {code: piece_type for piece_type, code in PROMOTION_CODES.items()}
+
+_DECODED_MOVES: list[Move] = [
+    Move(SQUARES[code & MOVE_SQUARE_MASK], SQUARES[code >> MOVE_SQUARE_BITS])
+    for code in range(1 << (2 * MOVE_SQUARE_BITS))
+]
+
+
+def encode_move(move: Move) -> int:
+    """
+    Pack a move into a single int.
+    """
+    (from_row, from_col), (to_row, to_col), promotion = move
+    return ((from_row * 8 + from_col) | ((to_row * 8 + to_col) << MOVE_SQUARE_BITS)
+            | (PROMOTION_CODES[promotion] << MOVE_PROMOTION_SHIFT))
+
+
+def decode_move(code: int) -> Move:
+    """
+    Unpack a move packed by encode_move. Moves without a promotion are shared, so the result must not be modified.
+    """
+    if code < len(_DECODED_MOVES):
+        return _DECODED_MOVES[code]
+    return Move(
+        SQUARES[code & MOVE_SQUARE_MASK],
+        SQUARES[(code >> MOVE_SQUARE_BITS) & MOVE_SQUARE_MASK],
+        PROMOTION_CODE_PIECES[code >> MOVE_PROMOTION_SHIFT],
+    )
@@ -0,0 +1,101 @@
+"""
+Zobrist hashing of board positions.
+
+Every (piece, square) pair, the side to move, each castling right and each
+en passant file is assigned a fixed random 64-bit number. A position's key is
+the XOR of the numbers for everything present in it, so making a move only
+needs the numbers for what the move changed to be XORed in or out.
+
+The en passant file only counts when a pawn of the side to move stands beside
+the pawn that just advanced two squares. Otherwise the capture was never
+possible, and the position must repeat the same one reached without the double push.
+"""
+import random
+
+from chess_2.utils.enums import Color, PieceType
+from chess_2.utils.types import Position
+from chess_2.piece.piece import Piece
+from chess_2.utils.move_validation import CASTLING_HOME_SQUARES, get_castling_rights
+from chess_2.board.move_execution import get_en_passant_pawn
+
+ZOBRIST_SEED = 20250502  # Fixed so keys are reproducible across processes and runs
+
+_rng = random.Random(ZOBRIST_SEED)
+
+PIECE_SQUARE_KEYS: dict[tuple[Color, PieceType], list[int]] = {
+    (color, piece_type): [_rng.getrandbits(64) for _ in range(64)]
+    for color in (Color.WHITE, Color.BLACK)
+    for piece_type in PieceType
+    if piece_type != PieceType.EMPTY
+}
+SIDE_TO_MOVE_KEY: int = _rng.getrandbits(64)  # XORed in when black is to move
+CASTLING_KEYS: dict[str, int] = {right: _rng.getrandbits(64) for right in CASTLING_HOME_SQUARES}
+EN_PASSANT_FILE_KEYS: list[int] = [_rng.getrandbits(64) for _ in range(8)]
+
+
+def piece_square_key(piece: Piece, pos: Position) -> int:
+    """
+    Get the key for a piece standing on a square (0 for an empty square).
+    """
+    if piece.piece_type == PieceType.EMPTY or piece.color == Color.NONE:
+        return 0
+    return PIECE_SQUARE_KEYS[(piece.color, piece.piece_type)][pos[0] * 8 + pos[1]]
+
+
+def castling_key(rights: str) -> int:
+    """
+    Get the combined key for a set of castling rights (e.g., 'KQkq').
+    """
+    key = 0
+    for right in rights:
+        key ^= CASTLING_KEYS[right]
+    return key
+
+
+def _can_be_captured_en_passant(pawn: Piece, piece_loc: dict[Position, Piece]) -> bool:
+    """
+    Check whether an opposing pawn stands beside the en_passantable pawn on its rank.
+    """
+    row, col = pawn.position
+    for side_col in (col - 1, col + 1):
+        neighbour = piece_loc.get(Position(row, side_col)) if 0 <= side_col < 8 else None
+        if neighbour is not None and neighbour.piece_type == PieceType.PAWN and neighbour.color not in (pawn.color, Color.NONE):
+            return True
+    return False
+
+
+def state_key(piece_loc: dict[Position, Piece]) -> int:
+    """
+    Get the key for the castling rights and en passant file of a board.
+
+    The en passant file is only included when an opposing pawn could make the capture.
+    """
+    key = castling_key(get_castling_rights(piece_loc))
+
+    pawn = get_en_passant_pawn(piece_loc)
+    if pawn is not None and _can_be_captured_en_passant(pawn, piece_loc):
+        key ^= EN_PASSANT_FILE_KEYS[pawn.position.col]
+
+    return key
+
+
+def compute_zobrist_key(piece_loc: dict[Position, Piece], player_turn: Color) -> int:
+    """
+    Compute the Zobrist key of a position from scratch.
+
+    Args:
+        piece_loc (dict[Position, Piece]): The board state.
+        player_turn (Color): The color to move.
+
+    Returns:
+        int: The 64-bit Zobrist key.
+    """
+    key = state_key(piece_loc)
+
+    for pos, piece in piece_loc.items():
+        key ^= piece_square_key(piece, pos)
+
+    if player_turn == Color.BLACK:
+        key ^= SIDE_TO_MOVE_KEY
+
+    return key
@@ -0,0 +1,54 @@
+import pytest
+
+from chess_2.batch import PositionError, generate_legal_moves_batch, legal_moves_for_fen, main
+from chess_2.perft import BENCHMARK_SUITE
+
+
+FENS = [position.fen for position in BENCHMARK_SUITE]
+
+
+def test_legal_moves_for_fen_reads_side_to_move():
+    assert len(legal_moves_for_fen(BENCHMARK_SUITE[0].fen)) == 20
+    assert len(legal_moves_for_fen("4k3/8/8/8/8/8/8/4K2R b K - 0 1")) == 5
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_matches_single_position_results_in_order(workers):
+    fens = FENS * 3
+    results = list(generate_legal_moves_batch(iter(fens), workers=workers, chunksize=2))
+
+    assert results == [legal_moves_for_fen(fen) for fen in fens]
+
+
+def test_batch_bitboard_backend():
+    results = list(generate_legal_moves_batch(FENS, workers=2, chunksize=3, backend="bitboard"))
+    assert results == [legal_moves_for_fen(fen, "bitboard") for fen in FENS]
+    assert len(results[1]) == 48  # Kiwipete
+
+
+def test_batch_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        list(generate_legal_moves_batch(FENS, backend="abacus"))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_reports_malformed_positions_in_order_and_continues(workers):
+    fens = [FENS[0], "not a fen", FENS[1], "4k3/8/8/8/8/8/8/4K3 w KQ - 0 1", FENS[2]]
+    results = list(generate_legal_moves_batch(fens, workers=workers, chunksize=2))
+
+    assert len(results) == 5
+    assert isinstance(results[1], PositionError) and results[1].fen == "not a fen"
+    assert isinstance(results[3], PositionError) and "Castling" in results[3].message
+    assert [results[i] for i in (0, 2, 4)] == [legal_moves_for_fen(fens[i]) for i in (0, 2, 4)]
+
+
+def test_main_reports_malformed_positions(tmp_path, capsys):
+    path = tmp_path / "positions.fen"
+    path.write_text(f"{FENS[0]}\nnot a fen\n{FENS[1]}\n")
+
+    assert main([str(path), "--workers", "1", "--print"]) == 1
+    captured = capsys.readouterr()
+    assert captured.out.splitlines()[1] == ""
+    assert len(captured.out.splitlines()[2].split()) == 48
+    assert "error position 2" in captured.err
+    assert "positions 3" in captured.err and "errors 1" in captured.err
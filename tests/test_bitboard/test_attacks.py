@@ -0,0 +1,85 @@
+from chess_2.utils.fen import algebraic_to_index
+from chess_2.bitboard.attacks import (
+    KNIGHT_ATTACKS,
+    KING_ATTACKS,
+    PAWN_ATTACKS,
+    WHITE,
+    BLACK,
+    bswap,
+    iter_squares,
+    square_of,
+    rook_attacks,
+    bishop_attacks,
+    queen_attacks,
+    BETWEEN,
+    LINE,
+)
+
+
+def bb(*squares: str) -> int:
+    result = 0
+    for square in squares:
+        result |= 1 << square_of(algebraic_to_index(square))
+    return result
+
+
+def test_square_of_corners():
+    assert square_of(algebraic_to_index("a1")) == 0
+    assert square_of(algebraic_to_index("h1")) == 7
+    assert square_of(algebraic_to_index("a8")) == 56
+    assert square_of(algebraic_to_index("h8")) == 63
+
+
+def test_bswap_mirrors_ranks():
+    assert bswap(bb("a1", "h2")) == bb("a8", "h7")
+
+
+def test_iter_squares_lowest_first():
+    assert list(iter_squares(bb("h8", "a1", "e4"))) == [0, 28, 63]
+
+
+def test_knight_attacks_from_corner():
+    assert KNIGHT_ATTACKS[square_of(algebraic_to_index("a1"))] == bb("b3", "c2")
+
+
+def test_king_attacks_from_edge():
+    assert KING_ATTACKS[square_of(algebraic_to_index("e1"))] == bb("d1", "f1", "d2", "e2", "f2")
+
+
+def test_pawn_attacks_by_color():
+    e4 = square_of(algebraic_to_index("e4"))
+    assert PAWN_ATTACKS[WHITE][e4] == bb("d5", "f5")
+    assert PAWN_ATTACKS[BLACK][e4] == bb("d3", "f3")
+    assert PAWN_ATTACKS[WHITE][square_of(algebraic_to_index("a2"))] == bb("b3")
+
+
+def test_rook_attacks_stop_at_blockers():
+    d4 = square_of(algebraic_to_index("d4"))
+    occupied = bb("d4", "d6", "b4", "g4")
+
+    expected = bb("d5", "d6", "d3", "d2", "d1", "c4", "b4", "e4", "f4", "g4")
+    assert rook_attacks(occupied, d4) == expected
+
+
+def test_bishop_attacks_stop_at_blockers():
+    c1 = square_of(algebraic_to_index("c1"))
+    occupied = bb("c1", "e3", "b2")
+
+    assert bishop_attacks(occupied, c1) == bb("d2", "e3", "b2")
+
+
+def test_queen_attacks_on_empty_board():
+    a1 = square_of(algebraic_to_index("a1"))
+    assert bin(queen_attacks(0, a1)).count("1") == 21
+
+
+def test_between_and_line_tables():
+    def sq(name):
+        return square_of(algebraic_to_index(name))
+
+    assert BETWEEN[sq("a1")][sq("h8")] == bb("b2", "c3", "d4", "e5", "f6", "g7")
+    assert BETWEEN[sq("e1")][sq("a1")] == bb("b1", "c1", "d1")
+    assert BETWEEN[sq("e1")][sq("e2")] == 0
+    assert BETWEEN[sq("e1")][sq("f3")] == 0
+    assert LINE[sq("e1")][sq("e4")] == bb(*(f"e{rank}" for rank in range(1, 9)))
+    assert LINE[sq("e1")][sq("f3")] == 0
@@ -0,0 +1,105 @@
+import pytest
+from chess_2.utils.enums import Color, PieceType
+from chess_2.utils.fen import algebraic_to_index, parse_fen, START_FEN
+from chess_2.piece.piece import Piece
+from chess_2.bitboard.position import BitboardPosition, WHITE_KINGSIDE, BLACK_QUEENSIDE
+from chess_2.bitboard import move_generator as bitboard
+from chess_2.piece_movement import move_generator
+from chess_2.board.backends import load_position
+from chess_2.perft import BENCHMARK_SUITE, run_perft
+
+from tests.helpers import generate_empty_board, place_king
+
+
+def as_move_set(all_moves):
+    return {(piece.position, dest) for piece, destinations in all_moves for dest in destinations}
+
+
+@pytest.mark.parametrize("position", BENCHMARK_SUITE, ids=lambda position: position.name)
+def test_bitboard_perft_matches_published_counts(position):
+    board_state = load_position(position.fen)
+    bitboard_position = BitboardPosition.from_piece_loc(board_state.piece_pos, board_state.player_turn)
+
+    for depth in (1, 2):
+        assert bitboard.perft(bitboard_position, depth) == position.node_counts[depth]
+
+
+def test_bitboard_perft_matches_dict_backend():
+    assert run_perft(START_FEN, 3, backend="bitboard").nodes == run_perft(START_FEN, 3, backend="dict").nodes
+
+
+def test_get_all_valid_moves_matches_dict_backend():
+    piece_loc = parse_fen(START_FEN)
+
+    expected = as_move_set(move_generator.get_all_valid_moves(Color.WHITE, piece_loc))
+    all_moves = bitboard.get_all_valid_moves(Color.WHITE, piece_loc)
+
+    assert as_move_set(all_moves) == expected
+    assert all(piece_loc[piece.position] is piece for piece, _ in all_moves)
+
+
+def test_get_all_valid_moves_excludes_pins():
+    board = generate_empty_board()
+    place_king(board, Color.WHITE, pos="e1")
+    rook_pos = algebraic_to_index("e2")
+    board[rook_pos] = Piece(position=rook_pos, color=Color.WHITE, piece_type=PieceType.ROOK)
+    queen_pos = algebraic_to_index("e8")
+    board[queen_pos] = Piece(position=queen_pos, color=Color.BLACK, piece_type=PieceType.QUEEN)
+
+    rook_moves = {dest for piece, dests in bitboard.get_all_valid_moves(Color.WHITE, board)
+                  if piece.piece_type == PieceType.ROOK for dest in dests}
+
+    assert rook_moves == {algebraic_to_index(f"e{rank}") for rank in range(3, 9)}
+
+
+def test_castling_rights_read_from_has_moved():
+    piece_loc = parse_fen("r3k2r/8/8/8/8/8/8/R3K2R")
+    piece_loc[algebraic_to_index("a1")].has_moved = True
+    piece_loc[algebraic_to_index("h8")].has_moved = True
+
+    position = BitboardPosition.from_piece_loc(piece_loc, Color.WHITE)
+
+    assert position.castling == WHITE_KINGSIDE | BLACK_QUEENSIDE
+
+
+def test_make_unmake_restores_position():
+    board_state = load_position(BENCHMARK_SUITE[1].fen)
+    position = BitboardPosition.from_piece_loc(board_state.piece_pos, board_state.player_turn)
+    before = (list(position.pieces), list(position.occupancy), list(position.board),
+              position.side, position.castling, position.ep_square)
+
+    for move in bitboard.generate_legal_moves(position):
+        undo = position.make_move(move)
+        position.unmake_move(move, undo)
+
+    after = (list(position.pieces), list(position.occupancy), list(position.board),
+             position.side, position.castling, position.ep_square)
+    assert after == before
+
+
+def test_divide_names_promotions():
+    board_state = load_position("n1n5/PPPk4/8/8/8/8/4Kppp/5N1N b - - 0 1")
+    position = BitboardPosition.from_piece_loc(board_state.piece_pos, board_state.player_turn)
+
+    counts = bitboard.divide(position, 1)
+
+    assert {"g2h1q", "g2h1r", "g2h1b", "g2h1n"} <= set(counts)
+
+
+@pytest.mark.parametrize("fen", [
+    "8/8/8/KPp4r/8/8/8/4k3 w - c6 0 1",  # En passant would uncover the rook's check along the rank
+    "4k3/8/8/8/1b6/8/3P4/4K3 w - - 0 1",  # Pinned pawn cannot push
+    "4k3/8/8/8/8/5n2/8/r3K3 w - - 0 1",  # Double check: only the king moves
+    "4k3/8/8/8/4r3/8/8/4K2R w K - 0 1",  # No castling out of check
+    "4k3/4r3/8/8/8/8/4K3/7R w - - 0 1",  # The king cannot retreat along the checking ray
+    "4k3/8/8/8/4q3/8/8/2B1K1N1 w - - 0 1",  # Check that can be blocked but not captured
+])
+def test_legal_moves_match_dict_backend_in_checks_and_pins(fen):
+    board_state = load_position(fen)
+    expected = {(move.from_pos, move.to_pos, move.promotion)
+                for move in move_generator.get_legal_move_list(board_state.player_turn, board_state.piece_pos)}
+
+    moves = bitboard.get_legal_move_list(board_state.player_turn, board_state.piece_pos)
+
+    assert set(moves) == expected
+    assert run_perft(fen, 3, backend="bitboard").nodes == run_perft(fen, 3, backend="dict").nodes
@@ -0,0 +1,67 @@
+import random
+
+from chess_2.utils.enums import Color
+from chess_2.utils.fen import algebraic_to_index, parse_fen, START_FEN
+from chess_2.board.board_state import BoardState
+from chess_2.board.attack_maps import AttackMaps
+from chess_2.piece_movement.move_generator import get_legal_move_list, is_square_under_attack
+from chess_2.utils.types import SQUARES, encode_move
+
+KIWIPETE = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+def test_attack_counts_of_start_position():
+    attacks = AttackMaps(parse_fen(START_FEN))
+
+    # e3 is attacked by the d2 and f2 pawns; f3 by the e2 and g2 pawns and the g1 knight
+    assert attacks.attack_count(algebraic_to_index("e3"), Color.WHITE) == 2
+    assert attacks.attack_count(algebraic_to_index("f3"), Color.WHITE) == 3
+    assert not attacks.is_attacked(algebraic_to_index("e4"), Color.WHITE)
+    assert attacks.is_attacked(algebraic_to_index("f6"), Color.BLACK)
+
+
+def test_attack_maps_agree_with_board_scan():
+    piece_loc = parse_fen(KIWIPETE.split()[0])
+    attacks = AttackMaps(piece_loc)
+
+    for pos in SQUARES:
+        # is_square_under_attack takes the defending color
+        assert attacks.is_attacked(pos, Color.BLACK) == is_square_under_attack(pos, Color.WHITE, piece_loc)
+        assert attacks.is_attacked(pos, Color.WHITE) == is_square_under_attack(pos, Color.BLACK, piece_loc)
+
+
+def test_incremental_updates_match_a_rebuild():
+    board_state = BoardState.from_fen(KIWIPETE, attack_maps=True)
+    rng = random.Random(11)
+    undos = []
+
+    for _ in range(40):
+        legal_moves = board_state.get_legal_moves()
+        if not legal_moves:
+            break
+        undos.append(board_state.make_move(rng.choice(legal_moves)))
+        assert board_state.attacks.counts == AttackMaps(board_state.piece_pos).counts
+
+    for undo in reversed(undos):
+        board_state.unmake_move(undo)
+        assert board_state.attacks.counts == AttackMaps(board_state.piece_pos).counts
+
+
+def test_move_piece_castling_updates_attack_maps():
+    board_state = BoardState.from_fen(KIWIPETE, attack_maps=True)
+    board_state.attacks  # Build the maps before the move
+
+    board_state.move_piece(board_state.piece_pos[algebraic_to_index("e1")], algebraic_to_index("c1"))
+
+    assert board_state.attacks.counts == AttackMaps(board_state.piece_pos).counts
+    assert board_state.is_square_attacked(algebraic_to_index("d2"), Color.WHITE)
+
+
+def test_generation_with_attack_maps_matches_without():
+    for fen in (KIWIPETE, "r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1", "4k3/8/8/8/8/8/3q4/4K3 w - - 0 1"):
+        board_state = BoardState.from_fen(fen, attack_maps=True)
+        color = board_state.player_turn
+
+        assert (sorted(get_legal_move_list(color, board_state.piece_pos, board_state.pieces, board_state.attacks),
+                       key=encode_move)
+                == sorted(get_legal_move_list(color, board_state.piece_pos), key=encode_move))
@@ -1,9 +1,9 @@
 import pytest
 from chess_2.piece.piece import Piece
 from chess_2.utils.enums import PieceType, Color
-from chess_2.utils.types import Position
+from chess_2.utils.types import Position, Move
 from chess_2.board.board_state import BoardState  # assuming the BoardState class is in the boardstate module
-from chess_2.utils.fen import algebraic_to_index
+from chess_2.utils.fen import algebraic_to_index, START_FEN
 from tests.helpers import generate_empty_board
 
 def test_switch_player_turn():
@@ -121,3 +121,75 @@ def test_check_if_white_is_in_checkmate():
     board_state.check_if_current_player_is_in_checkmate()
 
     assert board_state.is_in_checkmate is True
+
+def test_board_state_fen_round_trip():
+    fen = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R b KQkq - 3 17"
+    board_state = BoardState.from_fen(fen)
+
+    assert board_state.player_turn == Color.BLACK
+    assert board_state.to_fen() == fen
+
+def test_board_state_clocks_follow_make_and_unmake():
+    board_state = BoardState.from_fen(START_FEN + " w KQkq - 0 1")
+    knight_out = board_state.make_move(Move(algebraic_to_index("g1"), algebraic_to_index("f3")))
+    pawn_push = board_state.make_move(Move(algebraic_to_index("e7"), algebraic_to_index("e5")))
+
+    assert board_state.to_fen() == "rnbqkbnr/pppp1ppp/8/4p3/8/5N2/PPPPPPPP/RNBQKB1R w KQkq e6 0 2"
+
+    board_state.unmake_move(pawn_push)
+    assert board_state.to_fen() == "rnbqkbnr/pppppppp/8/8/8/5N2/PPPPPPPP/RNBQKB1R b KQkq - 1 1"
+
+    board_state.unmake_move(knight_out)
+    assert board_state.to_fen() == START_FEN + " w KQkq - 0 1"
+
+
+def assert_matches_fresh_board(board_state):
+    fresh = BoardState.from_fen(board_state.to_fen(), attack_maps=True)
+    assert board_state.zobrist_key == fresh.zobrist_key
+    assert board_state.attacks.counts == fresh.attacks.counts
+    for color in (Color.WHITE, Color.BLACK):
+        assert ({(piece.piece_type, piece.position) for piece in board_state.pieces.pieces(color)}
+                == {(piece.piece_type, piece.position) for piece in fresh.pieces.pieces(color)})
+    scores, fresh_scores = board_state.scores, fresh.scores
+    assert (scores.middlegame, scores.endgame, scores.phase) == (fresh_scores.middlegame, fresh_scores.endgame,
+                                                                 fresh_scores.phase)
+
+@pytest.mark.parametrize("fen, move, expected", [
+    ("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 2", Move(algebraic_to_index("e5"), algebraic_to_index("d6")),
+     "4k3/8/3P4/8/8/8/8/4K3 b - - 0 2"),
+    ("1r2k3/P7/8/8/8/8/8/4K3 w - - 0 1", Move(algebraic_to_index("a7"), algebraic_to_index("b8"), PieceType.KNIGHT),
+     "1N2k3/8/8/8/8/8/8/4K3 b - - 0 1"),
+    ("1r2k3/P7/8/8/8/8/8/4K3 w - - 0 1", Move(algebraic_to_index("a7"), algebraic_to_index("a8")),
+     "Qr2k3/8/8/8/8/8/8/4K3 b - - 0 1"),
+])
+def test_make_and_unmake_en_passant_and_promotion(fen, move, expected):
+    board_state = BoardState.from_fen(fen, attack_maps=True)
+    board_state.scores  # Build the scores before the move so they are updated incrementally
+
+    undo = board_state.make_move(move)
+    assert board_state.to_fen() == expected
+    assert_matches_fresh_board(board_state)
+
+    board_state.unmake_move(undo)
+    assert board_state.to_fen() == fen
+    assert_matches_fresh_board(board_state)
+
+def test_move_piece_en_passant_promotion_and_flags():
+    board_state = BoardState.from_fen("4k3/1P6/8/8/3p4/8/4P3/4K3 w - - 0 1", attack_maps=True)
+    board_state.scores
+    pawn = board_state.piece_pos[algebraic_to_index("e2")]
+
+    board_state.move_piece(pawn, algebraic_to_index("e4"))
+    board_state.switch_player_turn()
+    assert pawn.has_moved and pawn.en_passantable
+
+    board_state.move_piece(board_state.piece_pos[algebraic_to_index("d4")], algebraic_to_index("e3"))
+    board_state.switch_player_turn()
+    assert not pawn.en_passantable
+    assert board_state.to_fen() == "4k3/1P6/8/8/8/4p3/8/4K3 w - - 0 2"
+    assert_matches_fresh_board(board_state)
+
+    board_state.move_piece(board_state.piece_pos[algebraic_to_index("b7")], algebraic_to_index("b8"), PieceType.ROOK)
+    board_state.switch_player_turn()
+    assert board_state.to_fen() == "1R2k3/8/8/8/8/4p3/8/4K3 b - - 0 2"
+    assert_matches_fresh_board(board_state)
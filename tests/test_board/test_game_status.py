@@ -0,0 +1,111 @@
+import pytest
+
+from chess_2.utils.enums import GameStatus
+from chess_2.utils.fen import algebraic_to_index, START_FEN
+from chess_2.utils.types import Move
+from chess_2.board.board_state import BoardState
+from chess_2.board.game_status import has_insufficient_material
+from chess_2.board.piece_lists import PieceLists
+from chess_2.utils.fen import parse_fen
+
+
+def move(from_square: str, to_square: str) -> Move:
+    return Move(algebraic_to_index(from_square), algebraic_to_index(to_square))
+
+
+@pytest.mark.parametrize("placement, expected", [
+    ("4k3/8/8/8/8/8/8/4K3", True),
+    ("4k3/8/8/8/8/8/8/4KN2", True),
+    ("4k3/8/8/8/8/8/8/2B1KB2", False),   # Bishops on both colors
+    ("2b1k3/8/8/8/8/8/8/4KB2", True),    # Bishops on the same color
+    ("4k3/8/8/8/8/8/8/3NKN2", False),
+    ("4k3/8/8/8/8/8/4P3/4K3", False),
+])
+def test_has_insufficient_material(placement, expected):
+    assert has_insufficient_material(PieceLists(parse_fen(placement))) is expected
+
+
+@pytest.mark.parametrize("fen, expected", [
+    ("R5k1/5ppp/8/8/8/8/8/6K1 b - - 0 1", GameStatus.CHECKMATE),
+    ("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1", GameStatus.STALEMATE),
+    ("4k3/8/8/8/8/8/8/4KB2 w - - 0 1", GameStatus.INSUFFICIENT_MATERIAL),
+    ("4k3/8/8/8/8/8/8/R3K3 w - - 100 80", GameStatus.FIFTY_MOVE_RULE),
+    ("4k3/8/8/8/8/8/8/R3K3 w - - 99 80", GameStatus.ONGOING),
+    ("4k3/8/8/8/8/8/4r3/R3K3 w - - 0 1", GameStatus.CHECK),
+])
+def test_evaluate_status(fen, expected):
+    assert BoardState.from_fen(fen).evaluate_status().status == expected
+
+
+def test_evaluate_status_stops_at_first_move_and_is_cached():
+    board_state = BoardState.from_fen(START_FEN)
+
+    quick = board_state.evaluate_status(generate_moves=False)
+    assert quick.has_legal_moves and quick.legal_moves is None
+    assert board_state.evaluate_status(generate_moves=False) is quick
+
+    full = board_state.evaluate_status()
+    assert len(full.legal_moves) == 20
+    assert board_state.evaluate_status(generate_moves=False) is full
+
+    undo = board_state.make_move(move("e2", "e4"))
+    assert board_state.evaluate_status() is not full
+    board_state.unmake_move(undo)
+
+
+def test_threefold_repetition():
+    board_state = BoardState.from_fen(START_FEN)
+    shuffle = [move("g1", "f3"), move("g8", "f6"), move("f3", "g1"), move("f6", "g8")]
+
+    for repetition in (2, 3):
+        for knight_move in shuffle:
+            board_state.make_move(knight_move)
+        assert board_state.repetition_count() == repetition
+
+    assert board_state.get_game_status() == GameStatus.THREEFOLD_REPETITION
+
+
+@pytest.mark.parametrize("play_through_move_piece", [False, True])
+def test_threefold_repetition_counts_the_position_after_a_double_push(play_through_move_piece):
+    # En passant is never possible after 1.e4, so the position after it occurs three times
+    board_state = BoardState.from_fen(START_FEN)
+    moves = [move("e2", "e4"), move("g8", "f6"), move("g1", "f3"), move("f6", "g8"), move("f3", "g1"),
+             move("g8", "f6"), move("g1", "f3"), move("f6", "g8"), move("f3", "g1")]
+
+    for game_move in moves:
+        if play_through_move_piece:
+            board_state.move_piece(board_state.piece_pos[game_move.from_pos], game_move.to_pos)
+            board_state.switch_player_turn()
+        else:
+            board_state.make_move(game_move)
+
+    assert board_state.repetition_count() == 3
+    assert board_state.evaluate_status().status == GameStatus.THREEFOLD_REPETITION
+
+
+def test_repetition_scan_stops_at_irreversible_move():
+    board_state = BoardState.from_fen(START_FEN)
+    for knight_move in (move("g1", "f3"), move("g8", "f6"), move("f3", "g1"), move("f6", "g8")):
+        board_state.make_move(knight_move)
+    assert board_state.repetition_count() == 2
+
+    board_state.make_move(move("e2", "e4"))
+    board_state.make_move(move("e7", "e5"))
+    assert board_state.halfmove_clock == 0
+    assert board_state.repetition_count() == 1
+
+
+def test_position_keys_are_a_compact_stack():
+    board_state = BoardState.from_fen(START_FEN)
+    start_key = board_state.zobrist_key
+
+    board_state.make_move(move("g1", "f3"))
+    assert board_state.position_keys.itemsize == 8
+    assert list(board_state.position_keys) == [start_key]
+    assert not board_state.is_repetition()
+
+    board_state.make_move(move("g8", "f6"))
+    board_state.make_move(move("f3", "g1"))
+    board_state.make_move(move("f6", "g8"))
+    assert board_state.is_repetition()
+    assert len(board_state.position_keys) == 4
@@ -0,0 +1,97 @@
+import pytest
+from chess_2.utils.enums import Color, PieceType
+from chess_2.utils.types import Position
+from chess_2.utils.fen import algebraic_to_index, parse_fen, START_FEN
+from chess_2.piece.piece import Piece
+from chess_2.board.board_state import BoardState
+from chess_2.board.mailbox import MailboxBoard, OFF_BOARD, EMPTY, BLACK_BIT, PIECE_TYPE_CODES, to_mailbox_index
+from chess_2.piece_movement.move_generator import get_all_valid_moves
+from chess_2.board.backends import load_position
+from chess_2.perft import BENCHMARK_SUITE, perft
+
+from tests.helpers import generate_empty_board
+
+
+def as_move_set(all_moves):
+    return {(piece.position, dest) for piece, destinations in all_moves for dest in destinations}
+
+
+def test_new_mailbox_is_empty_with_sentinel_border():
+    board = MailboxBoard()
+
+    assert len(board) == 64
+    assert all(piece.piece_type == PieceType.EMPTY for piece in board.values())
+    assert board.codes.count(OFF_BOARD) == 120 - 64
+    assert board.codes[to_mailbox_index(Position(0, 0)) - 1] == OFF_BOARD
+
+
+def test_mailbox_behaves_like_dict():
+    board = MailboxBoard()
+    pos = algebraic_to_index("e4")
+    knight = Piece(position=pos, color=Color.BLACK, piece_type=PieceType.KNIGHT)
+
+    board[pos] = knight
+
+    assert board[pos] is knight
+    assert board.get(pos) is knight
+    assert board.get(Position(-1, 0)) is None
+    assert Position(8, 0) not in board
+    assert board.codes[to_mailbox_index(pos)] == PIECE_TYPE_CODES[PieceType.KNIGHT] | BLACK_BIT
+    assert board.to_dict() == {**generate_empty_board(), pos: knight}
+
+    with pytest.raises(KeyError):
+        board[Position(0, 8)]
+
+
+def test_deleting_a_square_empties_it():
+    board = parse_fen(START_FEN, mailbox=True)
+    pos = algebraic_to_index("e2")
+
+    del board[pos]
+
+    assert board[pos].piece_type == PieceType.EMPTY
+    assert board.codes[to_mailbox_index(pos)] == EMPTY
+
+
+def test_parse_fen_mailbox_matches_dict():
+    board = parse_fen(START_FEN, mailbox=True)
+
+    assert isinstance(board, MailboxBoard)
+    assert board == parse_fen(START_FEN)
+
+
+@pytest.mark.parametrize("position", BENCHMARK_SUITE, ids=lambda position: position.name)
+def test_valid_moves_match_dict_board(position):
+    board_state = load_position(position.fen)
+    mailbox_state = load_position(position.fen, backend="mailbox")
+    color = board_state.player_turn
+
+    expected = as_move_set(get_all_valid_moves(color, board_state.piece_pos))
+
+    assert as_move_set(get_all_valid_moves(color, mailbox_state.piece_pos)) == expected
+
+
+@pytest.mark.parametrize("position", BENCHMARK_SUITE, ids=lambda position: position.name)
+def test_is_attacked_matches_dict_board(position):
+    from chess_2.piece_movement.move_generator import is_square_under_attack
+
+    piece_loc = load_position(position.fen).piece_pos
+    mailbox = MailboxBoard(piece_loc)
+
+    for pos in piece_loc:
+        for color in (Color.WHITE, Color.BLACK):
+            assert is_square_under_attack(pos, color, mailbox) == is_square_under_attack(pos, color, piece_loc)
+
+
+def test_board_state_runs_on_mailbox():
+    board_state = BoardState(parse_fen(START_FEN, mailbox=True))
+    pawn = board_state.piece_pos[algebraic_to_index("e2")]
+
+    board_state.move_piece(pawn, algebraic_to_index("e4"))
+
+    assert board_state.piece_pos[algebraic_to_index("e4")] is pawn
+    assert board_state.piece_pos[algebraic_to_index("e2")].piece_type == PieceType.EMPTY
+
+
+def test_mailbox_perft_start_position():
+    assert perft(load_position(START_FEN, backend="mailbox"), 3) == 8902
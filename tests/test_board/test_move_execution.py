@@ -0,0 +1,145 @@
+import pytest
+
+from chess_2.utils.enums import Color, PieceType
+from chess_2.utils.types import Move
+from chess_2.utils.fen import algebraic_to_index, parse_fen, START_FEN
+from chess_2.piece.piece import Piece
+from chess_2.board.board_state import BoardState
+from chess_2.board.move_execution import make_move, unmake_move
+
+from tests.helpers import generate_empty_board, place_king
+
+
+def snapshot(piece_loc):
+    return {pos: (id(piece), piece.position, piece.color, piece.piece_type, piece.has_moved, piece.en_passantable)
+            for pos, piece in piece_loc.items()}
+
+
+def test_make_move_moves_piece_and_sets_has_moved():
+    board = parse_fen(START_FEN)
+    knight = board[algebraic_to_index("g1")]
+
+    make_move(board, Move(algebraic_to_index("g1"), algebraic_to_index("f3")))
+
+    assert board[algebraic_to_index("f3")] is knight
+    assert knight.position == algebraic_to_index("f3")
+    assert knight.has_moved is True
+    assert board[algebraic_to_index("g1")].piece_type == PieceType.EMPTY
+
+
+def test_unmake_move_restores_capture_exactly():
+    board = generate_empty_board()
+    place_king(board, Color.WHITE)
+    place_king(board, Color.BLACK)
+    rook_pos = algebraic_to_index("a1")
+    board[rook_pos] = Piece(position=rook_pos, color=Color.WHITE, piece_type=PieceType.ROOK)
+    target_pos = algebraic_to_index("a7")
+    board[target_pos] = Piece(position=target_pos, color=Color.BLACK, piece_type=PieceType.KNIGHT)
+    before = snapshot(board)
+
+    undo = make_move(board, Move(rook_pos, target_pos))
+    assert board[target_pos].piece_type == PieceType.ROOK
+
+    unmake_move(board, undo)
+    assert snapshot(board) == before
+
+
+def test_make_move_castles_rook_and_unmake_restores_it():
+    board = generate_empty_board()
+    place_king(board, Color.WHITE)
+    rook_pos = algebraic_to_index("h1")
+    board[rook_pos] = Piece(position=rook_pos, color=Color.WHITE, piece_type=PieceType.ROOK)
+    before = snapshot(board)
+
+    undo = make_move(board, Move(algebraic_to_index("e1"), algebraic_to_index("g1")))
+
+    assert board[algebraic_to_index("f1")].piece_type == PieceType.ROOK
+    assert board[algebraic_to_index("f1")].has_moved is True
+    assert board[rook_pos].piece_type == PieceType.EMPTY
+
+    unmake_move(board, undo)
+    assert snapshot(board) == before
+
+
+def test_en_passantable_is_set_and_cleared_then_restored():
+    board = parse_fen(START_FEN)
+
+    make_move(board, Move(algebraic_to_index("e2"), algebraic_to_index("e4")))
+    white_pawn = board[algebraic_to_index("e4")]
+    assert white_pawn.en_passantable is True
+
+    undo = make_move(board, Move(algebraic_to_index("g8"), algebraic_to_index("f6")))
+    assert white_pawn.en_passantable is False
+
+    unmake_move(board, undo)
+    assert white_pawn.en_passantable is True
+
+
+def test_board_state_make_and_unmake_switch_turn():
+    board_state = BoardState()
+    board_state.piece_pos = parse_fen(START_FEN)
+    before = snapshot(board_state.piece_pos)
+
+    undo = board_state.make_move(Move(algebraic_to_index("e2"), algebraic_to_index("e4")))
+    assert board_state.player_turn == Color.BLACK
+
+    board_state.unmake_move(undo)
+    assert board_state.player_turn == Color.WHITE
+    assert snapshot(board_state.piece_pos) == before
+
+
+def test_en_passant_capture_removes_the_passed_pawn_and_unmake_restores_it():
+    board = parse_fen("4k3/8/8/3pP3/8/8/8/4K3")
+    board[algebraic_to_index("d5")].en_passantable = True
+    before = snapshot(board)
+
+    undo = make_move(board, Move(algebraic_to_index("e5"), algebraic_to_index("d6")))
+
+    assert board[algebraic_to_index("d6")].piece_type == PieceType.PAWN
+    assert board[algebraic_to_index("d5")].piece_type == PieceType.EMPTY
+    assert undo.en_passant_captured.position == algebraic_to_index("d5")
+
+    unmake_move(board, undo)
+    assert snapshot(board) == before
+
+
+def test_promotion_replaces_the_pawn_and_unmake_restores_it():
+    board = parse_fen("1r2k3/P7/8/8/8/8/8/4K3")
+    before = snapshot(board)
+
+    undo = make_move(board, Move(algebraic_to_index("a7"), algebraic_to_index("b8"), PieceType.KNIGHT))
+
+    knight = board[algebraic_to_index("b8")]
+    assert (knight.color, knight.piece_type, knight.position) == (Color.WHITE, PieceType.KNIGHT, algebraic_to_index("b8"))
+    assert board[algebraic_to_index("a7")].piece_type == PieceType.EMPTY
+
+    unmake_move(board, undo)
+    assert snapshot(board) == before
+
+    make_move(board, Move(algebraic_to_index("a7"), algebraic_to_index("a8")))
+    assert board[algebraic_to_index("a8")].piece_type == PieceType.QUEEN
+
+
+def test_make_move_from_an_empty_square_raises_and_leaves_board_unchanged():
+    board = parse_fen(START_FEN)
+    before = snapshot(board)
+
+    with pytest.raises(ValueError, match="No piece"):
+        make_move(board, Move(algebraic_to_index("e4"), algebraic_to_index("e5")))
+
+    assert snapshot(board) == before
+    assert parse_fen(START_FEN)[algebraic_to_index("e4")].position == algebraic_to_index("e4")
+
+def test_board_state_make_move_from_an_empty_square_keeps_other_boards_intact():
+    board_state = BoardState(parse_fen(START_FEN), Color.WHITE)
+    key = board_state.zobrist_key
+
+    with pytest.raises(ValueError):
+        board_state.make_move(Move(algebraic_to_index("e4"), algebraic_to_index("e5")))
+    with pytest.raises(ValueError):
+        board_state.move_piece(board_state.piece_pos[algebraic_to_index("e4")], algebraic_to_index("e5"))
+
+    assert board_state.zobrist_key == key
+    e4 = parse_fen(START_FEN)[algebraic_to_index("e4")]
+    assert e4.position == algebraic_to_index("e4")
+    assert e4.has_moved is False
@@ -0,0 +1,84 @@
+import random
+
+from chess_2.utils.enums import Color, PieceType
+from chess_2.utils.fen import algebraic_to_index, parse_fen, START_FEN
+from chess_2.board.board_state import BoardState
+from chess_2.board.piece_lists import PieceLists, PIECE_TYPES
+from chess_2.piece_movement.move_generator import get_legal_move_list
+
+KIWIPETE = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+def assert_lists_match_board(board_state):
+    fresh = PieceLists(board_state.piece_pos)
+    for color in (Color.WHITE, Color.BLACK):
+        assert board_state.pieces.king(color) is fresh.king(color)
+        for piece_type in PIECE_TYPES:
+            tracked = board_state.pieces.of_type(color, piece_type)
+            assert {id(piece) for piece in tracked} == {id(piece) for piece in fresh.of_type(color, piece_type)}
+            assert all(board_state.piece_pos[piece.position] is piece for piece in tracked)
+
+
+def test_piece_lists_of_start_position():
+    pieces = PieceLists(parse_fen(START_FEN))
+
+    assert len(pieces) == 32
+    assert pieces.count(Color.WHITE, PieceType.PAWN) == 8
+    assert pieces.count(Color.BLACK, PieceType.KNIGHT) == 2
+    assert pieces.king(Color.BLACK).position == algebraic_to_index("e8")
+    assert [piece.position for piece in pieces.pieces(Color.WHITE)] == sorted(
+        piece.position for piece in pieces.pieces(Color.WHITE)
+    )
+
+
+def test_remove_and_add_piece():
+    board = parse_fen(START_FEN)
+    pieces = PieceLists(board)
+    queen = board[algebraic_to_index("d1")]
+    king = board[algebraic_to_index("e1")]
+
+    pieces.remove(queen)
+    assert pieces.count(Color.WHITE, PieceType.QUEEN) == 0
+    pieces.add(queen)
+    pieces.add(queen)
+    assert pieces.of_type(Color.WHITE, PieceType.QUEEN) == [queen]
+
+    pieces.remove(king)
+    assert pieces.king(Color.WHITE) is None
+
+
+def test_move_piece_and_castling_keep_lists_in_step():
+    board_state = BoardState.from_fen(KIWIPETE)
+
+    # Knight takes pawn, then white castles kingside
+    board_state.move_piece(board_state.piece_pos[algebraic_to_index("e5")], algebraic_to_index("f7"))
+    assert board_state.pieces.count(Color.BLACK, PieceType.PAWN) == 7
+    board_state.move_piece(board_state.piece_pos[algebraic_to_index("e1")], algebraic_to_index("g1"))
+
+    assert board_state.pieces.king(Color.WHITE).position == algebraic_to_index("g1")
+    assert_lists_match_board(board_state)
+
+
+def test_make_and_unmake_keep_lists_in_step():
+    board_state = BoardState.from_fen(KIWIPETE)
+    rng = random.Random(7)
+    undos = []
+
+    for _ in range(40):
+        legal_moves = board_state.get_legal_moves()
+        if not legal_moves:
+            break
+        undos.append(board_state.make_move(rng.choice(legal_moves)))
+        assert_lists_match_board(board_state)
+
+    for undo in reversed(undos):
+        board_state.unmake_move(undo)
+        assert_lists_match_board(board_state)
+
+
+def test_generation_from_piece_lists_matches_board_scan():
+    board_state = BoardState.from_fen(KIWIPETE)
+
+    for color in (Color.WHITE, Color.BLACK):
+        assert (get_legal_move_list(color, board_state.piece_pos, board_state.pieces)
+                == get_legal_move_list(color, board_state.piece_pos))
@@ -0,0 +1,98 @@
+import pytest
+
+from chess_2.utils.enums import Color, GameStatus
+from chess_2.utils.types import Move
+from chess_2.utils.fen import algebraic_to_index, parse_fen, START_FEN
+from chess_2.board.board_state import BoardState
+from chess_2.board.transposition_table import (
+    TranspositionTable,
+    REPLACE_ALWAYS,
+    REPLACE_NEVER,
+    REPLACE_TWO_WAY,
+)
+from chess_2.piece_movement.move_generator import get_legal_move_list
+
+
+def test_probe_counts_hits_and_misses():
+    table = TranspositionTable(size=16)
+    assert table.probe(5) is None
+
+    table.store(5, [], in_check=True)
+    entry = table.probe(5)
+
+    assert entry.status == GameStatus.CHECKMATE
+    assert (table.hits, table.misses, table.stores) == (1, 1, 1)
+    assert table.hit_rate == 0.5
+
+
+def test_size_must_be_power_of_two():
+    with pytest.raises(ValueError):
+        TranspositionTable(size=100)
+    with pytest.raises(ValueError):
+        TranspositionTable(policy="random")
+
+
+@pytest.mark.parametrize("policy, kept", [(REPLACE_ALWAYS, 17), (REPLACE_NEVER, 1)])
+def test_replacement_policy_on_collision(policy, kept):
+    table = TranspositionTable(size=16, policy=policy)
+    table.store(1, [], in_check=False)
+    table.store(17, [], in_check=False)  # Same slot as key 1
+
+    assert len(table) == 1
+    assert table.probe(kept) is not None
+
+
+def test_two_way_policy_replaces_least_recently_used():
+    table = TranspositionTable(size=16, policy=REPLACE_TWO_WAY)
+    table.store(1, [], in_check=False)
+    table.store(17, [], in_check=False)
+    assert table.probe(1) is not None  # Key 1 is now the most recently used
+
+    table.store(33, [], in_check=False)
+
+    assert table.probe(1) is not None
+    assert table.probe(33) is not None
+    assert table.probe(17) is None
+    assert table.replacements == 1
+
+
+def test_table_memory_is_bounded():
+    table = TranspositionTable(size=8)
+    for key in range(100):
+        table.store(key, [], in_check=False)
+
+    assert len(table) == 8
+
+
+def test_board_state_serves_repeated_queries_from_table():
+    board_state = BoardState(parse_fen(START_FEN))
+
+    first = board_state.get_legal_moves()
+    assert board_state.get_game_status() == GameStatus.ONGOING
+    assert board_state.get_legal_moves() == first
+    assert len(first) == 20
+    assert board_state.transposition_table.misses == 1
+    assert board_state.transposition_table.hits == 2
+
+
+def test_board_state_cache_follows_moves():
+    board_state = BoardState(parse_fen(START_FEN))
+    undo = board_state.make_move(Move(algebraic_to_index("e2"), algebraic_to_index("e4")))
+
+    assert board_state.get_legal_moves() == get_legal_move_list(Color.BLACK, board_state.piece_pos)
+
+    board_state.unmake_move(undo)
+    assert len(board_state.get_legal_moves()) == 20
+    assert board_state.transposition_table.misses == 2
+
+
+def test_board_state_reports_checkmate_and_stalemate():
+    mate = BoardState(parse_fen("R5k1/5ppp/8/8/8/8/8/6K1"))
+    mate.player_turn = Color.BLACK
+    assert mate.get_game_status() == GameStatus.CHECKMATE
+    assert mate.check_if_current_player_is_in_checkmate() is True
+
+    stalemate = BoardState(parse_fen("7k/5Q2/6K1/8/8/8/8/8"))
+    stalemate.player_turn = Color.BLACK
+    assert stalemate.get_game_status() == GameStatus.STALEMATE
+    assert stalemate.is_in_check() is False
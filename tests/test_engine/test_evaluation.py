@@ -0,0 +1,80 @@
+import random
+
+from chess_2.utils.enums import Color
+from chess_2.utils.fen import algebraic_to_index, parse_fen, START_FEN
+from chess_2.board.board_state import BoardState
+from chess_2.engine.evaluation import (
+    MAX_PHASE,
+    PieceSquareScore,
+    evaluate_position,
+    king_safety,
+    mobility,
+)
+
+KIWIPETE = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+def assert_scores_match_board(board_state):
+    fresh = PieceSquareScore(board_state.piece_pos)
+    scores = board_state.scores
+    assert (scores.middlegame, scores.endgame, scores.phase) == (fresh.middlegame, fresh.endgame, fresh.phase)
+
+
+def test_start_position_is_balanced():
+    piece_loc = parse_fen(START_FEN)
+    scores = PieceSquareScore(piece_loc)
+
+    assert scores.middlegame == scores.endgame == 0
+    assert scores.game_phase == MAX_PHASE
+    assert evaluate_position(piece_loc, Color.WHITE) == evaluate_position(piece_loc, Color.BLACK) == 0
+
+
+def test_scores_are_tapered_by_phase():
+    # Kings and pawns only: the endgame tables decide, and the advanced pawn is worth more
+    scores = PieceSquareScore(parse_fen("4k3/8/1P6/8/8/8/8/4K3"))
+
+    assert scores.game_phase == 0
+    assert scores.value(Color.WHITE) == scores.endgame > 100
+    assert scores.value(Color.BLACK) == -scores.endgame
+
+
+def test_mobility_and_king_safety():
+    piece_loc = parse_fen("4k3/8/8/8/3N4/8/8/N3K3")
+
+    # A centralised knight reaches 8 squares, one in the corner 2
+    assert mobility(piece_loc, Color.WHITE) == 4 * (8 + 2)
+    assert mobility(piece_loc, Color.BLACK) == 0
+
+    sheltered = parse_fen("6k1/5ppp/8/8/8/8/5PPP/6K1")
+    exposed = parse_fen("6k1/5ppp/8/8/8/8/8/1q4K1")
+    assert king_safety(sheltered, Color.WHITE) > 0
+    assert king_safety(exposed, Color.WHITE) < 0
+    assert king_safety(sheltered, Color.WHITE, phase=0) == 0
+
+
+def test_move_piece_and_castling_update_scores():
+    board_state = BoardState.from_fen(KIWIPETE)
+    board_state.scores  # Build the scores before the moves
+
+    board_state.move_piece(board_state.piece_pos[algebraic_to_index("e5")], algebraic_to_index("f7"))
+    assert_scores_match_board(board_state)
+    board_state.move_piece(board_state.piece_pos[algebraic_to_index("e8")], algebraic_to_index("c8"))
+    assert_scores_match_board(board_state)
+
+
+def test_make_and_unmake_update_scores():
+    board_state = BoardState.from_fen(KIWIPETE)
+    board_state.scores
+    rng = random.Random(3)
+    undos = []
+
+    for _ in range(40):
+        legal_moves = board_state.get_legal_moves()
+        if not legal_moves:
+            break
+        undos.append(board_state.make_move(rng.choice(legal_moves)))
+        assert_scores_match_board(board_state)
+
+    for undo in reversed(undos):
+        board_state.unmake_move(undo)
+        assert_scores_match_board(board_state)
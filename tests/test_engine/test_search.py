@@ -0,0 +1,113 @@
+from chess_2.utils.enums import Color
+from chess_2.utils.types import Move
+from chess_2.utils.fen import algebraic_to_index, parse_fen, START_FEN
+from chess_2.board.board_state import BoardState
+from chess_2.engine.evaluation import evaluate
+from chess_2.engine.search import MATE_SCORE, Searcher, find_best_move
+
+
+def board_from_fen(placement: str, color: Color = Color.WHITE) -> BoardState:
+    board_state = BoardState(parse_fen(placement))
+    board_state.player_turn = color
+    return board_state
+
+
+def move(from_square: str, to_square: str) -> Move:
+    return Move(algebraic_to_index(from_square), algebraic_to_index(to_square))
+
+
+def test_evaluate_is_material_balance():
+    board = parse_fen("4k3/8/8/8/8/8/8/3QK3")
+    assert evaluate(board, Color.WHITE) == 900
+    assert evaluate(board, Color.BLACK) == -900
+
+
+def test_finds_mate_in_one():
+    board_state = board_from_fen("6k1/5ppp/8/8/8/8/8/R5K1")
+    result = find_best_move(board_state, max_depth=3)
+
+    assert result.best_move == move("a1", "a8")
+    assert result.score == MATE_SCORE - 1
+
+
+def test_wins_hanging_queen():
+    board_state = board_from_fen("4k3/8/8/3q4/8/8/3R4/4K3")
+    result = find_best_move(board_state, max_depth=2)
+
+    assert result.best_move == move("d2", "d5")
+
+
+def test_quiescence_avoids_defended_pawn():
+    # Rxd5 takes a pawn but the rook is lost to exd5
+    board_state = board_from_fen("4k3/8/4p3/3p4/8/8/8/3RK3")
+    result = find_best_move(board_state, max_depth=1)
+
+    assert result.best_move != move("d1", "d5")
+
+
+def test_quiescence_does_not_stand_pat_in_check():
+    # Fool's mate: white is mated, whatever the material says
+    board_state = BoardState.from_fen("rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3")
+    assert Searcher(board_state)._quiescence(3, -MATE_SCORE, MATE_SCORE) == -MATE_SCORE + 3
+
+    # In check but not mated, the evasions are searched: Kxd2 wins the queen
+    board_state = BoardState.from_fen("4k3/8/8/8/8/8/3q4/4K3 w - - 0 1")
+    assert Searcher(board_state)._quiescence(0, -MATE_SCORE, MATE_SCORE) > -100
+
+
+def test_board_is_restored_after_search():
+    board_state = board_from_fen(START_FEN)
+    key = board_state.zobrist_key
+
+    find_best_move(board_state, max_depth=2)
+
+    assert board_state.zobrist_key == key
+    assert board_state.player_turn == Color.WHITE
+
+
+def test_reports_nodes_per_iteration():
+    result = find_best_move(board_from_fen(START_FEN), max_depth=2)
+
+    assert [info.depth for info in result.iterations] == [1, 2]
+    assert sum(info.nodes for info in result.iterations) == result.nodes
+    assert all(info.nodes_per_second > 0 for info in result.iterations)
+
+
+def test_node_limit_stops_search_with_a_move():
+    result = find_best_move(board_from_fen(START_FEN), max_depth=10, node_limit=200)
+
+    assert result.nodes <= 200
+    assert result.best_move is not None
+    assert result.depth < 10
+
+
+def test_time_limit_stops_search():
+    result = find_best_move(board_from_fen(START_FEN), time_limit_ms=100)
+
+    assert result.best_move is not None
+    assert result.elapsed < 1.0
+
+
+def test_no_legal_moves_returns_no_move():
+    result = find_best_move(board_from_fen("R5k1/5ppp/8/8/8/8/8/6K1", Color.BLACK), max_depth=2)
+    assert result.best_move is None
+
+
+def test_killers_and_history_recorded():
+    searcher = Searcher(board_from_fen(START_FEN))
+    searcher.search(max_depth=3)
+
+    assert searcher.history
+    assert any(killer is not None for killers in searcher.killers for killer in killers)
+
+
+def test_repetition_is_scored_as_draw():
+    board_state = BoardState.from_fen("7k/1r6/8/8/8/8/8/K7 w - - 0 1")
+    for from_square, to_square in (("a1", "a2"), ("h8", "g8"), ("a2", "a1"), ("g8", "h8")):
+        board_state.make_move(move(from_square, to_square))
+
+    # White's only move, Ka2, repeats a position, so being a rook down no longer matters
+    result = find_best_move(board_state, max_depth=1)
+
+    assert result.best_move == move("a1", "a2")
+    assert result.score == 0
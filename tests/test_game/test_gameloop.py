@@ -0,0 +1,26 @@
+import builtins
+
+import pytest
+
+from chess_2.utils.enums import GameStatus
+from chess_2.game import gameloop
+
+
+def test_run_game_plays_san_and_long_form_until_checkmate(monkeypatch, capsys):
+    moves = iter(["f3", "pe7e5", "Zz9", "g4", "Qh4"])
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(moves))
+
+    assert gameloop.run_game() == GameStatus.CHECKMATE
+    assert "Game over: checkmate" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("opening", [
+    [],
+    ["e4", "e5"],  # The position after a double push repeats too, as en passant is not possible
+])
+def test_run_game_declares_threefold_repetition(monkeypatch, capsys, opening):
+    moves = iter(opening + ["Nf3", "Nf6", "Ng1", "Ng8"] * 2)
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(moves))
+
+    assert gameloop.run_game() == GameStatus.THREEFOLD_REPETITION
+    assert "Game over: threefold repetition" in capsys.readouterr().out
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from chess_2.game.server import GameServer
+
+
+@pytest.fixture
+def server():
+    server = GameServer(workers=4)
+    yield server
+    server.close()
+
+
+def run(server, *lines):
+    async def play():
+        return [await server.handle_line(line) for line in lines]
+    return asyncio.run(play())
+
+
+def test_fools_mate_ends_the_game(server):
+    replies = run(server, "new", "move 1 f3", "move 1 pe7e5", "move 1 g4", "move 1 Qh4", "move 1 a3")
+
+    assert replies == ["ok 1", "ok f3 ongoing", "ok e5 ongoing", "ok g4 ongoing", "ok Qh4# checkmate",
+                       "error Game over: checkmate"]
+    assert server.metrics.games_finished == 1
+
+
+def test_errors_are_replied_and_counted(server):
+    replies = run(server, "new", "move 1 e5", "move 2 e4", "fly 1", "move", "new garbage w - - 0 1",
+                  "new 8/8/8/8/8/8/8/8 w - - 0 1", "new 4k3/8/8/8/8/8/8/4K3 w - - 0 1 extra")
+
+    assert all(reply.startswith("error") for reply in replies[1:])
+    assert replies[2] == "error Unknown game 2"
+    assert "king" in replies[6]
+    assert "six fields" in replies[7]
+    assert server.metrics.errors == 7
+    assert server.metrics.games_started == 1
+    assert run(server, "fen 1") == ["ok rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"]
+
+
+def test_new_game_from_fen_and_engine_move(server):
+    replies = run(server, "new 6k1/5ppp/8/8/8/8/5PPP/R5K1 w - - 0 1", "moves 1", "go 1 200")
+
+    assert "Ra8#" in replies[1].split()
+    assert replies[2] == "ok Ra8# checkmate"
+
+
+def test_concurrent_games_and_metrics(server):
+    async def play_game():
+        game_id = (await server.handle_line("new")).split()[1]
+        for move in ("e4", "e5", "Nf3", "Nc6"):
+            assert (await server.handle_line(f"move {game_id} {move}")).startswith("ok")
+        return game_id
+
+    async def play_games():
+        return await asyncio.gather(*(play_game() for _ in range(50)))
+
+    game_ids = asyncio.run(play_games())
+
+    assert len(set(game_ids)) == 50
+    assert server.active_games == 50
+    assert run(server, f"stats {game_ids[0]}")[0].startswith("ok moves=4 requests=5")
+
+    run(server, f"close {game_ids[0]}")
+    stats = dict(field.split("=") for field in run(server, "stats")[0].split()[1:])
+    assert stats["active"] == "49"
+    assert stats["started"] == "50"
+    assert int(stats["requests"]) == 50 * 5 + 2
+
+
+def test_tcp_connection(server):
+    async def session():
+        listener = await server.serve(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        replies = []
+        for line in ("new", "move 1 Nf3", "quit"):
+            writer.write(line.encode() + b"\n")
+            await writer.drain()
+            replies.append((await reader.readline()).decode().strip())
+
+        writer.close()
+        listener.close()
+        await listener.wait_closed()
+        return replies
+
+    assert asyncio.run(session()) == ["ok 1", "ok Nf3 ongoing", ""]
@@ -0,0 +1,101 @@
+import pytest
+from chess_2.utils.enums import Color
+from chess_2.utils.fen import START_FEN
+from chess_2.board.backends import load_position
+from chess_2.perft import BENCHMARK_SUITE, perft, divide, run_benchmark, run_divide, parallel_divide, main
+
+SUITE = {position.name: position for position in BENCHMARK_SUITE}
+
+
+@pytest.mark.parametrize("depth", [1, 2, 3])
+def test_perft_start_position(depth):
+    board_state = load_position(SUITE["start"].fen)
+    assert perft(board_state, depth) == SUITE["start"].node_counts[depth]
+
+
+@pytest.mark.parametrize("depth", [1, 2, 3])
+def test_perft_rook_pawn_endgame(depth):
+    board_state = load_position(SUITE["rook_pawn_endgame"].fen)
+    assert perft(board_state, depth) == SUITE["rook_pawn_endgame"].node_counts[depth]
+
+
+@pytest.mark.parametrize("name", ["kiwipete", "promotion_endgame", "position_4", "position_5"])
+def test_perft_en_passant_and_promotions(name):
+    board_state = load_position(SUITE[name].fen)
+    assert perft(board_state, 2) == SUITE[name].node_counts[2]
+
+
+def test_perft_kiwipete_castling():
+    board_state = load_position(SUITE["kiwipete"].fen)
+    assert perft(board_state, 1) == SUITE["kiwipete"].node_counts[1]
+
+
+def test_perft_restores_board_state():
+    board_state = load_position(START_FEN)
+    before = {pos: (piece.color, piece.piece_type, piece.has_moved) for pos, piece in board_state.piece_pos.items()}
+
+    perft(board_state, 2)
+
+    after = {pos: (piece.color, piece.piece_type, piece.has_moved) for pos, piece in board_state.piece_pos.items()}
+    assert after == before
+    assert board_state.player_turn == Color.WHITE
+
+
+def test_divide_sums_to_perft():
+    counts = divide(load_position(START_FEN), 2)
+
+    assert len(counts) == 20
+    assert counts["e2e4"] == 20
+    assert sum(counts.values()) == 400
+
+
+def test_load_position_reads_side_to_move():
+    board_state = load_position(SUITE["promotion_endgame"].fen)
+    assert board_state.player_turn == Color.BLACK
+
+
+def test_run_benchmark_reports_nodes_per_second():
+    results = run_benchmark(max_depth=2, positions=[SUITE["start"]])
+
+    assert [result.depth for result in results] == [1, 2]
+    assert all(result.passed for result in results)
+    assert all(result.nodes_per_second > 0 for result in results)
+
+
+def test_main_prints_divide(capsys):
+    assert main(["--depth", "1", "--divide"]) == 0
+    assert "e2e4: 1" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("split_depth", [1, 2])
+def test_parallel_divide_matches_serial_divide(split_depth):
+    kiwipete = SUITE["kiwipete"]
+    result = parallel_divide(kiwipete.fen, 2, workers=2, split_depth=split_depth)
+
+    assert result.counts == run_divide(kiwipete.fen, 2)
+    assert sum(result.counts.values()) == kiwipete.node_counts[2]
+    # One work unit per position at the split depth, whose count is the published perft total
+    assert result.work_units == kiwipete.node_counts[split_depth]
+
+
+def test_parallel_divide_bitboard_backend():
+    result = parallel_divide(BENCHMARK_SUITE[0].fen, 3, workers=2, split_depth=2, backend="bitboard")
+
+    assert result.nodes == 8902
+    assert len(result.counts) == 20
+
+
+def test_parallel_divide_speedup_needs_serial_time():
+    result = parallel_divide(BENCHMARK_SUITE[0].fen, 1, workers=2, split_depth=2)
+
+    assert result.nodes == 20
+    assert result.speedup is None
+    result.serial_seconds = result.seconds * 2
+    assert result.speedup == pytest.approx(2.0)
+
+
+def test_main_parallel_compares_with_serial(capsys):
+    assert main(["--depth", "2", "--workers", "2", "--compare-serial"]) == 0
+    output = capsys.readouterr().out
+    assert "nodes 400" in output
+    assert "speedup" in output
@@ -1,6 +1,8 @@
 import pytest
-from chess_2.piece.piece import Piece
+from chess_2.piece.piece import Piece, empty_square
 from chess_2.utils.enums import Color, PieceType
+from chess_2.utils.types import Position, Move, encode_move, decode_move
+from chess_2.utils.fen import parse_fen, START_FEN
 
 def test_piece_initialization():
     piece = Piece(position=(0, 1), color=Color.WHITE, piece_type=PieceType.KNIGHT)
@@ -21,3 +23,38 @@ def test_piece_repr_black():
 def test_piece_repr_empty():
     piece = Piece(position=(0, 1), color=Color.NONE, piece_type=PieceType.EMPTY)
     assert piece.repr == " "
+
+def test_piece_has_no_instance_dict():
+    piece = Piece(position=(0, 1), color=Color.WHITE, piece_type=PieceType.KNIGHT)
+    assert not hasattr(piece, "__dict__")
+
+def test_empty_square_is_shared():
+    pos = Position(3, 4)
+    assert empty_square(pos) is empty_square(Position(3, 4))
+    assert empty_square(pos).piece_type == PieceType.EMPTY
+    assert empty_square(pos).position == pos
+
+def test_parse_fen_uses_shared_empty_squares():
+    first, second = parse_fen(START_FEN), parse_fen(START_FEN)
+    pos = Position(4, 4)
+    assert first[pos] is second[pos]
+    assert first[Position(0, 0)] is not second[Position(0, 0)]
+
+def test_shared_empty_squares_cannot_be_modified():
+    square = empty_square(Position(3, 4))
+    with pytest.raises(AttributeError):
+        square.position = Position(4, 4)
+    with pytest.raises(AttributeError):
+        square.has_moved = True
+    assert square.position == Position(3, 4)
+    assert square.has_moved is False
+
+def test_shared_empty_square_equals_an_empty_piece():
+    pos = Position(3, 4)
+    assert empty_square(pos) == Piece(position=pos, color=Color.NONE, piece_type=PieceType.EMPTY)
+
+def test_move_encode_decode_round_trip():
+    for move in [Move(Position(6, 4), Position(4, 4)), Move(Position(0, 0), Position(7, 7))]:
+        code = encode_move(move)
+        assert 0 <= code < 4096
+        assert decode_move(code) == move
@@ -0,0 +1,44 @@
+from chess_2.utils.enums import Color
+from chess_2.utils.fen import algebraic_to_index
+from chess_2.piece_movement import lookup_tables
+from chess_2.piece_movement.lookup_tables import (
+    KNIGHT_TARGETS,
+    KING_TARGETS,
+    PAWN_PUSHES,
+    PAWN_CAPTURES,
+    ROOK_RAYS,
+    BISHOP_RAYS,
+    QUEEN_RAYS,
+)
+
+
+def squares(*names):
+    return {algebraic_to_index(name) for name in names}
+
+
+def test_tables_cover_every_square():
+    for table in (KNIGHT_TARGETS, KING_TARGETS, ROOK_RAYS, BISHOP_RAYS, QUEEN_RAYS):
+        assert len(table) == 64
+    assert lookup_tables.BUILD_TIME >= 0
+
+
+def test_step_targets_stay_on_board():
+    assert set(KNIGHT_TARGETS[algebraic_to_index("a1")]) == squares("b3", "c2")
+    assert set(KING_TARGETS[algebraic_to_index("h8")]) == squares("g8", "g7", "h7")
+    assert len(KNIGHT_TARGETS[algebraic_to_index("e4")]) == 8
+
+
+def test_pawn_tables():
+    assert PAWN_PUSHES[Color.WHITE][algebraic_to_index("e2")] == tuple(algebraic_to_index(s) for s in ("e3", "e4"))
+    assert PAWN_PUSHES[Color.BLACK][algebraic_to_index("e6")] == (algebraic_to_index("e5"),)
+    assert PAWN_PUSHES[Color.WHITE][algebraic_to_index("e8")] == ()
+    assert set(PAWN_CAPTURES[Color.BLACK][algebraic_to_index("a7")]) == squares("b6")
+
+
+def test_rays_are_ordered_outward():
+    rays = ROOK_RAYS[algebraic_to_index("a1")]
+    assert len(rays) == 2
+    assert tuple(algebraic_to_index(s) for s in ("a2", "a3", "a4", "a5", "a6", "a7", "a8")) in rays
+
+    assert sum(len(ray) for ray in BISHOP_RAYS[algebraic_to_index("d4")]) == 13
+    assert sum(len(ray) for ray in QUEEN_RAYS[algebraic_to_index("d4")]) == 27
@@ -1,7 +1,7 @@
 import pytest
 from chess_2.utils.fen import algebraic_to_index
 from chess_2.utils.enums import Color, PieceType
-from chess_2.utils.types import Position
+from chess_2.utils.types import Position, Move, encode_move
 from chess_2.utils.fen import algebraic_to_index, parse_fen, START_FEN
 from chess_2.piece.piece import Piece
 from chess_2.piece_movement.move_generator import (
@@ -13,8 +13,15 @@ from chess_2.piece_movement.move_generator import (
     is_queenside_castling_path_under_attack,
     is_king_in_check,
     is_king_in_checkmate,
-    is_king_in_check_after_move
+    is_king_in_check_after_move,
+    get_checks_and_pins,
+    get_legal_captures,
+    get_legal_move_list,
+    iter_legal_moves,
 )
+from chess_2.board.board_state import BoardState
+from chess_2.board.move_execution import make_move, unmake_move
+import chess_2.piece_movement.move_generator as move_generator
 
 from ..helpers import place_king
 
@@ -48,6 +55,47 @@ def test_is_square_not_under_attack_when_no_enemies():
     board = generate_empty_board()
     assert is_square_under_attack(Position(3, 3), Color.WHITE, board) is False
 
+def test_pawn_push_square_is_not_under_attack():
+    board = generate_empty_board()
+    pawn_pos = algebraic_to_index('e7')
+    board[pawn_pos] = Piece(position=pawn_pos, color=Color.BLACK, piece_type=PieceType.PAWN)
+
+    assert is_square_under_attack(algebraic_to_index('e6'), Color.WHITE, board) is False
+    assert is_square_under_attack(algebraic_to_index('d6'), Color.WHITE, board) is True
+    assert is_square_under_attack(algebraic_to_index('f6'), Color.WHITE, board) is True
+
+def test_white_pawn_attacks_upwards():
+    board = generate_empty_board()
+    pawn_pos = algebraic_to_index('e2')
+    board[pawn_pos] = Piece(position=pawn_pos, color=Color.WHITE, piece_type=PieceType.PAWN)
+
+    assert is_square_under_attack(algebraic_to_index('d3'), Color.BLACK, board) is True
+    assert is_square_under_attack(algebraic_to_index('d1'), Color.BLACK, board) is False
+
+def test_slider_attack_is_blocked():
+    board = generate_empty_board()
+    bishop_pos = algebraic_to_index('a8')
+    board[bishop_pos] = Piece(position=bishop_pos, color=Color.BLACK, piece_type=PieceType.BISHOP)
+    blocker_pos = algebraic_to_index('c6')
+    board[blocker_pos] = Piece(position=blocker_pos, color=Color.WHITE, piece_type=PieceType.KNIGHT)
+
+    assert is_square_under_attack(algebraic_to_index('b7'), Color.WHITE, board) is True
+    assert is_square_under_attack(algebraic_to_index('c6'), Color.WHITE, board) is True
+    assert is_square_under_attack(algebraic_to_index('d5'), Color.WHITE, board) is False
+
+def test_castling_path_under_attack_when_king_in_check():
+    board = generate_empty_board()
+    rook_pos = algebraic_to_index('e8')
+    board[rook_pos] = Piece(position=rook_pos, color=Color.BLACK, piece_type=PieceType.ROOK)
+
+    assert is_kingside_castling_path_under_attack(Color.WHITE, board) is True
+    assert is_queenside_castling_path_under_attack(Color.WHITE, board) is True
+
+def test_castling_both_sides_does_not_recurse():
+    piece_loc = parse_fen("r3k2r/8/8/8/8/8/8/R3K2R")
+
+    assert len(get_all_valid_moves(Color.WHITE, piece_loc)) == 3  # king and both rooks
+
 def test_white_kingside_castling_path_under_attack_f_file():
     board = generate_empty_board()
     rook_pos = algebraic_to_index('f8')
@@ -228,4 +276,124 @@ def test_has_valid_moves():
 
     piece_loc = parse_fen(START_FEN)
 
-    assert has_valid_moves(color=Color.WHITE, piece_loc = piece_loc)==True
\ No newline at end of file
+    assert has_valid_moves(color=Color.WHITE, piece_loc = piece_loc)==True
+
+
+def as_move_set(all_moves):
+    return {(piece.position, dest) for piece, destinations in all_moves for dest in destinations}
+
+def test_get_checks_and_pins_finds_pin_ray():
+    board = generate_empty_board()
+    king = Piece(position=algebraic_to_index("e1"), color=Color.WHITE, piece_type=PieceType.KING)
+    board[king.position] = king
+    bishop_pos = algebraic_to_index("e2")
+    board[bishop_pos] = Piece(position=bishop_pos, color=Color.WHITE, piece_type=PieceType.BISHOP)
+    board[algebraic_to_index("e5")] = Piece(position=algebraic_to_index("e5"), color=Color.BLACK, piece_type=PieceType.ROOK)
+
+    checks, pins = get_checks_and_pins(king, board)
+
+    assert checks == []
+    assert pins == {bishop_pos: {algebraic_to_index(square) for square in ("e2", "e3", "e4", "e5")}}
+    assert not any(piece.position == bishop_pos for piece, _ in get_all_valid_moves(Color.WHITE, board))
+
+def test_get_checks_and_pins_finds_block_squares():
+    board = generate_empty_board()
+    king = Piece(position=algebraic_to_index("a1"), color=Color.WHITE, piece_type=PieceType.KING)
+    board[king.position] = king
+    board[algebraic_to_index("d4")] = Piece(position=algebraic_to_index("d4"), color=Color.BLACK, piece_type=PieceType.BISHOP)
+    board[algebraic_to_index("b3")] = Piece(position=algebraic_to_index("b3"), color=Color.BLACK, piece_type=PieceType.KNIGHT)
+
+    checks, pins = get_checks_and_pins(king, board)
+
+    assert {algebraic_to_index("b3")} in checks
+    assert {algebraic_to_index(square) for square in ("b2", "c3", "d4")} in checks
+    assert pins == {}
+
+def test_only_king_moves_in_double_check():
+    board = generate_empty_board()
+    place_king(board, Color.WHITE, pos="e1")
+    board[algebraic_to_index("e8")] = Piece(position=algebraic_to_index("e8"), color=Color.BLACK, piece_type=PieceType.ROOK)
+    board[algebraic_to_index("d3")] = Piece(position=algebraic_to_index("d3"), color=Color.BLACK, piece_type=PieceType.KNIGHT)
+    board[algebraic_to_index("a5")] = Piece(position=algebraic_to_index("a5"), color=Color.WHITE, piece_type=PieceType.QUEEN)
+
+    all_moves = get_all_valid_moves(Color.WHITE, board)
+
+    assert [piece.piece_type for piece, _ in all_moves] == [PieceType.KING]
+    assert as_move_set(all_moves) == as_move_set(get_all_valid_moves(Color.WHITE, board, simulate=True))
+
+@pytest.mark.parametrize("fen", [
+    START_FEN,
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R",
+    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8",
+    "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1",
+    "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R",
+])
+def test_pin_aware_moves_match_simulation_two_plies_deep(fen):
+    board = parse_fen(fen)
+    moves = get_all_valid_moves(Color.WHITE, board)
+    assert as_move_set(moves) == as_move_set(get_all_valid_moves(Color.WHITE, board, simulate=True))
+
+    for piece, destinations in moves:
+        for dest in destinations:
+            undo = make_move(board, Move(piece.position, dest))
+            replies = get_all_valid_moves(Color.BLACK, board)
+            assert as_move_set(replies) == as_move_set(get_all_valid_moves(Color.BLACK, board, simulate=True))
+            unmake_move(board, undo)
+
+
+@pytest.mark.parametrize("fen", [
+    START_FEN,
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R",
+    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8",
+    "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1",
+])
+def test_iter_legal_moves_matches_move_list(fen):
+    board = parse_fen(fen)
+    for color in (Color.WHITE, Color.BLACK):
+        assert sorted(iter_legal_moves(color, board), key=encode_move) == sorted(get_legal_move_list(color, board), key=encode_move)
+
+@pytest.mark.parametrize("fen", [
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+    "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+    "4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 2",
+    "4k3/8/8/8/8/8/3q4/4K3 w - - 0 1",
+])
+def test_legal_captures_match_filtered_move_list(fen):
+    board_state = BoardState.from_fen(fen)
+    piece_loc = board_state.piece_pos
+
+    def is_tactical(move):
+        piece = piece_loc[move.from_pos]
+        return (piece_loc[move.to_pos].piece_type != PieceType.EMPTY or move.promotion is not None
+                or (piece.piece_type == PieceType.PAWN and move.from_pos.col != move.to_pos.col))
+
+    expected = [move for move in get_legal_move_list(board_state.player_turn, piece_loc) if is_tactical(move)]
+    assert (sorted(get_legal_captures(board_state.player_turn, piece_loc), key=encode_move)
+            == sorted(expected, key=encode_move))
+
+def test_iter_legal_moves_yields_king_moves_after_other_pieces():
+    board = parse_fen(START_FEN)
+    board[algebraic_to_index("f1")] = Piece(algebraic_to_index("f1"), Color.NONE, PieceType.EMPTY)
+    board[algebraic_to_index("e2")] = Piece(algebraic_to_index("e2"), Color.NONE, PieceType.EMPTY)
+
+    moves = list(iter_legal_moves(Color.WHITE, board))
+    king_moves = [move for move in moves if move.from_pos == algebraic_to_index("e1")]
+
+    assert king_moves == moves[-len(king_moves):]
+    assert algebraic_to_index("f1") in {move.to_pos for move in king_moves}
+
+def test_iter_legal_moves_for_one_piece():
+    board = parse_fen(START_FEN)
+    moves = list(iter_legal_moves(Color.WHITE, board, from_pos=algebraic_to_index("g1")))
+
+    assert {move.to_pos for move in moves} == {algebraic_to_index("f3"), algebraic_to_index("h3")}
+    assert list(iter_legal_moves(Color.WHITE, board, from_pos=algebraic_to_index("d1"))) == []
+
+def test_iter_legal_moves_stops_early(monkeypatch):
+    generated = []
+    get_piece_movement = move_generator.get_piece_movement
+    monkeypatch.setattr(move_generator, "get_piece_movement",
+                        lambda piece: generated.append(piece) or get_piece_movement(piece))
+
+    assert has_valid_moves(Color.WHITE, parse_fen(START_FEN))
+    assert len(generated) == 1
@@ -42,6 +42,23 @@ def test_white_pawn_capture():
     assert opp_piece_1_pos in potential_moves
     assert opp_piece_2_pos in potential_moves
 
+def test_white_pawn_en_passant():
+    board = generate_empty_board()
+
+    pos = algebraic_to_index('e5')
+    passed_pos = algebraic_to_index('d5')
+    other_pos = algebraic_to_index('f5')
+
+    board[pos] = Piece(position=pos, color=Color.WHITE, piece_type=PieceType.PAWN)
+    board[passed_pos] = Piece(position=passed_pos, color=Color.BLACK, piece_type=PieceType.PAWN, en_passantable=True)
+    board[other_pos] = Piece(position=other_pos, color=Color.BLACK, piece_type=PieceType.PAWN)
+
+    movement = PawnMovement(board[pos])
+    potential_moves = movement.get_potential_moves(board)
+
+    assert algebraic_to_index('d6') in potential_moves
+    assert algebraic_to_index('f6') not in potential_moves  # f5 did not just advance two squares
+
 def test_black_pawn_forward_moves():
     board = generate_empty_board()
 
@@ -0,0 +1,128 @@
+import io
+import time
+
+import pytest
+
+from chess_2.utils.enums import PieceType
+from chess_2.uci import UciEngine, main, move_to_uci, score_to_uci, search_time_ms, uci_to_move
+
+
+@pytest.fixture
+def engine():
+    lines = []
+    engine = UciEngine(lines.append)
+    engine.output = lines
+    yield engine
+    engine.stop()
+
+
+def test_move_notation_round_trip():
+    assert move_to_uci(uci_to_move("g1f3")) == "g1f3"
+    assert move_to_uci(None) == "0000"
+    assert uci_to_move("e7e8n").promotion == PieceType.KNIGHT
+    assert move_to_uci(uci_to_move("e7e8q")) == "e7e8q"
+    with pytest.raises(ValueError):
+        uci_to_move("z9e4")
+    with pytest.raises(ValueError):
+        uci_to_move("e7e8k")
+
+
+def test_score_and_time_management():
+    assert score_to_uci(35) == "cp 35"
+    assert score_to_uci(100_000 - 3) == "mate 2"
+    assert score_to_uci(-100_000 + 2) == "mate -1"
+
+    assert search_time_ms({"movetime": 250}, True) == 250
+    assert search_time_ms({"wtime": 60_000, "btime": 1_000, "winc": 1_000}, True) == 2_500
+    assert search_time_ms({"wtime": 60_000, "btime": 1_000, "movestogo": 1}, False) == 950
+    assert search_time_ms({}, True) is None
+
+
+def test_position_updates_incrementally(engine):
+    engine.handle("position startpos moves e2e4 e7e5")
+    board_state = engine.board_state
+    undos = list(engine._undos)
+
+    # Extending the line keeps the same board and the moves already made
+    engine.handle("position startpos moves e2e4 e7e5 g1f3")
+    assert engine.board_state is board_state
+    assert engine._undos[:2] == undos
+
+    # Changing the last moves unmakes back to where the lines part
+    engine.handle("position startpos moves e2e4 c7c5")
+    assert engine.board_state.to_fen() == "rnbqkbnr/pp1ppppp/8/2p5/4P3/8/PPPP1PPP/RNBQKBNR w KQkq c6 0 2"
+
+    engine.handle("position fen 6k1/5ppp/8/8/8/8/5PPP/R5K1 w - - 0 1")
+    assert engine.board_state.to_fen() == "6k1/5ppp/8/8/8/8/5PPP/R5K1 w - - 0 1"
+
+
+def test_illegal_move_is_reported(engine):
+    engine.handle("position startpos moves e2e5")
+    assert engine.output == ["info string Illegal move e2e5"]
+
+
+def test_malformed_fen_is_reported_and_keeps_the_position(engine):
+    engine.handle("position startpos moves e2e4")
+    fen = engine.board_state.to_fen()
+
+    assert engine.handle("position fen garbage w - - 0 1")
+    assert engine.output[-1].startswith("info string")
+    assert engine.board_state.to_fen() == fen
+
+    engine.handle("isready")
+    assert engine.output[-1] == "readyok"
+
+
+def test_go_depth_finds_mate(engine):
+    engine.handle("position fen 6k1/5ppp/8/8/8/8/5PPP/R5K1 w - - 0 1")
+    engine.handle("go depth 2")
+    engine.stop()
+
+    assert engine.output[-1] == "bestmove a1a8"
+    assert "score mate 1" in engine.output[-2]
+
+
+def test_stop_and_isready_answer_during_infinite_search(engine):
+    engine.handle("position startpos")
+    engine.handle("go infinite")
+    time.sleep(0.05)
+
+    start = time.perf_counter()
+    engine.handle("isready")
+    assert engine.output[-1] == "readyok"
+    engine.handle("stop")
+    assert time.perf_counter() - start < 0.5
+    assert engine.output[-1].startswith("bestmove ")
+    assert engine.board_state.to_fen() == "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+
+def test_infinite_search_holds_bestmove_until_stop(engine):
+    # Mate in one ends the search almost at once
+    engine.handle("position fen 7k/5Q2/6K1/8/8/8/8/8 w - - 0 1")
+    engine.handle("go infinite")
+    time.sleep(0.3)
+    assert not any(line.startswith("bestmove") for line in engine.output)
+
+    engine.handle("stop")
+    assert engine.output[-1] == "bestmove f7f8"
+
+
+def test_ponder_search_answers_after_ponderhit(engine):
+    engine.handle("position fen 7k/5Q2/6K1/8/8/8/8/8 w - - 0 1")
+    engine.handle("go ponder wtime 2000 btime 2000")
+    time.sleep(0.3)
+    assert not any(line.startswith("bestmove") for line in engine.output)
+
+    engine.handle("ponderhit")
+    deadline = time.perf_counter() + 2
+    while not engine.output[-1].startswith("bestmove") and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    assert engine.output[-1] == "bestmove f7f8"
+
+
+def test_main_reads_commands_until_quit(capsys):
+    assert main([], io.StringIO("uci\nisready\nposition startpos moves e2e4\ngo movetime 50\nquit\n")) == 0
+
+    out = capsys.readouterr().out.splitlines()
+    assert out[:4] == ["id name chess_2", "id author chess_2 developers", "uciok", "readyok"]
+    assert out[-1].startswith("bestmove ")
@@ -1,5 +1,5 @@
 import pytest
-from chess_2.utils.fen import parse_fen, START_FEN, parse_user_input, algebraic_to_index, index_to_algebraic
+from chess_2.utils.fen import parse_fen, parse_full_fen, to_fen, START_FEN, parse_user_input, algebraic_to_index, index_to_algebraic
 from chess_2.utils.enums import PieceType, Color
 from chess_2.utils.types import Position
 from chess_2.piece.piece import Piece
@@ -22,7 +22,7 @@ def test_parse_fen_full():
 
 # Test 2: FEN with a row of empty squares
 def test_parse_fen_empty_row():
-    fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/"
+    fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/8"
     board = parse_fen(fen)
 
     # Check that row 2 is filled with empty pieces
@@ -51,7 +51,7 @@ def test_parse_fen_pawn_row():
 
 # Test 5: Edge case for one empty square (digit value '1')
 def test_parse_fen_one_empty_square():
-    fen = "r1bqkbnr"
+    fen = "r1bqkbnr/8/8/8/8/8/8/8"
     board = parse_fen(fen)
 
     # Check that there is 1 empty square at the second column (index 1)
@@ -117,3 +117,93 @@ def test_index_to_algebraic():
     assert index_to_algebraic(Position(row=0, col=0)) == "a8"
     assert index_to_algebraic(Position(row=7, col=7)) == "h1"
     assert index_to_algebraic(Position(row=3, col=3)) == "d5"
+
+
+# Full FEN parsing and serialization
+
+@pytest.mark.parametrize("fen", [
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+    "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1",
+    "rnbqkbnr/pp1ppppp/8/2p5/4P3/8/PPPP1PPP/RNBQKBNR w KQkq c6 0 2",
+    "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+    "r3k2r/8/8/8/8/8/8/R3K2R w Kq - 12 40",
+    "8/8/8/8/8/8/8/4K2k b - - 99 120",
+])
+def test_full_fen_round_trip(fen):
+    piece_loc, player_turn, halfmove_clock, fullmove_number = parse_full_fen(fen)
+    assert to_fen(piece_loc, player_turn, halfmove_clock, fullmove_number) == fen
+
+def test_parse_fen_ignores_extra_fields():
+    assert parse_fen(START_FEN + " w KQkq - 0 1") == parse_fen(START_FEN)
+
+def test_full_fen_castling_rights_set_has_moved():
+    piece_loc, _, _, _ = parse_full_fen("r3k2r/8/8/8/8/8/8/R3K2R w Kq - 0 1")
+
+    assert piece_loc[algebraic_to_index("e1")].has_moved is False
+    assert piece_loc[algebraic_to_index("h1")].has_moved is False
+    assert piece_loc[algebraic_to_index("a1")].has_moved is True
+    assert piece_loc[algebraic_to_index("h8")].has_moved is True
+    assert piece_loc[algebraic_to_index("a8")].has_moved is False
+
+def test_full_fen_no_castling_marks_king_moved():
+    piece_loc, _, _, _ = parse_full_fen("r3k2r/8/8/8/8/8/8/R3K2R w - - 0 1")
+    assert piece_loc[algebraic_to_index("e1")].has_moved is True
+    assert piece_loc[algebraic_to_index("e8")].has_moved is True
+
+def test_full_fen_en_passant_marks_pawn():
+    piece_loc, player_turn, _, _ = parse_full_fen("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1")
+
+    assert player_turn == Color.BLACK
+    assert piece_loc[algebraic_to_index("e4")].en_passantable is True
+
+@pytest.mark.parametrize("fen", [
+    START_FEN + " x KQkq - 0 1",
+    START_FEN + " w KQxq - 0 1",
+    START_FEN + " w KQkq e9 0 1",
+    START_FEN + " w KQkq e6 0 1",
+    START_FEN + " w KQkq - zero 1",
+    START_FEN + " w KQkq - -3 1",
+    START_FEN + " w KQkq - 0 0",
+    START_FEN + " w KQkq - 0 1 extra",
+    "4k3/8/8/3pP3/8/8/8/4K3 w - d3 0 1",
+    "4k3/8/8/3pP3/8/8/8/4K3 w - d66 0 1",
+    "4k3/8/8/8/8/8/8/4K3 w KQkq - 0 1",
+    "r3k2r/8/8/8/8/8/8/4K3 w Q - 0 1",
+    "r3k2r/8/8/8/8/8/8/R2K3R w Kkq - 0 1",
+])
+def test_full_fen_rejects_malformed_fields(fen):
+    with pytest.raises(ValueError):
+        parse_full_fen(fen)
+
+@pytest.mark.parametrize("fen", [
+    "",
+    "8/8/8/8 w - - 0 1",
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR/8",
+    "rnbqkbnrr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR",
+    "rnbqkbnr/ppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR",
+    "rnbqkbnr/pppppppp/9/8/8/8/PPPPPPPP/RNBQKBNR",
+    "rnbqkbnr/pppppppp/80/8/8/8/PPPPPPPP/RNBQKBNR",
+    "rnbqkbnr/ppppxppp/8/8/8/8/PPPPPPPP/RNBQKBNR",
+])
+def test_parse_fen_rejects_malformed_placement(fen):
+    with pytest.raises(ValueError, match="in FEN"):
+        parse_fen(fen)
+
+@pytest.mark.parametrize("fen", [
+    "8/8/8/8/8/8/8/8 w - - 0 1",
+    "4k3/8/8/8/8/8/8/8 w - - 0 1",
+    "4k3/8/8/8/8/8/8/3KK3 w - - 0 1",
+    "4kk2/8/8/8/8/8/8/4K3 w - - 0 1",
+])
+def test_full_fen_rejects_missing_or_extra_kings(fen):
+    with pytest.raises(ValueError, match="king"):
+        parse_full_fen(fen)
+
+def test_full_fen_placement_only_defaults():
+    _, player_turn, halfmove_clock, fullmove_number = parse_full_fen(START_FEN)
+    assert (player_turn, halfmove_clock, fullmove_number) == (Color.WHITE, 0, 1)
+
+def test_full_fen_round_trips_a_valid_en_passant_square():
+    fen = "4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1"
+    piece_loc, player_turn, halfmove_clock, fullmove_number = parse_full_fen(fen)
+    assert to_fen(piece_loc, player_turn, halfmove_clock, fullmove_number) == fen
@@ -0,0 +1,119 @@
+import io
+
+import pytest
+
+from chess_2.utils.enums import PieceType
+from chess_2.utils.fen import algebraic_to_index
+from chess_2.utils.input_validation import IllegalMove
+from chess_2.utils.pgn import (
+    PgnGame,
+    read_games,
+    replay_game,
+    read_game_moves,
+    write_game,
+    board_state_to_game,
+    generate_random_games,
+)
+
+SAMPLE_PGN = """[Event "Casual game"]
+[White "Anderssen, Adolf"]
+[Black "Kieseritzky, Lionel"]
+[Result "1-0"]
+
+1. e4 e5 2. f4 exf4 3. Bc4 Qh4+ {Black's queen check} 4. Kf1 b5 5. Bxb5 Nf6
+6. Nf3 Qh6 7. d3 Nh5 (7... Bc5 8. d4 (8. c3)) 8. Nh4 $1 Qg5 9. Nf5 c6 1-0
+
+[Event "Short"]
+[Result "0-1"]
+
+1.f3 e5 2.g4?? Qh4# 0-1
+
+[Event "Setup"]
+[SetUp "1"]
+[FEN "4k3/8/8/8/8/8/8/R3K3 b Q - 0 30"]
+
+30... Kd7 31. O-O-O+ *
+"""
+
+
+def test_read_games_parses_headers_moves_and_result():
+    games = list(read_games(io.StringIO(SAMPLE_PGN)))
+
+    assert len(games) == 3
+    assert games[0].headers["White"] == "Anderssen, Adolf"
+    assert games[0].moves[:6] == ["e4", "e5", "f4", "exf4", "Bc4", "Qh4+"]
+    assert games[0].moves[-4:] == ["Nh4", "Qg5", "Nf5", "c6"]
+    assert games[0].result == "1-0"
+    assert games[1].moves == ["f3", "e5", "g4??", "Qh4#"]
+    assert games[2].starting_fen == "4k3/8/8/8/8/8/8/R3K3 b Q - 0 30"
+
+
+def test_read_games_is_lazy():
+    lines = iter(SAMPLE_PGN.splitlines(keepends=True))
+    first = next(read_games(lines))
+
+    assert first.headers["Event"] == "Casual game"
+    assert next(lines).startswith('[Result "0-1"]')  # Only the next game's first header was consumed
+
+
+def test_replay_game_resolves_moves():
+    game = list(read_games(io.StringIO(SAMPLE_PGN)))[1]
+    positions = [board_state.to_fen() for _, board_state in replay_game(game)]
+
+    assert positions[-1] == "rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3"
+
+
+def test_replay_game_from_fen_with_castling():
+    game = list(read_games(io.StringIO(SAMPLE_PGN)))[2]
+    *_, (last_move, board_state) = replay_game(game)
+
+    assert last_move.to_pos == algebraic_to_index("c1")
+    assert board_state.piece_pos[algebraic_to_index("d1")].piece_type == PieceType.ROOK
+
+
+def test_read_game_moves_yields_move_lists():
+    move_lists = list(read_game_moves(io.StringIO(SAMPLE_PGN)))
+    assert [len(moves) for moves in move_lists] == [18, 4, 2]
+
+
+def test_read_game_moves_skips_and_reports_unresolvable_games():
+    bad_game = '[Event "Bad"]\n\n1. e4 e5 2. Ke3 *\n\n[Event "Bad setup"]\n[FEN "8/8/8/8 w - - 0 1"]\n\n1. Kd2 *\n\n'
+    skipped = []
+
+    move_lists = list(read_game_moves(io.StringIO(bad_game + SAMPLE_PGN),
+                                      on_error=lambda game, e: skipped.append((game.headers["Event"], type(e)))))
+
+    assert [len(moves) for moves in move_lists] == [18, 4, 2]
+    assert skipped == [("Bad", IllegalMove), ("Bad setup", ValueError)]
+
+
+def test_replay_game_rejects_illegal_move():
+    game = PgnGame(moves=["e4", "e4"])
+    with pytest.raises(IllegalMove):
+        list(replay_game(game))
+
+
+def test_write_then_read_round_trip():
+    out = io.StringIO()
+    for game in read_games(io.StringIO(SAMPLE_PGN)):
+        write_game(game, out)
+
+    games = list(read_games(io.StringIO(out.getvalue())))
+    original = list(read_games(io.StringIO(SAMPLE_PGN)))
+    assert [(g.moves, g.result, g.starting_fen) for g in games] == [(g.moves, g.result, g.starting_fen) for g in original]
+    assert "30... Kd7 31. O-O-O+ *" in out.getvalue()
+    assert '[Site "?"]' in out.getvalue()
+
+
+def test_board_state_to_game_exports_move_history():
+    game = list(read_games(io.StringIO(SAMPLE_PGN)))[1]
+    *_, (_, board_state) = replay_game(game)
+
+    out = io.StringIO()
+    write_game(board_state_to_game(board_state, {"Event": "Export"}, result="0-1"), out)
+    assert "1. f3 e5 2. g4?? Qh4# 0-1" in out.getvalue()
+
+
+def test_generated_games_replay():
+    for game in generate_random_games(3, max_plies=30, seed=7):
+        assert len(list(replay_game(game))) == len(game.moves)
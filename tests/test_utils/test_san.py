@@ -0,0 +1,96 @@
+import pytest
+
+from chess_2.utils.enums import PieceType
+from chess_2.utils.types import Move
+from chess_2.utils.fen import START_FEN, algebraic_to_index
+from chess_2.utils.input_validation import InvalidNotation, IllegalMove
+from chess_2.utils.san import san_to_move, move_to_san, legal_moves_to_san, moves_to_san, san_to_moves
+from chess_2.board.board_state import BoardState
+
+KIWIPETE = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+FOOLS_MATE = ["f3", "e5", "g4", "Qh4#"]
+
+
+def move(from_square: str, to_square: str) -> Move:
+    return Move(algebraic_to_index(from_square), algebraic_to_index(to_square))
+
+
+@pytest.mark.parametrize("san, expected", [
+    ("d6", move("d5", "d6")),
+    ("dxe6", move("d5", "e6")),
+    ("Nxf7", move("e5", "f7")),
+    ("Qxh3", move("f3", "h3")),
+    ("O-O", move("e1", "g1")),
+    ("O-O-O", move("e1", "c1")),
+    ("Bxa6!?", move("e2", "a6")),
+])
+def test_san_to_move(san, expected):
+    assert san_to_move(BoardState.from_fen(KIWIPETE), san) == expected
+
+
+def test_san_to_move_errors():
+    board_state = BoardState.from_fen(KIWIPETE)
+    with pytest.raises(InvalidNotation):
+        san_to_move(board_state, "Zz9")
+    with pytest.raises(IllegalMove):
+        san_to_move(board_state, "Nf6")
+
+
+def test_move_to_san_round_trips_every_legal_move():
+    board_state = BoardState.from_fen(KIWIPETE)
+    legal_moves = board_state.get_legal_moves()
+
+    for legal_move in legal_moves:
+        assert san_to_move(board_state, move_to_san(board_state, legal_move, legal_moves), legal_moves) == legal_move
+
+
+@pytest.mark.parametrize("fen, from_square, to_square, expected", [
+    ("7k/8/8/R7/8/8/8/R6K w - - 0 1", "a1", "a3", "R1a3"),
+    ("7k/8/8/R7/8/8/8/R6K w - - 0 1", "a5", "a3", "R5a3"),
+    ("7k/8/8/8/8/8/8/1N3N1K w - - 0 1", "b1", "d2", "Nbd2"),
+    ("7k/8/8/8/8/8/8/R6K w - - 0 1", "a1", "a8", "Ra8+"),
+])
+def test_move_to_san_disambiguation_and_suffix(fen, from_square, to_square, expected):
+    assert move_to_san(BoardState.from_fen(fen), move(from_square, to_square)) == expected
+
+
+def test_promotion_and_en_passant_san():
+    board_state = BoardState.from_fen("1r2k3/P7/8/8/8/8/8/4K3 w - - 0 1")
+    underpromotion = Move(algebraic_to_index("a7"), algebraic_to_index("b8"), PieceType.KNIGHT)
+
+    assert move_to_san(board_state, underpromotion) == "axb8=N"
+    assert san_to_move(board_state, "axb8=N") == underpromotion
+    assert san_to_move(board_state, "a8") == Move(algebraic_to_index("a7"), algebraic_to_index("a8"), PieceType.QUEEN)
+    assert len(legal_moves_to_san(board_state)) == len(set(legal_moves_to_san(board_state).values()))
+
+    board_state = BoardState.from_fen("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 2")
+    assert san_to_move(board_state, "exd6") == move("e5", "d6")
+
+
+def test_legal_moves_to_san_matches_move_to_san():
+    board_state = BoardState.from_fen(KIWIPETE)
+    sans = legal_moves_to_san(board_state)
+
+    assert set(sans) == set(board_state.get_legal_moves())
+    for legal_move, san in sans.items():
+        assert san == move_to_san(board_state, legal_move)
+
+
+def test_moves_to_san_round_trips_a_game_and_restores_the_board():
+    board_state = BoardState.from_fen(START_FEN)
+    fen = board_state.to_fen()
+
+    moves = san_to_moves(board_state, FOOLS_MATE)
+    assert board_state.to_fen() == fen
+
+    assert moves_to_san(board_state, moves) == FOOLS_MATE
+    assert board_state.to_fen() == fen
+
+
+def test_moves_to_san_rejects_illegal_moves():
+    board_state = BoardState.from_fen(START_FEN)
+    fen = board_state.to_fen()
+
+    with pytest.raises(IllegalMove):
+        moves_to_san(board_state, [move("e2", "e4"), move("e4", "e5")])
+    assert board_state.to_fen() == fen
@@ -0,0 +1,86 @@
+from chess_2.utils.enums import Color
+from chess_2.utils.types import Move
+from chess_2.utils.fen import algebraic_to_index, parse_fen, START_FEN
+from chess_2.utils.move_validation import get_castling_rights
+from chess_2.utils.zobrist import compute_zobrist_key
+from chess_2.board.board_state import BoardState
+from chess_2.piece_movement.move_generator import get_legal_move_list
+
+
+def move(from_square: str, to_square: str) -> Move:
+    return Move(algebraic_to_index(from_square), algebraic_to_index(to_square))
+
+
+def test_castling_rights_read_from_has_moved_flags():
+    board = parse_fen(START_FEN)
+    assert get_castling_rights(board) == "KQkq"
+
+    board[algebraic_to_index("h1")].has_moved = True
+    board[algebraic_to_index("e8")].has_moved = True
+    assert get_castling_rights(board) == "Q"
+
+
+def test_side_to_move_changes_key():
+    board = parse_fen(START_FEN)
+    assert compute_zobrist_key(board, Color.WHITE) != compute_zobrist_key(board, Color.BLACK)
+
+
+def test_board_state_key_computed_on_assignment():
+    board_state = BoardState()
+    board_state.piece_pos = parse_fen(START_FEN)
+    assert board_state.zobrist_key == compute_zobrist_key(parse_fen(START_FEN), Color.WHITE)
+
+    board_state.player_turn = Color.BLACK
+    assert board_state.zobrist_key == compute_zobrist_key(board_state.piece_pos, Color.BLACK)
+
+
+def test_make_move_updates_key_incrementally():
+    board_state = BoardState(parse_fen("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R"))
+    start_key = board_state.zobrist_key
+
+    for _ in range(2):
+        for legal_move in get_legal_move_list(board_state.player_turn, board_state.piece_pos):
+            undo = board_state.make_move(legal_move)
+            assert board_state.zobrist_key == compute_zobrist_key(board_state.piece_pos, board_state.player_turn)
+            board_state.unmake_move(undo)
+            assert board_state.zobrist_key == start_key
+
+        board_state.switch_player_turn()
+        start_key = board_state.zobrist_key
+
+
+def test_move_piece_updates_key_incrementally():
+    board_state = BoardState(parse_fen("r3k2r/8/8/8/8/8/8/R3K2R"))
+
+    king = board_state.piece_pos[algebraic_to_index("e1")]
+    board_state.move_piece(king, algebraic_to_index("g1"))
+    board_state.switch_player_turn()
+
+    assert get_castling_rights(board_state.piece_pos) == "kq"
+    assert board_state.zobrist_key == compute_zobrist_key(board_state.piece_pos, Color.BLACK)
+
+
+def test_transposition_gives_same_key():
+    first = BoardState(parse_fen(START_FEN))
+    for from_square, to_square in [("g1", "f3"), ("g8", "f6"), ("b1", "c3")]:
+        first.make_move(move(from_square, to_square))
+
+    second = BoardState(parse_fen(START_FEN))
+    for from_square, to_square in [("b1", "c3"), ("g8", "f6"), ("g1", "f3")]:
+        second.make_move(move(from_square, to_square))
+
+    assert first.zobrist_key == second.zobrist_key
+
+
+def test_double_push_sets_en_passant_key():
+    with_double_push = BoardState(parse_fen("rnbqkbnr/ppp1pppp/8/8/3p4/8/PPPPPPPP/RNBQKBNR"))
+    with_double_push.make_move(move("e2", "e4"))
+
+    assert with_double_push.zobrist_key != compute_zobrist_key(parse_fen("rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR"), Color.BLACK)
+
+
+def test_double_push_without_a_capturing_pawn_sets_no_en_passant_key():
+    with_double_push = BoardState(parse_fen(START_FEN))
+    with_double_push.make_move(move("e2", "e4"))
+
+    assert with_double_push.zobrist_key == compute_zobrist_key(parse_fen("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR"), Color.BLACK)